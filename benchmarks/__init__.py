@@ -0,0 +1,15 @@
+# file: benchmarks/__init__.py
+
+"""
+Typerdantic benchmark suite.
+
+Run from the project root:
+
+    python -m benchmarks                          # run everything
+    python -m benchmarks --sizes 10,1000 --only render,refresh
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline results.json  # fail on regressions
+
+The standalone scripts bench_menu_items.py and bench_import_time.py cover
+MenuItem construction and import-time budgets.
+"""
@@ -0,0 +1,125 @@
+# file: benchmarks/__main__.py
+
+"""
+Runs the benchmark suite, writes machine-readable JSON results and
+optionally compares them against a baseline file.
+
+Exits with status 1 if any result regressed by more than the tolerance, or
+if the soak run's RSS grew by more than --max-rss-growth-mb.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from .suite import BENCHMARKS, Measurement, run
+
+
+def compare(
+    results: List[Measurement], baseline: List[Measurement], tolerance: float
+) -> List[str]:
+    """Returns a description of every result that regressed past `tolerance`."""
+    previous: Dict[str, Measurement] = {entry["name"]: entry for entry in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get(result["name"])
+        if not before or not before["value"]:
+            continue
+        change = (result["value"] - before["value"]) / before["value"]
+        result["baseline"] = before["value"]
+        result["change"] = change
+        worse = -change if result["higher_is_better"] else change
+        if worse > tolerance:
+            regressions.append(
+                f"{result['name']}: {before['value']:.4g} -> {result['value']:.4g} "
+                f"{result['unit']} ({change:+.1%})"
+            )
+    return regressions
+
+
+def print_table(results: List[Measurement]):
+    for result in results:
+        line = f"{result['name']:<44} {result['value']:>14,.3f} {result['unit']:<10}"
+        if "change" in result:
+            line += f" ({result['change']:+.1%} vs baseline)"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        "--sizes",
+        default="10,1000,100000",
+        help="Comma-separated synthetic menu sizes (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--only",
+        default=",".join(BENCHMARKS),
+        help="Comma-separated benchmarks to run (default: all).",
+    )
+    parser.add_argument("--output", type=Path, help="Write JSON results here.")
+    parser.add_argument("--baseline", type=Path, help="Compare with this JSON file.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression vs. baseline (default: %(default)s).",
+    )
+    parser.add_argument("--soak-seconds", type=float, default=10.0)
+    parser.add_argument("--max-rss-growth-mb", type=float, default=20.0)
+    options = parser.parse_args()
+
+    names = [name.strip() for name in options.only.split(",") if name.strip()]
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(unknown)}")
+    sizes = [int(size) for size in options.sizes.split(",")]
+
+    print(f"--- Typerdantic benchmarks ({', '.join(names)}; sizes {sizes}) ---")
+    results = run(names, sizes, options.soak_seconds)
+
+    failures = []
+    if options.baseline:
+        baseline = json.loads(options.baseline.read_text())["results"]
+        failures.extend(compare(results, baseline, options.tolerance))
+    for result in results:
+        if (
+            result["name"] == "soak.rss_growth_mb"
+            and result["value"] > options.max_rss_growth_mb
+        ):
+            failures.append(
+                f"soak.rss_growth_mb: {result['value']:.1f} MB "
+                f"(limit {options.max_rss_growth_mb} MB)"
+            )
+
+    print_table(results)
+
+    if options.output:
+        document = {
+            "meta": {
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "sizes": sizes,
+            },
+            "results": results,
+        }
+        options.output.write_text(json.dumps(document, indent=2))
+        print(f"\nResults written to {options.output}")
+
+    if failures:
+        print("\n❌ Performance regressions:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ Benchmarks completed without regressions.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# file: benchmarks/bench_import_time.py
+
+"""
+Import-time budget check for the typerdantic package.
+
+Each module is imported in a fresh interpreter with `python -X importtime`,
+and the cumulative import time of the module is compared against its budget.
+The budgets are scaled up on machines where the interpreter itself starts
+more slowly than on the reference machine: `python -c pass` is measured the
+same way first. The check also verifies that light entry points do not drag
+in the prompt_toolkit application stack.
+
+Usage:
+    python benchmarks/bench_import_time.py [--runs N] [--scale FACTOR]
+
+Exits with status 1 if any module exceeds its budget.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+project_root = Path(__file__).parent.parent
+
+# Budgets in milliseconds (median cumulative import time) on the reference
+# machine. They are deliberately generous, about three times what the modules
+# take there, so that only real regressions trip them; use --scale to loosen
+# them further.
+IMPORT_BUDGETS_MS: Dict[str, float] = {
+    "typerdantic": 40.0,
+    "typerdantic.registry": 40.0,
+    "typerdantic.attach": 100.0,
+    "typerdantic.config_models": 400.0,
+    "typerdantic.loaders": 600.0,
+    "typerdantic.app": 900.0,
+}
+
+# Modules that must not be imported as a side effect of importing the key.
+FORBIDDEN_IMPORTS: Dict[str, List[str]] = {
+    "typerdantic": ["pydantic", "prompt_toolkit"],
+    "typerdantic.registry": ["pydantic", "prompt_toolkit"],
+    "typerdantic.attach": ["pydantic", "prompt_toolkit"],
+    "typerdantic.config_models": ["prompt_toolkit"],
+    "typerdantic.loaders": ["prompt_toolkit"],
+}
+
+# Median import time of `site` (what `python -c pass` imports) on the
+# reference machine, in milliseconds.
+REFERENCE_STARTUP_MS = 4.5
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure_import(module: Optional[str]) -> Dict[str, int]:
+    """
+    Imports `module` in a fresh interpreter (or runs `pass`, if None) and
+    returns the cumulative import time, in microseconds, of every module it
+    loaded.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [str(project_root / "src"), env.get("PYTHONPATH")])
+    )
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "pass" if module is None else f"import {module}",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    timings: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            timings[match.group(4)] = int(match.group(2))
+    return timings
+
+
+def machine_scale(runs: int) -> float:
+    """
+    How much slower than the reference machine this one starts Python,
+    measured from `python -c pass`. Never below 1, so budgets only grow.
+    """
+    samples = [measure_import(None).get("site", 0) / 1000 for _ in range(runs)]
+    return max(1.0, statistics.median(samples) / REFERENCE_STARTUP_MS)
+
+
+def check_module(module: str, runs: int, scale: float) -> Optional[str]:
+    """Returns an error message if `module` breaks its budget, else None."""
+    samples = []
+    loaded: Dict[str, int] = {}
+    for _ in range(runs):
+        loaded = measure_import(module)
+        samples.append(loaded.get(module, 0) / 1000)
+
+    median_ms = statistics.median(samples)
+    budget_ms = IMPORT_BUDGETS_MS[module] * scale
+    status = "ok" if median_ms <= budget_ms else "OVER BUDGET"
+    print(f"{module:<28} {median_ms:>8.1f} ms  (budget {budget_ms:.0f} ms)  {status}")
+
+    forbidden = [
+        name
+        for name in FORBIDDEN_IMPORTS.get(module, [])
+        if any(m == name or m.startswith(name + ".") for m in loaded)
+    ]
+    if forbidden:
+        return f"{module} imports {', '.join(forbidden)}"
+    if median_ms > budget_ms:
+        return f"{module} took {median_ms:.1f} ms (budget {budget_ms:.0f} ms)"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiply every budget by FACTOR."
+    )
+    options = parser.parse_args()
+
+    baseline = machine_scale(options.runs)
+    scale = options.scale * baseline
+    print(f"--- Import-time budget (median of {options.runs} runs) ---")
+    print(f"Interpreter startup: {baseline:.2f}x the reference machine")
+    errors = [
+        error
+        for module in IMPORT_BUDGETS_MS
+        if (error := check_module(module, options.runs, scale))
+    ]
+
+    if errors:
+        print("\n❌ Import-time budget exceeded:")
+        for error in errors:
+            print(f"  - {error}")
+        sys.exit(1)
+    print("\n✅ All modules are within their import-time budget.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# file: benchmarks/bench_menu_items.py
+
+"""
+Microbenchmark for the MenuItem construction paths.
+
+Compares items/sec for:
+  - MenuItem(...)            full per-item validation
+  - MenuItem.trusted(...)    fast path for trusted get_items data
+  - validate_menu_items(...) batch validation for untrusted input
+  - validate_menu_items(b"[...]") batch validation straight from JSON
+
+Usage:
+    python benchmarks/bench_menu_items.py [--count N] [--repeat R]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.models import ArgumentSpec, MenuItem, validate_menu_items
+
+
+def _noop_action(context: dict, args: dict):
+    pass
+
+
+def _best_rate(func, count: int, repeat: int) -> float:
+    """Runs `func` `repeat` times and returns the best items/sec."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+    count = options.count
+
+    spec = {"name": "host", "prompt": "Enter host", "default": "localhost"}
+    raw = [
+        {"description": f"Item {i}", "action": _noop_action, "prompt_args": [spec]}
+        for i in range(count)
+    ]
+    trusted_spec = [ArgumentSpec(**spec)]
+    json_payload = json.dumps(
+        [{"description": f"Item {i}", "prompt_args": [spec]} for i in range(count)]
+    ).encode()
+
+    paths = {
+        "MenuItem(...)": lambda: [MenuItem(**data) for data in raw],
+        "MenuItem.trusted(...)": lambda: [
+            MenuItem.trusted(
+                description=data["description"],
+                action=data["action"],
+                prompt_args=trusted_spec,
+            )
+            for data in raw
+        ],
+        "validate_menu_items(list)": lambda: validate_menu_items(raw),
+        "validate_menu_items(json)": lambda: validate_menu_items(json_payload),
+    }
+
+    print(f"--- MenuItem construction ({count} items, best of {options.repeat}) ---")
+    for label, func in paths.items():
+        rate = _best_rate(func, count, options.repeat)
+        print(f"{label:<28} {rate:>12,.0f} items/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# file: benchmarks/harness.py
+
+"""Helpers for driving TyperdanticApp headlessly in benchmarks."""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Tuple, Type
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.models import MenuItem
+
+# VT100 sequences for the keys the benchmarks press.
+KEYS: Dict[str, str] = {
+    "up": "\x1b[A",
+    "down": "\x1b[B",
+    "enter": "\r",
+    "quit": "q",
+}
+
+
+def noop_action(context: dict, args: dict):
+    pass
+
+
+def synthetic_menu(size: int, name: str = "SyntheticMenu") -> Type[TyperdanticMenu]:
+    """Returns a dynamic menu class whose get_items builds `size` items."""
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        return [
+            (f"item_{i}", MenuItem.trusted(description=f"Item {i}", action=noop_action))
+            for i in range(size)
+        ]
+
+    return type(
+        name, (TyperdanticMenu,), {"__doc__": f"{size} items", "get_items": get_items}
+    )
+
+
+class HeadlessApp:
+    """A running TyperdanticApp fed from a pipe and rendering to DummyOutput."""
+
+    def __init__(self, app: TyperdanticApp, pipe_input):
+        self.app = app
+        self.pipe_input = pipe_input
+        self.renders = 0
+        self._rendered = asyncio.Event()
+        app.application.after_render += self._on_render
+
+    def _on_render(self, _sender):
+        self.renders += 1
+        self._rendered.set()
+
+    async def wait_for_render(self, timeout: float = 5.0):
+        await asyncio.wait_for(self._rendered.wait(), timeout)
+        self._rendered.clear()
+
+    async def press(self, key: str):
+        """Sends `key` and waits until the resulting frame was rendered."""
+        self._rendered.clear()
+        self.pipe_input.send_text(KEYS.get(key, key))
+        await self.wait_for_render()
+
+
+@asynccontextmanager
+async def headless_app(
+    menu_class: Type[TyperdanticMenu], **app_kwargs
+) -> AsyncIterator[HeadlessApp]:
+    """Starts `menu_class` in a headless app and stops it on exit."""
+    with create_pipe_input() as pipe_input:
+        app = TyperdanticApp(
+            main_menu=menu_class, input=pipe_input, output=DummyOutput(), **app_kwargs
+        )
+        driver = HeadlessApp(app, pipe_input)
+        task = asyncio.ensure_future(app.run())
+        await driver.wait_for_render()
+        try:
+            yield driver
+        finally:
+            if not task.done():
+                app.application.exit()
+            await task
+
+
+def timed_rate(func: Callable[[], None], count: int, repeat: int = 3) -> float:
+    """Runs `func` `repeat` times and returns the best `count`/second."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return count / best
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if len(samples) < 2:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[int(q * 100) - 1]
+
+
+def rss_bytes() -> int:
+    """Returns the current resident set size of this process."""
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    # Fallback: peak RSS (KiB on Linux, bytes on macOS).
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
@@ -0,0 +1,218 @@
+# file: benchmarks/suite.py
+
+"""The benchmarks run by `python -m benchmarks`."""
+
+import asyncio
+import contextlib
+import io
+import math
+import time
+from typing import Any, Dict, List
+
+from .harness import (
+    headless_app,
+    noop_action,
+    percentile,
+    rss_bytes,
+    synthetic_menu,
+    timed_rate,
+)
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.config_models import MenuConfig
+from typerdantic.executors import execute_action_string, run_command
+from typerdantic.loaders import create_menu_from_config
+from typerdantic.registry import _ACTION_REGISTRY, register_action
+
+Measurement = Dict[str, Any]
+
+# Menus in the synthetic config tree hold at most this many items each.
+CONFIG_TREE_FAN_OUT = 100
+
+
+def measurement(
+    name: str, value: float, unit: str, higher_is_better: bool = True
+) -> Measurement:
+    return {
+        "name": name,
+        "value": value,
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+    }
+
+
+async def bench_render(size: int, keys: int = 200) -> List[Measurement]:
+    """Keypress-to-render latency and throughput, pressing 'down' `keys` times."""
+    async with headless_app(synthetic_menu(size)) as driver:
+        latencies = []
+        start = time.perf_counter()
+        for _ in range(keys):
+            pressed = time.perf_counter()
+            await driver.press("down")
+            latencies.append(time.perf_counter() - pressed)
+        elapsed = time.perf_counter() - start
+
+    return [
+        measurement(f"render.keypress_throughput[n={size}]", keys / elapsed, "keys/s"),
+        measurement(
+            f"render.keypress_p50[n={size}]",
+            percentile(latencies, 0.5) * 1000,
+            "ms",
+            higher_is_better=False,
+        ),
+        measurement(
+            f"render.keypress_p99[n={size}]",
+            percentile(latencies, 0.99) * 1000,
+            "ms",
+            higher_is_better=False,
+        ),
+    ]
+
+
+async def bench_refresh(size: int) -> List[Measurement]:
+    """Throughput of refresh_items() on a dynamic menu of `size` items."""
+    app = TyperdanticApp(main_menu=synthetic_menu(size))
+    rate = timed_rate(app.active_menu.refresh_items, 1, repeat=5)
+    return [
+        measurement(f"refresh.items_per_sec[n={size}]", rate * size, "items/s"),
+    ]
+
+
+async def bench_config_tree(size: int) -> List[Measurement]:
+    """create_menu_from_config over a tree of menus holding `size` items total."""
+    menu_count = math.ceil(size / CONFIG_TREE_FAN_OUT)
+    configs = []
+    for m in range(menu_count):
+        items: Dict[str, Any] = {}
+        for i in range(min(CONFIG_TREE_FAN_OUT, size - m * CONFIG_TREE_FAN_OUT)):
+            items[f"item_{i}"] = {
+                "description": f"Menu {m} item {i}",
+                "action": {
+                    "type": "command",
+                    "value": "echo {name}",
+                    "prompt_args": [{"name": "name", "prompt": "Name"}],
+                },
+            }
+        if m + 1 < menu_count:
+            items["next"] = {"description": "Next", "target_menu": f"menu_{m + 1}"}
+        configs.append(MenuConfig.model_validate({"doc": f"Menu {m}", "items": items}))
+
+    start = time.perf_counter()
+    for m, config in enumerate(configs):
+        create_menu_from_config(f"Menu{m}", config)
+    elapsed = time.perf_counter() - start
+
+    return [
+        measurement(f"config_tree.items_per_sec[n={size}]", size / elapsed, "items/s")
+    ]
+
+
+async def bench_dispatch(calls: int = 5000) -> List[Measurement]:
+    """Overhead of execute_action_string dispatching to an internal action."""
+    if "bench_noop" not in _ACTION_REGISTRY:
+        register_action("bench_noop")(noop_action)
+
+    async def dispatch_all():
+        for _ in range(calls):
+            await execute_action_string("internal::bench_noop", context={}, args={})
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        await dispatch_all()
+        elapsed = time.perf_counter() - start
+
+    return [
+        measurement("dispatch.internal_calls_per_sec", calls / elapsed, "calls/s"),
+        measurement(
+            "dispatch.internal_call_us",
+            elapsed / calls * 1e6,
+            "us",
+            higher_is_better=False,
+        ),
+    ]
+
+
+async def bench_subprocess(launches: int = 50) -> List[Measurement]:
+    """Throughput of run_command() launching a trivial shell command."""
+    start = time.perf_counter()
+    for _ in range(launches):
+        await run_command("exit 0")
+    elapsed = time.perf_counter() - start
+    return [
+        measurement("subprocess.launches_per_sec", launches / elapsed, "launches/s")
+    ]
+
+
+async def bench_soak(seconds: float = 10.0, size: int = 1000) -> List[Measurement]:
+    """
+    Navigates, renders and refreshes in a loop for `seconds` and reports how
+    much the resident set grew after warm-up. A flat RSS shows no leaks.
+    """
+    main_menu = synthetic_menu(size, "SoakMain")
+    async with headless_app(main_menu) as driver:
+        driver.app.register_menu("sub", synthetic_menu(size, "SoakSub"))
+
+        async def cycle():
+            await driver.press("down")
+            driver.app.navigate_to("sub")
+            await driver.press("down")
+            driver.app.active_menu.refresh_items()
+            driver.app.go_back()
+            await driver.press("up")
+
+        warmup_until = time.perf_counter() + min(2.0, seconds / 5)
+        while time.perf_counter() < warmup_until:
+            await cycle()
+
+        baseline_rss = peak_rss = rss_bytes()
+        cycles = 0
+        stop_at = time.perf_counter() + seconds
+        while time.perf_counter() < stop_at:
+            await cycle()
+            cycles += 1
+            if cycles % 50 == 0:
+                peak_rss = max(peak_rss, rss_bytes())
+        final_rss = rss_bytes()
+
+    return [
+        measurement("soak.cycles_per_sec", cycles / seconds, "cycles/s"),
+        measurement(
+            "soak.rss_growth_mb",
+            (max(peak_rss, final_rss) - baseline_rss) / 2**20,
+            "MB",
+            higher_is_better=False,
+        ),
+    ]
+
+
+# name -> (benchmark, whether it runs once per menu size)
+BENCHMARKS = {
+    "render": (bench_render, True),
+    "refresh": (bench_refresh, True),
+    "config_tree": (bench_config_tree, True),
+    "dispatch": (bench_dispatch, False),
+    "subprocess": (bench_subprocess, False),
+    "soak": (bench_soak, False),
+}
+
+
+async def run_suite(
+    names: List[str], sizes: List[int], soak_seconds: float
+) -> List[Measurement]:
+    results: List[Measurement] = []
+    for name in names:
+        bench, sized = BENCHMARKS[name]
+        if sized:
+            for size in sizes:
+                results.extend(await bench(size))
+        elif name == "soak":
+            results.extend(await bench(soak_seconds))
+        else:
+            results.extend(await bench())
+        for result in results:
+            result.setdefault("benchmark", name)
+    return results
+
+
+def run(names: List[str], sizes: List[int], soak_seconds: float) -> List[Measurement]:
+    return asyncio.run(run_suite(names, sizes, soak_seconds))
@@ -1,6 +1,7 @@
 # file: examples/dynamic_task_runner.py
 
 import asyncio
+import functools
 import json
 from pathlib import Path
 from typing import List, Tuple
@@ -13,6 +14,8 @@ sys.path.insert(0, str(project_root))
 
 
 from typerdantic import TyperdanticApp, TyperdanticMenu, MenuItem
+from typerdantic.executors import execute_action_string
+from typerdantic.models import validate_menu_items
 from typerdantic.registry import register_action
 
 
@@ -57,13 +60,22 @@ class TaskRunnerMenu(TyperdanticMenu):
             with open(tasks_file, "r") as f:
                 data = json.load(f)
 
-            for i, task in enumerate(data.get("tasks", [])):
-                # Create a MenuItem for each task defined in the JSON file.
-                menu_item = MenuItem(
-                    description=task.get("description", "No description"),
-                    action=task.get("action"),
-                    prompt_args=task.get("prompt_args"),
-                )
+            tasks = data.get("tasks", [])
+            # tasks.json is untrusted input, so validate every task in a single
+            # batch instead of paying for a MenuItem(...) validation per task.
+            menu_items = validate_menu_items(
+                {
+                    "description": task.get("description", "No description"),
+                    "action": (
+                        functools.partial(execute_action_string, task["action"])
+                        if task.get("action")
+                        else None
+                    ),
+                    "prompt_args": task.get("prompt_args"),
+                }
+                for task in tasks
+            )
+            for i, (task, menu_item) in enumerate(zip(tasks, menu_items)):
                 # Use the task name and index for a unique key.
                 items.append((f"task_{i}_{task.get('name')}", menu_item))
 
@@ -2,14 +2,48 @@
 
 """
 Typerdantic: Declarative, interactive CLI menus.
+
+The public names below are imported lazily on first access, so that
+`import typerdantic` (or importing a light submodule such as
+`typerdantic.registry` or `typerdantic.config_models`) does not pay for the
+prompt_toolkit application stack.
 """
 
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 __version__ = "0.5.0"
 
-from .models import MenuItem
-from .base import TyperdanticMenu
-from .app import TyperdanticApp
-from .styles import load_style_from_file
+if TYPE_CHECKING:
+    from .models import MenuItem
+    from .base import TyperdanticMenu
+    from .app import TyperdanticApp
+    from .styles import ThemeManager, load_style_from_file
+    from .loaders import create_menu_from_config
+
+# Maps each public name to the submodule that defines it.
+_LAZY_ATTRIBUTES = {
+    "MenuItem": ".models",
+    "TyperdanticMenu": ".base",
+    "TyperdanticApp": ".app",
+    "load_style_from_file": ".styles",
+    "ThemeManager": ".styles",
+    "create_menu_from_config": ".loaders",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache the attribute so later lookups bypass __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRIBUTES))
 
 
 __all__ = [
@@ -17,5 +51,6 @@ __all__ = [
     "TyperdanticMenu",
     "TyperdanticApp",
     "load_style_from_file",
-    "create_menu_from_dict",
+    "ThemeManager",
+    "create_menu_from_config",
 ]
@@ -1,92 +1,560 @@
 # src/typerdantic/app.py
 
 import asyncio
-from typing import Dict, Type, Optional
+import contextlib
+import time
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Type,
+    Optional,
+    Union,
+)
 
 from prompt_toolkit.application import Application
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.input import Input
 from prompt_toolkit.key_binding import KeyBindings
-from prompt_toolkit.layout.containers import Window
+from prompt_toolkit.layout.containers import (
+    ConditionalContainer,
+    Float,
+    FloatContainer,
+    HSplit,
+    Window,
+)
 from prompt_toolkit.layout.controls import FormattedTextControl
 from prompt_toolkit.layout.layout import Layout
-from prompt_toolkit.styles import Style
+from prompt_toolkit.layout.menus import CompletionsMenu
+from prompt_toolkit.output import Output
+from prompt_toolkit.styles import DynamicStyle, Style
 from prompt_toolkit.shortcuts import PromptSession
 
-from .base import TyperdanticMenu
+from .base import TyperdanticMenu, format_menu_ref, parse_menu_ref
+from .cache import AppCache
+from .capture import capture_output, routed_stdout
+from .executors import call_action
+from .forms import ArgumentForm
+from .metrics import Metrics, set_active_metrics
 from .models import MenuItem
-from .styles import DEFAULT_STYLE
+from .palette import CommandIndex, CommandPalette
+from .pause import CONTINUE_PROMPT, PausePanel
+from .prefetch import MenuPrefetcher
+from .profiling import Profiler
+from .progress import ProgressHandle, render_progress
+from .selection import FilterBar
+from .styles import DEFAULT_STYLE, ThemeManager
+
+if TYPE_CHECKING:
+    from .completion import ArgumentCompleter
+    from .history import RunHistory
+    from .session import MenuState, SessionStore
 
 
 class TyperdanticApp:
     """
     A top-level application controller that manages and navigates between menus.
+
+    Pass a `Metrics` instance to record render, navigation, action and
+    event-loop timings; press F12 to toggle a debug overlay showing them.
+    Pass `profile_dir` to `run()` to profile the session (F9 toggles
+    profiling of the active menu). `input` and `output` override the
+    terminal, e.g. with a pipe input and DummyOutput to drive the app
+    headlessly.
+
+    Actions receive a ProgressHandle in `context["progress"]`; while an
+    action reports progress, a progress bar is shown below the menu. Data
+    shared by menus can be memoized in `cache` (see `typerdantic.cache`).
+    Pass a MenuPrefetcher to build the highlighted item's target menu in the
+    background before it is selected (see `typerdantic.prefetch`). Ctrl-P
+    opens a palette searching the items of every registered menu (see
+    `typerdantic.palette`). Items can be filtered with `/`, marked with
+    Space, and the marked ones run at once with `x` (see `typerdantic.bulk`).
+    Pass a RunHistory to record every action run (see `typerdantic.history`),
+    and a SessionStore to resume where the last session left off (see
+    `typerdantic.session`). While the app runs, items' `prompt_args` are
+    asked in a form over the menu (see `typerdantic.forms`). `style` may be
+    a ThemeManager, whose themes can be switched while the app runs (see
+    `switch_theme`).
     """
 
-    def __init__(self, main_menu: Type[TyperdanticMenu], style: Optional[Style] = None):
+    # How often the event-loop lag probe wakes up, in seconds.
+    loop_lag_interval: float = 0.25
+    # How often the progress bar is redrawn while an action reports progress.
+    progress_refresh_interval: float = 0.1
+    # How many marked items run at once when they are run together.
+    bulk_concurrency: int = 8
+
+    def __init__(
+        self,
+        main_menu: Type[TyperdanticMenu],
+        style: Optional[Union[Style, ThemeManager]] = None,
+        metrics: Optional[Metrics] = None,
+        input: Optional[Input] = None,
+        output: Optional[Output] = None,
+        cache: Optional[AppCache] = None,
+        prefetcher: Optional[MenuPrefetcher] = None,
+        history: Optional["RunHistory"] = None,
+        session: Optional["SessionStore"] = None,
+    ):
         self.menu_registry: Dict[str, Type[TyperdanticMenu]] = {"main": main_menu}
-        self.style = style or DEFAULT_STYLE
+        # With a ThemeManager, the style follows its current theme.
+        self.theme: Optional[ThemeManager] = None
+        if isinstance(style, ThemeManager):
+            self.theme = style
+            style = style.style
+        self.style: Style = style or DEFAULT_STYLE
+        self.metrics = metrics
+        self.cache = cache if cache is not None else AppCache()
+        self.prefetcher = prefetcher
+        if prefetcher is not None:
+            prefetcher.bind(self)
+        self.history = history
+        if history is not None and "history" not in self.menu_registry:
+            from .history import HistoryMenu
 
-        self.nav_stack: list[TyperdanticMenu] = [main_menu(app=self)]
+            self.menu_registry["history"] = HistoryMenu
+        self.session = session
+        # Restored menus below the top one, built when they are shown again.
+        self._deferred_menus: List["MenuState"] = []
+        self._session_restored = False
+        self.input = input
+        self.output = output
+        self.show_metrics_overlay = False
+        self.profiler: Optional[Profiler] = None
+        self.progress: Optional[ProgressHandle] = None
+        self._keypress_started: Optional[float] = None
+        self._event_handlers: Dict[str, List[Callable[..., None]]] = {}
+
+        # Data invalidation clock: each invalidation gets a new version, and
+        # menus remember the version they were last refreshed at.
+        self.data_version = 0
+        self._invalidated_at: Dict[str, int] = {}
+        self._all_invalidated_at = 0
+
+        with self._timed("typerdantic_navigate_seconds", menu="main"):
+            self.nav_stack: list[TyperdanticMenu] = [main_menu(app=self)]
         self.active_menu: TyperdanticMenu = self.nav_stack[0]
 
-        self.layout = Layout(
-            Window(FormattedTextControl(self._get_current_fragments, focusable=True))
-        )
+        self.command_index = CommandIndex(self.menu_registry)
+        self.layout = self._build_layout()
         self.key_bindings = self._build_keybindings()
-        self.application: Application = Application(
-            layout=self.layout,
-            key_bindings=self.key_bindings,
-            full_screen=True,
-            style=self.style,
+        self._application: Optional[Application] = None
+        self._prompt_session: Optional[PromptSession] = None
+
+    @property
+    def application(self) -> Application:
+        """
+        The prompt_toolkit Application, created on first use so that headless
+        callers (such as the generated CLI) never negotiate with the terminal.
+        """
+        if self._application is None:
+            self._application = Application(
+                layout=self.layout,
+                key_bindings=self.key_bindings,
+                full_screen=True,
+                # Looked up on every render, so the style can change while
+                # the app runs (see `switch_theme`).
+                style=DynamicStyle(self._current_style),
+                input=self.input,
+                output=self.output,
+            )
+            if self.metrics:
+                key_processor = self._application.key_processor
+                key_processor.before_key_press += self._on_key_press
+                self._application.after_render += self._on_after_render
+        return self._application
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the full-screen application is running."""
+        return self._application is not None and self._application.is_running
+
+    # --- Styles and themes ---
+
+    def _current_style(self) -> Style:
+        return self.theme.style if self.theme is not None else self.style
+
+    def _redraw(self):
+        """Redraws the screen if the app is showing."""
+        if self._application is not None:
+            self._application.invalidate()
+
+    def set_style(self, style: Union[Style, ThemeManager]):
+        """Replaces the style (or theme manager) of the running app."""
+        if isinstance(style, ThemeManager):
+            self.theme = style
+        else:
+            self.theme = None
+            self.style = style
+        self._redraw()
+
+    def switch_theme(self, name: Optional[str]):
+        """
+        Switches to the theme `name` of the ThemeManager (None for no theme,
+        leaving the default, site and user layers).
+
+        Raises:
+            RuntimeError: If the app was not given a ThemeManager.
+            KeyError: If there is no theme of that name.
+        """
+        if self.theme is None:
+            raise RuntimeError("switch_theme requires a ThemeManager style.")
+        self.theme.switch(name)
+        self._redraw()
+
+    def reload_theme(self) -> bool:
+        """
+        Applies changes to the theme files. Returns whether the style changed.
+        """
+        if self.theme is None or not self.theme.reload():
+            return False
+        self._redraw()
+        return True
+
+    def _timed(self, name: str, **labels):
+        """Times a block into `name` when metrics are enabled."""
+        if self.metrics:
+            return self.metrics.time(name, **labels)
+        return contextlib.nullcontext()
+
+    def _profiled(self, phase: str, detail: Optional[str] = None):
+        """Profiles a block of the active menu when profiling is enabled."""
+        if not self.profiler:
+            return contextlib.nullcontext()
+        menu = type(self.active_menu).__name__
+        label = f"{menu}.{phase}" + (f".{detail}" if detail else "")
+        return self.profiler.section(label, menu=menu)
+
+    def _on_key_press(self, _sender):
+        if self._keypress_started is None:
+            self._keypress_started = time.perf_counter()
+
+    def _on_after_render(self, _sender):
+        if self._keypress_started is not None:
+            self.metrics.observe(
+                "typerdantic_keypress_to_frame_seconds",
+                time.perf_counter() - self._keypress_started,
+            )
+            self._keypress_started = None
+
+    async def _measure_loop_lag(self):
+        """Records how late the event loop wakes up a periodic sleeper."""
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self.loop_lag_interval
+            await asyncio.sleep(self.loop_lag_interval)
+            self.metrics.observe(
+                "typerdantic_loop_lag_seconds", max(0.0, loop.time() - expected)
+            )
+
+    def _build_layout(self) -> Layout:
+        menu_window = self._menu_window = Window(
+            FormattedTextControl(self._get_current_fragments, focusable=True)
+        )
+        self.palette = CommandPalette(self)
+        self.filter_bar = FilterBar(self)
+        self.form = ArgumentForm(self)
+        self.pause_panel = PausePanel(self)
+        metrics_overlay = ConditionalContainer(
+            Window(
+                FormattedTextControl(self._get_metrics_fragments),
+                style="class:debug-overlay",
+                height=8,
+            ),
+            filter=Condition(lambda: self.show_metrics_overlay),
+        )
+        progress_bar = ConditionalContainer(
+            Window(
+                FormattedTextControl(self._get_progress_fragments),
+                style="class:progress",
+                height=1,
+            ),
+            filter=Condition(self._progress_visible),
+        )
+        return Layout(
+            FloatContainer(
+                HSplit(
+                    [
+                        menu_window,
+                        self.filter_bar.container,
+                        progress_bar,
+                        metrics_overlay,
+                    ]
+                ),
+                floats=[
+                    Float(self.palette.container, top=1, left=2, right=2),
+                    Float(self.form.container, left=4, right=4),
+                    Float(self.pause_panel.container, left=4, right=4),
+                    Float(
+                        CompletionsMenu(max_height=8, scroll_offset=1),
+                        xcursor=True,
+                        ycursor=True,
+                    ),
+                ],
+            ),
+            focused_element=menu_window,
         )
 
-    def register_menu(self, name: str, menu_class: Type[TyperdanticMenu]):
-        if name in self.menu_registry:
+    def focus_menu(self):
+        """Gives the keyboard focus back to the menu."""
+        self.application.layout.focus(self._menu_window)
+
+    def register_menu(
+        self, name: str, menu_class: Type[TyperdanticMenu], replace: bool = False
+    ):
+        """
+        Registers `menu_class` under `name`, the `target_menu` of items that
+        open it. Pass `replace=True` to swap in a reloaded class.
+        """
+        if name in self.menu_registry and not replace:
             raise ValueError(f"Menu '{name}' is already registered.")
         self.menu_registry[name] = menu_class
 
+    def menu_name_of(self, menu: TyperdanticMenu) -> Optional[str]:
+        """
+        Returns the registered name of `menu`'s class, if any, with the
+        parameters of a template menu, e.g. "service_menu(env=prod)".
+        """
+        for name, menu_class in self.menu_registry.items():
+            if type(menu) is menu_class:
+                return format_menu_ref(name, menu.params)
+        return None
+
+    def has_menu(self, ref: str) -> bool:
+        """
+        Whether `ref` names a registered menu with the parameters it takes,
+        i.e. whether `build_menu(ref)` can build it.
+        """
+        try:
+            name, params = parse_menu_ref(ref)
+            menu_class = self.menu_registry.get(name)
+            if menu_class is not None and (params or menu_class.template_params):
+                menu_class._checked_params(params)
+        except ValueError:
+            return False
+        return menu_class is not None
+
+    def build_menu(self, ref: str) -> TyperdanticMenu:
+        """
+        Builds the menu `ref` names: a registered name, or the name of a
+        template menu with its parameters, "service_menu(env=prod, svc=api)".
+        Raises KeyError if it is not registered, and ValueError if the
+        parameters don't match the template's.
+        """
+        name, params = parse_menu_ref(ref)
+        menu_class = self.menu_registry[name]
+        if params:
+            return menu_class(app=self, params=params)
+        return menu_class(app=self)
+
+    def on(self, event: str, handler: Callable[..., None]):
+        """
+        Subscribes `handler` to an app event. Handlers are called with the
+        app as the first argument, followed by keyword arguments:
+
+        - "navigate": menu_name
+        - "back": no arguments
+        - "selection": item (before it is handled)
+        - "selection_done": item (after it was handled)
+        - "prompt": item, values (the runtime arguments that were entered)
+        """
+        self._event_handlers.setdefault(event, []).append(handler)
+
+    def _emit(self, event: str, **payload: Any):
+        for handler in self._event_handlers.get(event, ()):
+            handler(self, **payload)
+
+    def invalidate_data(self, keys: Optional[Iterable[str]] = None):
+        """
+        Marks data as changed, so that menus depending on it are refreshed
+        before they are shown again. Cached entries tagged with the keys are
+        dropped as well. With no keys, everything is invalidated, and the
+        whole cache is cleared.
+        """
+        self.data_version += 1
+        if keys is None:
+            self._all_invalidated_at = self.data_version
+            self.cache.clear()
+            return
+        keys = list(keys)
+        for key in keys:
+            self._invalidated_at[key] = self.data_version
+        self.cache.invalidate_tags(keys)
+
+    def data_changed_since(
+        self, version: int, keys: Optional[Iterable[str]] = None
+    ) -> bool:
+        """
+        Whether any of `keys` (or, with None, any data at all) was invalidated
+        after `version`.
+        """
+        if self._all_invalidated_at > version:
+            return True
+        if keys is None:
+            return any(at > version for at in self._invalidated_at.values())
+        return any(self._invalidated_at.get(key, 0) > version for key in keys)
+
+    def _refresh_if_stale(self, menu: TyperdanticMenu):
+        if not menu.needs_refresh():
+            return
+        with self._timed("typerdantic_refresh_seconds", menu=type(menu).__name__):
+            menu.refresh_items()
+
     def _build_keybindings(self) -> KeyBindings:
         kb = KeyBindings()
+        # The pause panel's, the form's, the palette's and the filter bar's
+        # bindings take over while open.
+        in_menu = ~self.pause_panel.add_key_bindings(kb)
+        in_menu = in_menu & ~self.form.add_key_bindings(kb)
+        in_menu = in_menu & ~self.palette.add_key_bindings(kb)
+        in_menu = in_menu & ~self.filter_bar.add_key_bindings(kb, in_menu)
 
-        @kb.add("up")
+        @kb.add("up", filter=in_menu)
         def _(event):
             self.active_menu.go_up()
+            self._on_cursor_moved()
 
-        @kb.add("down")
+        @kb.add("down", filter=in_menu)
         def _(event):
             self.active_menu.go_down()
+            self._on_cursor_moved()
 
-        @kb.add("enter")
+        @kb.add("enter", filter=in_menu)
         async def _(event):
             item = self.active_menu.get_selected_item()
             if item:
                 await self.handle_selection(item)
 
-        @kb.add("c-c", "q")
+        @kb.add("c-c", filter=in_menu)
+        @kb.add("q", filter=in_menu)
         def _(event):
             self.go_back()
 
+        @kb.add("space", filter=in_menu)
+        def _(event):
+            self.active_menu.toggle_mark()
+
+        @kb.add("s-up", filter=in_menu)
+        def _(event):
+            self.active_menu.extend_marks(-1)
+            self._on_cursor_moved()
+
+        @kb.add("s-down", filter=in_menu)
+        def _(event):
+            self.active_menu.extend_marks(1)
+            self._on_cursor_moved()
+
+        @kb.add("*", filter=in_menu)
+        def _(event):
+            self.active_menu.mark_all()
+
+        @kb.add("x", filter=in_menu)
+        async def _(event):
+            await self.run_marked()
+
+        @kb.add("f12", filter=Condition(lambda: self.metrics is not None))
+        def _(event):
+            self.show_metrics_overlay = not self.show_metrics_overlay
+
+        @kb.add("f9", filter=Condition(lambda: self.profiler is not None))
+        def _(event):
+            self.profiler.toggle_menu(type(self.active_menu).__name__)
+
         return kb
 
     def _get_current_fragments(self):
-        return self.active_menu.get_display_fragments()
+        with self._timed(
+            "typerdantic_render_seconds", menu=type(self.active_menu).__name__
+        ), self._profiled("render"):
+            return self.active_menu.get_display_fragments()
+
+    def _get_metrics_fragments(self):
+        lines = self.metrics.summary_lines() if self.metrics else []
+        return [("", "\n".join(lines) or "No metrics recorded yet.")]
+
+    def _on_cursor_moved(self):
+        if self.prefetcher is not None:
+            self.prefetcher.schedule(self.active_menu.get_selected_item())
 
     def navigate_to(self, menu_name: str):
-        menu_class = self.menu_registry.get(menu_name)
-        if menu_class:
-            new_menu = menu_class(app=self)
+        if self.has_menu(menu_name):
+            # Template parameters are left out of the metric's labels.
+            label = parse_menu_ref(menu_name)[0]
+            with self._timed("typerdantic_navigate_seconds", menu=label):
+                new_menu = None
+                if self.prefetcher is not None:
+                    new_menu = self.prefetcher.take(menu_name)
+                if new_menu is None:
+                    new_menu = self.build_menu(menu_name)
             self.nav_stack.append(new_menu)
             self.active_menu = new_menu
+            self._emit("navigate", menu_name=menu_name)
+            self._on_cursor_moved()
             self.application.invalidate()
 
+    def _show_restored(self, state: "MenuState"):
+        """Builds the menu of a restored session level and shows it."""
+        label = parse_menu_ref(state.name)[0]
+        with self._timed("typerdantic_navigate_seconds", menu=label):
+            menu = self.build_menu(state.name)
+        menu.restore_view(state.selected, state.scroll, state.filter)
+        self.nav_stack.append(menu)
+        self.active_menu = menu
+        self._on_cursor_moved()
+
+    def jump_to(self, menu_name: str, item_name: Optional[str] = None):
+        """
+        Shows the registered menu `menu_name` as if it had been reached from
+        the main menu, and highlights its item `item_name`. Menus already on
+        the navigation stack along the way are kept.
+        """
+        path = self.command_index.path_to(menu_name)
+        self._deferred_menus = []
+        keep = 1
+        while (
+            keep < min(len(self.nav_stack), len(path))
+            and self.menu_name_of(self.nav_stack[keep]) == path[keep]
+        ):
+            keep += 1
+        for menu in self.nav_stack[keep:]:
+            menu.on_close()
+        del self.nav_stack[keep:]
+        self.active_menu = self.nav_stack[-1]
+        self._refresh_if_stale(self.active_menu)
+        for name in path[keep:]:
+            self.navigate_to(name)
+        if item_name is not None and self.active_menu.select_item(item_name):
+            self._on_cursor_moved()
+        self.application.invalidate()
+
     def go_back(self):
         if len(self.nav_stack) > 1:
-            self.nav_stack.pop()
+            self.nav_stack.pop().on_close()
             self.active_menu = self.nav_stack[-1]
+            if len(self.nav_stack) == 1 and self._deferred_menus:
+                self._show_restored(self._deferred_menus.pop())
+            # Actions run in deeper menus may have changed this menu's data.
+            self._refresh_if_stale(self.active_menu)
+            self._emit("back")
+            self._on_cursor_moved()
             self.application.invalidate()
         else:
             self.application.exit()
 
     async def handle_selection(self, item: MenuItem):
+        self._emit("selection", item=item)
+        try:
+            with self._profiled("selection"):
+                await self._handle_selection(item)
+        finally:
+            self._emit("selection_done", item=item)
+
+    async def _handle_selection(self, item: MenuItem):
         if item.is_quit:
             self.go_back()
             return
@@ -99,39 +567,376 @@ class TyperdanticApp:
             final_args = item.args.copy() if item.args else {}
 
             # --- NEW: Prompt for runtime arguments ---
-            if item.prompt_args:
-                # Temporarily exit the full-screen app to use the prompt
-                self.application.suspend_to_background()
-                try:
-                    session: PromptSession = PromptSession()
-                    for arg_spec in item.prompt_args:
-                        user_input = await session.prompt_async(
-                            f"{arg_spec.prompt}: ",
-                            default=str(arg_spec.default or ""),
-                        )
-                        final_args[arg_spec.name] = user_input
-                finally:
-                    # Ensure we always resume the application
-                    self.application.resume_from_background()
-
-            context = {"app": self, "menu": self.active_menu}
+            # (A batch takes its arguments from its rows instead.)
+            prompted = bool(item.prompt_args) and item.batch is None
+            if prompted:
+                values = await self._prompt_for_args(item)
+                if values is None:
+                    # The form was cancelled.
+                    return
+                self._emit("prompt", item=item, values=values)
+                final_args.update(values)
+
+            context = {
+                "app": self,
+                "menu": self.active_menu,
+                "progress": ProgressHandle(),
+                "cache": self.cache,
+            }
+
+            if item.watch is not None:
+                self._start_watch(item, context, final_args)
+                return
 
+            # Items that asked for arguments don't pause again afterwards.
+            pause = item.pause and not prompted
+            output = ""
             if callable(item.action):
-                if asyncio.iscoroutinefunction(item.action):
-                    await item.action(context=context, args=final_args)
+                if pause and self.is_running:
+                    # Shown in the pause panel, where a redraw can't wipe it.
+                    with routed_stdout(), capture_output() as captured:
+                        await self._run_action(item, context, final_args)
+                    output = captured.getvalue()
                 else:
-                    item.action(context=context, args=final_args)
+                    await self._run_action(item, context, final_args)
 
-            self.active_menu.refresh_items()
-            # No need for a separate "Press Enter" prompt, as the prompt session handles it
-            if not item.prompt_args:
-                session = PromptSession()
-                await session.prompt_async("\nPress Enter to continue...")
+            # Only menus whose data the action changed are refreshed.
+            self.invalidate_data(item.invalidates)
+            self._refresh_if_stale(self.active_menu)
+            if pause:
+                await self._pause(output, item.description)
 
         if item.target_menu:
             self.navigate_to(item.target_menu)
         elif action_was_run:
             self.application.invalidate()
 
-    async def run(self):
-        await self.application.run_async()
+    async def _prompt_for_args(self, item: MenuItem) -> Optional[Dict[str, Any]]:
+        """
+        Asks the user for each of the item's `prompt_args`. With a session,
+        the values entered last time are the defaults. Returns None if the
+        user cancelled.
+        """
+        if self.session is None:
+            return await self._prompt_for(item.prompt_args, title=item.description)
+        key = f"{self.menu_name_of(self.active_menu)}:{item.description}"
+        values = await self._prompt_for(
+            item.prompt_args, self.session.prompt_defaults(key), item.description
+        )
+        if values is not None:
+            self.session.remember_prompt(key, values)
+        return values
+
+    async def _prompt_for(
+        self,
+        arg_specs: Iterable[Any],
+        defaults: Optional[Dict[str, Any]] = None,
+        title: str = "",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Asks for `arg_specs` in the form of the running app, or with a prompt
+        per argument when the app isn't running. Returns None if cancelled.
+        """
+        if self.is_running:
+            return await self.form.ask(arg_specs, defaults, title)
+        defaults = defaults or {}
+        values: Dict[str, Any] = {}
+        session = self._terminal_session()
+        for arg_spec in arg_specs:
+            options: Dict[str, Any] = {}
+            completer = self.completer_for(arg_spec)
+            if completer is not None:
+                options = {"completer": completer, "complete_while_typing": True}
+            user_input = await session.prompt_async(
+                f"{arg_spec.prompt}: ",
+                default=str(defaults.get(arg_spec.name, arg_spec.default) or ""),
+                **options,
+            )
+            values[arg_spec.name] = user_input
+        return values
+
+    def completer_for(self, arg_spec: Any) -> Optional["ArgumentCompleter"]:
+        """The completer of a prompted argument, if it has `completions`."""
+        if getattr(arg_spec, "completions", None) is None:
+            return None
+        from .completion import ArgumentCompleter
+
+        return ArgumentCompleter(arg_spec.completions, self.cache)
+
+    async def _pause(self, output: str, title: str = ""):
+        """
+        Waits for Enter after an action: in the pause panel of the running
+        app, which shows the action's `output`, or with a prompt otherwise.
+        """
+        if self.is_running:
+            await self.pause_panel.wait(output, title)
+        else:
+            await self._terminal_session().prompt_async(f"\n{CONTINUE_PROMPT}")
+
+    def _terminal_session(self) -> PromptSession:
+        """The prompt session used outside the running app, created once."""
+        if self._prompt_session is None:
+            self._prompt_session = PromptSession()
+        return self._prompt_session
+
+    async def run_marked(self):
+        """
+        Runs the actions of the items marked in the active menu concurrently,
+        at most `bulk_concurrency` at a time, then shows their results and
+        output in one BulkResultsMenu.
+
+        Arguments the items prompt for are asked once and shared by all.
+        """
+        from .bulk import BulkResultsMenu, run_items
+
+        menu = self.active_menu
+        marked = menu.marked_items()
+        if not marked:
+            return
+        specs: Dict[str, Any] = {}
+        for _, item in marked:
+            for spec in item.prompt_args or ():
+                specs.setdefault(spec.name, spec)
+        values = {}
+        if specs:
+            values = await self._prompt_for(
+                specs.values(), title=f"{len(marked)} marked items"
+            )
+            if values is None:
+                return
+
+        async def run(item: MenuItem):
+            args = dict(item.args or {})
+            args.update(
+                (spec.name, values[spec.name]) for spec in item.prompt_args or ()
+            )
+            context = {
+                "app": self,
+                "menu": menu,
+                "progress": ProgressHandle(),
+                "cache": self.cache,
+            }
+            return await self._call_with_metrics(item, context, args)
+
+        progress = ProgressHandle(total=len(marked), message="Running marked items")
+        with self._profiled("bulk"):
+            async with self._showing_progress(progress):
+                results = await run_items(
+                    marked,
+                    run,
+                    concurrency=self.bulk_concurrency,
+                    on_result=lambda result: progress.advance(),
+                )
+        menu.clear_marks()
+
+        invalidated = [item.invalidates for _, item in marked]
+        if any(keys is None for keys in invalidated):
+            self.invalidate_data()
+        else:
+            self.invalidate_data({key for keys in invalidated for key in keys})
+        self._refresh_if_stale(menu)
+        self.show_menu(BulkResultsMenu(app=self, results=results))
+
+    def show_menu(self, menu: TyperdanticMenu):
+        """Shows a menu instance built by the caller, e.g. a results view."""
+        self.nav_stack.append(menu)
+        self.active_menu = menu
+        self._on_cursor_moved()
+        self.application.invalidate()
+
+    def _start_watch(self, item: MenuItem, context: dict, args: dict):
+        """Shows a WatchMenu that runs the item's action on its schedule."""
+        from .watch import WatchMenu, Watcher, action_runner
+
+        menu = WatchMenu(app=self, description=item.description)
+        menu.watch(
+            Watcher(action_runner(item, context, args), item.watch, self._redraw)
+        )
+        self.show_menu(menu)
+
+    async def _run_action(self, item: MenuItem, context: dict, args: dict):
+        """Runs an item's action, recording its duration and outcome."""
+        with self._profiled("action", item.description):
+            async with self._showing_progress(context.get("progress")):
+                if item.batch is not None:
+                    return await self._run_batch(item, context)
+                return await self._call_with_metrics(item, context, args)
+
+    async def _run_batch(self, item: MenuItem, context: dict):
+        """Runs an item's action once per row of its batch, then reports."""
+        from .batch import batch_rows, format_summary, run_batch
+
+        spec = item.batch
+        summary = await run_batch(
+            item,
+            batch_rows(spec),
+            context=context,
+            concurrency=spec.concurrency,
+            retries=spec.retries,
+            retry_delay=spec.retry_delay,
+            call=self._call_with_metrics,
+        )
+        print(format_summary(summary))
+        return summary
+
+    @contextlib.asynccontextmanager
+    async def _showing_progress(self, progress: Optional[ProgressHandle]):
+        """Displays `progress` while the block runs, redrawing at a fixed rate."""
+        if progress is None:
+            yield
+            return
+
+        async def refresh():
+            seen = progress.version
+            while True:
+                await asyncio.sleep(self.progress_refresh_interval)
+                if progress.version != seen:
+                    seen = progress.version
+                    self.application.invalidate()
+
+        self.progress = progress
+        refresher = asyncio.ensure_future(refresh())
+        try:
+            yield
+        finally:
+            refresher.cancel()
+            self.progress = None
+            self.application.invalidate()
+
+    def _progress_visible(self) -> bool:
+        # Hidden until the action reports something.
+        return self.progress is not None and self.progress.version > 0
+
+    def _get_progress_fragments(self):
+        if self.progress is None:
+            return []
+        return [("", render_progress(self.progress))]
+
+    async def _call_with_metrics(self, item: MenuItem, context: dict, args: dict):
+        menu = context.get("menu", self.active_menu)
+        if self.history is None or not menu.record_history:
+            return await self._call_timed(item, context, args)
+        menu_name = self.menu_name_of(menu) or type(menu).__name__
+        with self.history.track(menu_name, item, args) as run:
+            run.result = await self._call_timed(item, context, args)
+        return run.result
+
+    async def _call_timed(self, item: MenuItem, context: dict, args: dict):
+        in_thread = item.run_in_thread
+        if not self.metrics:
+            return await call_action(
+                item.action, context=context, args=args, in_thread=in_thread
+            )
+
+        labels = {
+            "menu": type(self.active_menu).__name__,
+            "item": item.description,
+        }
+        status = "error"
+        start = time.perf_counter()
+        try:
+            result = await call_action(
+                item.action, context=context, args=args, in_thread=in_thread
+            )
+            # Command and script actions report their exit code.
+            if isinstance(result, int) and not isinstance(result, bool):
+                status = f"exit_{result}"
+            else:
+                status = "ok"
+            return result
+        finally:
+            self.metrics.observe(
+                "typerdantic_action_seconds", time.perf_counter() - start, **labels
+            )
+            self.metrics.inc("typerdantic_actions_total", status=status, **labels)
+
+    async def run(
+        self,
+        profile_dir: Optional[Union[str, Path]] = None,
+        trace_memory: bool = False,
+        record_path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Runs the application until the main menu is exited.
+
+        Args:
+            profile_dir: If given, profile rendering, selections and actions
+                with cProfile and write per-session reports to this directory.
+            trace_memory: With `profile_dir`, also report the top allocation
+                sites using tracemalloc.
+            record_path: If given, record the session (keys, navigation,
+                selections and prompt inputs) to this JSON-lines file for
+                later replay with `typerdantic.recording.replay_session`.
+        """
+        if profile_dir is not None:
+            self.profiler = Profiler(profile_dir, trace_memory=trace_memory)
+            self.profiler.start()
+
+        recorder = None
+        if record_path is not None:
+            from .recording import SessionRecorder
+
+            recorder = SessionRecorder(self, record_path)
+            recorder.start()
+
+        saver = None
+        if self.session is not None:
+            if not self._session_restored:
+                self.restore_session()
+            saver = asyncio.ensure_future(self._save_session_periodically())
+        # The first item may already be highlighted for long enough.
+        self._on_cursor_moved()
+        try:
+            await self._run_with_metrics()
+        finally:
+            if saver is not None:
+                saver.cancel()
+                self.save_session()
+            if self.prefetcher is not None:
+                self.prefetcher.clear()
+            for menu in reversed(self.nav_stack):
+                menu.on_close()
+            if self.history is not None:
+                self.history.flush()
+            if recorder:
+                recorder.stop()
+            if self.profiler:
+                self.profiler.write_reports()
+                self.profiler.stop()
+                self.profiler = None
+
+    def restore_session(self) -> bool:
+        """
+        Returns to the navigation state saved by the session store. Called
+        by `run()`, after the menus have been registered. Returns whether
+        a saved session was restored.
+        """
+        self._session_restored = True
+        return self.session.restore(self, self.session.load())
+
+    def save_session(self) -> bool:
+        """Saves the session now if it changed. Returns whether it was written."""
+        try:
+            return self.session.save(self.session.capture(self))
+        except OSError:
+            return False
+
+    async def _save_session_periodically(self):
+        while True:
+            await asyncio.sleep(self.session.save_interval)
+            self.save_session()
+
+    async def _run_with_metrics(self):
+        if not self.metrics:
+            await self.application.run_async()
+            return
+
+        set_active_metrics(self.metrics)
+        lag_probe = asyncio.ensure_future(self._measure_loop_lag())
+        try:
+            await self.application.run_async()
+        finally:
+            lag_probe.cancel()
+            set_active_metrics(None)
+            if self.metrics.export_path:
+                self.metrics.export()
@@ -0,0 +1,153 @@
+# src/typerdantic/attach.py
+
+"""
+A thin terminal client for a running typerdantic daemon.
+
+The client only uses the standard library, so attaching does not pay for
+importing pydantic, prompt_toolkit or the application's menus. It puts the
+terminal in raw mode, forwards key presses and window resizes to the daemon,
+and copies the daemon's output to the terminal until the session ends.
+
+Wire format, client to daemon, one JSON object per line:
+
+    {"type": "hello", "rows": 40, "columns": 120, "term": "xterm-256color"}
+    {"type": "input", "data": "\\u001b[B"}
+    {"type": "resize", "rows": 50, "columns": 120}
+
+Daemon to client: raw terminal output. The daemon closes the connection when
+the session ends.
+
+Usage:
+    python -m typerdantic.attach [--socket PATH]
+"""
+
+import argparse
+import codecs
+import json
+import os
+import selectors
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+from typing import Any, Dict, Optional, TextIO
+
+
+def default_socket_path() -> str:
+    """Returns the per-user default socket path of the daemon."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "typerdantic.sock")
+    return os.path.join(tempfile.gettempdir(), f"typerdantic-{os.getuid()}.sock")
+
+
+def _send(sock: socket.socket, message: Dict[str, Any]):
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def _terminal_size(fd: int) -> Dict[str, int]:
+    try:
+        size = os.get_terminal_size(fd)
+    except OSError:
+        size = shutil.get_terminal_size()
+    if not (size.lines and size.columns):
+        # Some pseudo-terminals report 0x0 until their size is set.
+        size = shutil.get_terminal_size()
+    return {"rows": size.lines, "columns": size.columns}
+
+
+def attach(
+    socket_path: Optional[str] = None,
+    stdin: Optional[TextIO] = None,
+    stdout: Optional[TextIO] = None,
+) -> int:
+    """
+    Attaches the terminal to a daemon session and blocks until it ends.
+
+    Args:
+        socket_path: The daemon's socket. Defaults to `default_socket_path()`.
+        stdin: The terminal to read keys from. Defaults to `sys.stdin`.
+        stdout: The terminal to draw on. Defaults to `sys.stdout`.
+
+    Returns:
+        0 when the session ended normally.
+    """
+    import termios
+    import tty
+
+    in_fd = (stdin or sys.stdin).fileno()
+    out_fd = (stdout or sys.stdout).fileno()
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(socket_path or default_socket_path())
+    _send(
+        sock,
+        {
+            "type": "hello",
+            "term": os.environ.get("TERM", "xterm"),
+            **_terminal_size(out_fd),
+        },
+    )
+
+    resized = False
+
+    def on_resize(signum, frame):
+        nonlocal resized
+        resized = True
+
+    # Key presses can be split across reads in the middle of a character.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    old_attrs = termios.tcgetattr(in_fd)
+    old_handler = signal.signal(signal.SIGWINCH, on_resize)
+    selector = selectors.DefaultSelector()
+    selector.register(in_fd, selectors.EVENT_READ, "stdin")
+    selector.register(sock, selectors.EVENT_READ, "socket")
+    try:
+        tty.setraw(in_fd)
+        while True:
+            # Wake up periodically so resizes are forwarded promptly.
+            for key, _ in selector.select(timeout=0.1):
+                if key.data == "socket":
+                    data = sock.recv(65536)
+                    if not data:
+                        return 0
+                    os.write(out_fd, data)
+                else:
+                    data = os.read(in_fd, 1024)
+                    if not data:
+                        selector.unregister(in_fd)
+                        continue
+                    _send(sock, {"type": "input", "data": decoder.decode(data)})
+            if resized:
+                resized = False
+                _send(sock, {"type": "resize", **_terminal_size(out_fd)})
+    except (BrokenPipeError, ConnectionResetError):
+        return 0
+    finally:
+        selector.close()
+        signal.signal(signal.SIGWINCH, old_handler)
+        termios.tcsetattr(in_fd, termios.TCSADRAIN, old_attrs)
+        sock.close()
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m typerdantic.attach",
+        description="Attach this terminal to a running typerdantic daemon.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=default_socket_path(),
+        help="The daemon's Unix socket (default: %(default)s).",
+    )
+    args = parser.parse_args(argv)
+    try:
+        return attach(args.socket)
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"No typerdantic daemon is listening on {args.socket}.", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,19 @@
 # src/typerdantic/base.py
 from __future__ import annotations
+from bisect import bisect_left
 from pydantic import BaseModel
-from typing import List, Tuple, Optional, TYPE_CHECKING
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Set,
+    Tuple,
+    Optional,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from .app import TyperdanticApp
@@ -9,31 +21,281 @@ if TYPE_CHECKING:
 from .models import MenuItem
 
 
+class RowStyles(NamedTuple):
+    """The style strings of an item's row, resolved once per item."""
+
+    normal: str
+    marked: str
+    selected: str
+
+
+_PLAIN_ROW = RowStyles("class:menu-item", "class:marked", "class:selected")
+
+
+def style_classes(spec: Optional[str]) -> str:
+    """
+    Turns style class names ("danger", "danger warn", "class:danger") into
+    a style string suffix (" class:danger class:warn").
+    """
+    if not spec:
+        return ""
+    names = spec.replace(",", " ").split()
+    return "".join(
+        " class:" + (name[6:] if name.startswith("class:") else name) for name in names
+    )
+
+
+def parse_menu_ref(ref: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Splits a `target_menu` such as "service_menu(env=prod, svc=api)" into
+    the menu name and its parameters. A plain name has no parameters.
+    """
+    ref = ref.strip()
+    if not ref.endswith(")"):
+        return ref, {}
+    name, paren, body = ref[:-1].partition("(")
+    name = name.strip()
+    if not paren or not name:
+        raise ValueError(f"Invalid menu reference '{ref}'.")
+    params: Dict[str, str] = {}
+    for part in body.split(","):
+        if not part.strip():
+            continue
+        key, equals, value = part.partition("=")
+        if not equals or not key.strip():
+            raise ValueError(
+                f"Invalid parameter '{part.strip()}' in menu reference '{ref}'."
+            )
+        params[key.strip()] = value.strip()
+    return name, params
+
+
+def format_menu_ref(name: str, params: Optional[Dict[str, str]] = None) -> str:
+    """The inverse of `parse_menu_ref`."""
+    if not params:
+        return name
+    return f"{name}({', '.join(f'{key}={value}' for key, value in params.items())})"
+
+
+class _KeepMissing(dict):
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def bind_text(text: str, params: Dict[str, str]) -> str:
+    """
+    Fills the `{name}` placeholders of `text` that are in `params`. Other
+    placeholders (e.g. those of batch rows) are left as they are.
+    """
+    if "{" not in text:
+        return text
+    try:
+        return text.format_map(_KeepMissing(params))
+    except (AttributeError, IndexError, KeyError, ValueError):
+        return text
+
+
+def bind_item(item: MenuItem, params: Dict[str, str]) -> MenuItem:
+    """
+    A shallow copy of a template's `item` with `params` filled into its
+    description, target menu and string arguments. The parameters are
+    also passed to its action as arguments.
+
+    The action, argument specs and other definitions stay shared with the
+    template's item.
+    """
+    update: Dict[str, Any] = {"description": bind_text(item.description, params)}
+    if item.target_menu:
+        update["target_menu"] = bind_text(item.target_menu, params)
+    if item.action is not None:
+        args = {
+            key: bind_text(value, params) if isinstance(value, str) else value
+            for key, value in (item.args or {}).items()
+        }
+        update["args"] = {**params, **args}
+    return item.model_copy(update=update)
+
+
+class ItemChanges(NamedTuple):
+    """The item names a refresh added, removed or changed."""
+
+    added: List[str]
+    removed: List[str]
+    changed: List[str]
+
+
+def reconcile_items(
+    old: List[Tuple[str, MenuItem]], new: List[Tuple[str, MenuItem]]
+) -> Tuple[List[Tuple[str, MenuItem]], ItemChanges]:
+    """
+    Matches `new` items to `old` ones by name.
+
+    Returns the new list, in which items equal to the old item of the same
+    name are replaced by that old instance (so that anything cached for it
+    stays valid), and the names that were added, removed or changed. Names
+    that occur more than once are matched by their first occurrence.
+    """
+    old_by_name: Dict[str, MenuItem] = {}
+    for name, item in old:
+        old_by_name.setdefault(name, item)
+
+    reconciled: List[Tuple[str, MenuItem]] = []
+    added: List[str] = []
+    changed: List[str] = []
+    seen = set()
+    for name, item in new:
+        previous = old_by_name.get(name) if name not in seen else None
+        seen.add(name)
+        if previous is None:
+            if name not in old_by_name:
+                added.append(name)
+        elif previous is item or previous == item:
+            item = previous
+        else:
+            changed.append(name)
+        reconciled.append((name, item))
+    removed = [name for name in old_by_name if name not in seen]
+    return reconciled, ItemChanges(added, removed, changed)
+
+
 class TyperdanticMenu(BaseModel):
     """
     A data container for a menu's content and state.
+
+    Set `depends_on` to the data keys the menu's items are built from (e.g.
+    `{"tasks"}`), so that it is only refreshed after an action invalidates
+    one of them. The default, None, refreshes it after any invalidation.
+
+    Set `record_history = False` to keep the menu's actions out of the app's
+    run history (see `typerdantic.history`).
+
+    Set `template_params` to the names of the parameters a menu takes to
+    make it a template: it is opened with a `target_menu` such as
+    "service_menu(env=prod, svc=api)", and each instance fills its
+    parameters into the `{placeholders}` of its title and of its items'
+    descriptions, target menus and arguments (see `bind_item`). The items
+    are declared once, on the class; an instance only stores `params`.
+
+    Items with an action can be marked (`toggle_mark`, `mark_range`,
+    `mark_all`) to run them together, and `set_filter` narrows the items
+    shown to those whose description contains every word of a query.
     """
 
     app: "TyperdanticApp"
 
+    depends_on: ClassVar[Optional[Iterable[str]]] = None
+    record_history: ClassVar[bool] = True
+    # Extra style classes for the title and every row of this menu.
+    style_class: ClassVar[Optional[str]] = None
+    # The parameter names of a template menu; None for a plain menu.
+    template_params: ClassVar[Optional[Tuple[str, ...]]] = None
+
     # Internal state
     _menu_items: List[Tuple[str, MenuItem]] = []
+    _data_version: int = 0
     _selected_index: int = 0
     _scroll_offset: int = 0
     _max_display_items: int = 10
+    # Rendered rows by item name, valid while the item instance is the same.
+    _row_cache: Dict[str, Tuple[MenuItem, str, RowStyles]] = {}
+    # The resolved `style_class` of the menu.
+    _style_suffix: str = ""
+    # Names of the marked items.
+    _marked: Set[str] = set()
+    # The filter query, and the indices of the items it shows (None: all).
+    _filter: str = ""
+    _view: Optional[List[int]] = None
+    # The parameters of a template menu instance.
+    _params: Dict[str, str] = {}
 
-    def __init__(self, **data):
+    def __init__(self, params: Optional[Dict[str, str]] = None, **data):
+        if not type(self).__pydantic_complete__:
+            type(self)._rebuild_with_app()
         super().__init__(**data)
+        if params or self.template_params:
+            self._params = self._checked_params(params or {})
+        self._style_suffix = style_classes(self.style_class)
         self.refresh_items()
 
-    def refresh_items(self):
-        """Re-evaluates the menu items. Useful for dynamic menus."""
-        self._menu_items = self.get_items()
-        # Clamp selected index to be valid
-        if self._selected_index >= len(self._menu_items) and self._menu_items:
-            self._selected_index = len(self._menu_items) - 1
-        elif not self._menu_items:
-            self._selected_index = 0
+    @classmethod
+    def _rebuild_with_app(cls):
+        """
+        Resolves the `app` forward reference and builds the model schema.
+
+        Schema building is deferred until the first instance is created, so
+        that defining or loading menus does not import the prompt_toolkit
+        application stack.
+        """
+        from .app import TyperdanticApp
+
+        cls.model_rebuild(_types_namespace={"TyperdanticApp": TyperdanticApp})
+
+    @classmethod
+    def _checked_params(cls, params: Dict[str, str]) -> Dict[str, str]:
+        expected = cls.template_params
+        if expected is None:
+            raise ValueError(f"Menu '{cls.__name__}' takes no parameters.")
+        unknown = [name for name in params if name not in expected]
+        if unknown:
+            raise ValueError(
+                f"Menu '{cls.__name__}' has no parameter(s) {', '.join(unknown)}."
+            )
+        missing = [name for name in expected if name not in params]
+        if missing:
+            raise ValueError(
+                f"Menu '{cls.__name__}' needs parameter(s) {', '.join(missing)}."
+            )
+        return {name: str(value) for name, value in params.items()}
+
+    @property
+    def params(self) -> Dict[str, str]:
+        """The parameters of a template menu instance (empty otherwise)."""
+        return self._params
+
+    def refresh_items(self) -> ItemChanges:
+        """
+        Re-evaluates the menu items. Useful for dynamic menus.
+
+        Items are matched to the previous ones by name: the cursor stays on
+        the same item (at the same row on screen) when items are inserted or
+        removed around it, only rows of changed items are rendered again, and
+        marks of items that are still there are kept.
+        """
+        self._data_version = self.app.data_version
+        old_items = self._menu_items
+        selected_name = None
+        if old_items and self._selected_index < len(old_items):
+            selected_name = old_items[self._selected_index][0]
+        screen_row = (self._position_of(self._selected_index) or 0) - (
+            self._scroll_offset
+        )
+
+        self._menu_items, changes = reconcile_items(old_items, self.get_items())
+        for name in changes.removed + changes.changed:
+            self._row_cache.pop(name, None)
+        if self._marked and changes.removed:
+            self._marked = self._marked.difference(changes.removed)
+        self._view = self._matching_indices()
+
+        new_index = None
+        if selected_name is not None and selected_name not in changes.removed:
+            new_index = next(
+                i
+                for i, (name, _) in enumerate(self._menu_items)
+                if name == selected_name
+            )
+        new_position = None if new_index is None else self._position_of(new_index)
+        if new_position is not None:
+            self._selected_index = new_index
+            self._scroll_offset = max(0, new_position - screen_row)
+        else:
+            self._selected_index = self._nearest_visible(self._selected_index)
+        self._clamp_scroll()
+        return changes
+
+    def needs_refresh(self) -> bool:
+        """Whether data this menu depends on changed since its last refresh."""
+        return self.app.data_changed_since(self._data_version, self.depends_on)
 
     def get_items(self) -> List[Tuple[str, MenuItem]]:
         """
@@ -44,52 +306,284 @@ class TyperdanticMenu(BaseModel):
         for name, field_info in self.__class__.model_fields.items():
             if isinstance(field_info.default, MenuItem):
                 items.append((name, field_info.default))
+        if self._params:
+            items = [(name, bind_item(item, self._params)) for name, item in items]
         return items
 
+    def _visible_count(self) -> int:
+        return len(self._menu_items) if self._view is None else len(self._view)
+
+    def _index_at(self, position: int) -> int:
+        """The index in `_menu_items` of the item shown at `position`."""
+        return position if self._view is None else self._view[position]
+
+    def _position_of(self, index: int) -> Optional[int]:
+        """The position at which the item at `index` is shown, if it is."""
+        if self._view is None:
+            return index
+        position = bisect_left(self._view, index)
+        if position < len(self._view) and self._view[position] == index:
+            return position
+        return None
+
+    def _nearest_visible(self, index: int) -> int:
+        """The shown item at `index`, or the next one, or the last one."""
+        count = self._visible_count()
+        if not count:
+            return 0
+        if self._view is None:
+            return min(index, count - 1)
+        return self._view[min(bisect_left(self._view, index), count - 1)]
+
+    def _matching_indices(self) -> Optional[List[int]]:
+        words = self._filter.lower().split()
+        if not words:
+            return None
+        return [
+            index
+            for index, (_, item) in enumerate(self._menu_items)
+            if all(word in item.description.lower() for word in words)
+        ]
+
+    @property
+    def filter_query(self) -> str:
+        """The query set with `set_filter`, or "" when all items are shown."""
+        return self._filter
+
+    def set_filter(self, query: str):
+        """
+        Shows only the items whose description contains every word of
+        `query` (ignoring case). An empty query shows all items again.
+        """
+        self._filter = query
+        self._view = self._matching_indices()
+        if self._position_of(self._selected_index) is None:
+            self._selected_index = self._nearest_visible(self._selected_index)
+        self._clamp_scroll()
+
+    @staticmethod
+    def is_markable(item: MenuItem) -> bool:
+        """Whether `item` can be marked to run it together with others."""
+        return (
+            item.action is not None
+            and not item.is_quit
+            and item.batch is None
+            and item.watch is None
+        )
+
+    def toggle_mark(self, name: Optional[str] = None) -> bool:
+        """
+        Marks the item named `name` (by default, the highlighted one), or
+        unmarks it if it was marked. Returns whether it is marked now.
+        """
+        if name is None:
+            if not self._visible_count():
+                return False
+            name, item = self._menu_items[self._selected_index]
+        else:
+            item = dict(self._menu_items).get(name)
+        if item is None or not self.is_markable(item):
+            return False
+        if name in self._marked:
+            self._marked = self._marked - {name}
+            return False
+        self._marked = self._marked | {name}
+        return True
+
+    def mark_range(self, first: str, last: str) -> int:
+        """
+        Marks the shown items from `first` to `last` (in either order).
+        Returns how many items were newly marked.
+        """
+        positions = {
+            self._menu_items[self._index_at(p)][0]: p
+            for p in range(self._visible_count())
+        }
+        if first not in positions or last not in positions:
+            return 0
+        low, high = sorted((positions[first], positions[last]))
+        return self._mark_positions(range(low, high + 1))
+
+    def extend_marks(self, step: int):
+        """
+        Moves the cursor `step` rows (without wrapping around), marking the
+        items from the highlighted one to the new one.
+        """
+        count = self._visible_count()
+        if not count:
+            return
+        first = self._menu_items[self._selected_index][0]
+        position = self._position_of(self._selected_index) or 0
+        self._selected_index = self._index_at(max(0, min(count - 1, position + step)))
+        self._update_scroll()
+        self.mark_range(first, self._menu_items[self._selected_index][0])
+
+    def mark_all(self) -> int:
+        """
+        Marks every shown item, or unmarks them all if they were all marked
+        already. Returns how many items were newly marked.
+        """
+        added = self._mark_positions(range(self._visible_count()))
+        if added:
+            return added
+        shown = {
+            self._menu_items[self._index_at(p)][0] for p in range(self._visible_count())
+        }
+        self._marked = self._marked - shown
+        return 0
+
+    def _mark_positions(self, positions: Iterable[int]) -> int:
+        names = set()
+        for position in positions:
+            name, item = self._menu_items[self._index_at(position)]
+            if self.is_markable(item):
+                names.add(name)
+        added = len(names - self._marked)
+        self._marked = self._marked | names
+        return added
+
+    def clear_marks(self):
+        self._marked = set()
+
+    def marked_items(self) -> List[Tuple[str, MenuItem]]:
+        """The marked items, in menu order."""
+        return [(name, item) for name, item in self._menu_items if name in self._marked]
+
+    def _clamp_scroll(self):
+        last_page = max(0, self._visible_count() - self._max_display_items)
+        self._scroll_offset = min(self._scroll_offset, last_page)
+        self._update_scroll()
+
+    def _row(self, name: str, item: MenuItem) -> Tuple[str, RowStyles]:
+        """The text and style strings of an item's row."""
+        cached = self._row_cache.get(name)
+        if cached is not None and cached[0] is item:
+            return cached[1], cached[2]
+        text = f"{item.description}\n"
+        classes = self._style_suffix + style_classes(item.style)
+        if classes:
+            # The highlight is applied last, so it wins over the item's classes.
+            styles = RowStyles(
+                "class:menu-item" + classes,
+                classes.lstrip() + " class:marked",
+                classes.lstrip() + " class:selected",
+            )
+        else:
+            styles = _PLAIN_ROW
+        self._row_cache[name] = (item, text, styles)
+        return text, styles
+
     def _update_scroll(self):
-        if self._selected_index >= self._scroll_offset + self._max_display_items:
-            self._scroll_offset = self._selected_index - self._max_display_items + 1
-        elif self._selected_index < self._scroll_offset:
-            self._scroll_offset = self._selected_index
+        position = self._position_of(self._selected_index) or 0
+        if position >= self._scroll_offset + self._max_display_items:
+            self._scroll_offset = position - self._max_display_items + 1
+        elif position < self._scroll_offset:
+            self._scroll_offset = position
 
     def get_display_fragments(self):
         title = self.__doc__ or "Select an option:"
         cleaned_title = title.strip().splitlines()[0]
-        fragments = [("class:title", f"--- {cleaned_title} ---\n")]
-        start, end = self._scroll_offset, self._scroll_offset + self._max_display_items
-        visible_items = self._menu_items[start:end]
-        for i, (name, item) in enumerate(visible_items, start=start):
-            style = "class:selected" if i == self._selected_index else "class:menu-item"
-            prefix = "> " if i == self._selected_index else "  "
-            fragments.append((style, f"{prefix}{item.description}\n"))
-        if len(self._menu_items) > self._max_display_items:
+        if self._params:
+            cleaned_title = bind_text(cleaned_title, self._params)
+        fragments = [("class:title" + self._style_suffix, f"--- {cleaned_title} ---\n")]
+        count = self._visible_count()
+        start = self._scroll_offset
+        end = min(count, start + self._max_display_items)
+        for position in range(start, end):
+            i = self._index_at(position)
+            name, item = self._menu_items[i]
+            marked = name in self._marked
+            text, styles = self._row(name, item)
+            if i == self._selected_index:
+                style = styles.selected
+            else:
+                style = styles.marked if marked else styles.normal
+            prefix = (">" if i == self._selected_index else " ") + (
+                "*" if marked else " "
+            )
+            fragments.append((style, prefix + text))
+        if self._view is not None:
             fragments.append(
                 (
                     "class:title",
-                    f"\n(Showing {len(visible_items)} of {len(self._menu_items)} items)",
+                    f"\n({count} of {len(self._menu_items)} items match"
+                    f" '{self._filter}')",
                 )
             )
+        elif count > self._max_display_items:
+            fragments.append(
+                (
+                    "class:title",
+                    f"\n(Showing {end - start} of {count} items)",
+                )
+            )
+        if self._marked:
+            fragments.append(("class:title", f"\n{len(self._marked)} marked"))
         return fragments
 
-    def go_up(self):
-        if not self._menu_items:
+    def _move(self, step: int):
+        count = self._visible_count()
+        if not count:
             return
-        self._selected_index = (self._selected_index - 1 + len(self._menu_items)) % len(
-            self._menu_items
-        )
+        position = self._position_of(self._selected_index) or 0
+        self._selected_index = self._index_at((position + step) % count)
         self._update_scroll()
 
+    def go_up(self):
+        self._move(-1)
+
     def go_down(self):
-        if not self._menu_items:
-            return
-        self._selected_index = (self._selected_index + 1) % len(self._menu_items)
-        self._update_scroll()
+        self._move(1)
+
+    def select_item(self, name: str) -> bool:
+        """
+        Highlights the item named `name`, clearing the filter if it hides
+        the item. Returns False if there is no such item.
+        """
+        for index, (item_name, _) in enumerate(self._menu_items):
+            if item_name == name:
+                if self._position_of(index) is None:
+                    self.set_filter("")
+                self._selected_index = index
+                self._update_scroll()
+                return True
+        return False
 
     def get_selected_item(self) -> Optional[MenuItem]:
-        if not self._menu_items:
+        if not self._visible_count():
             return None
         return self._menu_items[self._selected_index][1]
 
+    def view_state(self) -> Dict[str, Any]:
+        """The highlighted item's name, the scroll offset and the filter."""
+        selected = None
+        if self._visible_count():
+            selected = self._menu_items[self._selected_index][0]
+        return {
+            "selected": selected,
+            "scroll": self._scroll_offset,
+            "filter": self._filter,
+        }
+
+    def restore_view(
+        self, selected: Optional[str] = None, scroll: int = 0, filter: str = ""
+    ):
+        """Restores a `view_state()`, as far as the current items allow."""
+        if filter:
+            self.set_filter(filter)
+        if selected is not None:
+            self.select_item(selected)
+        self._scroll_offset = max(0, scroll)
+        self._clamp_scroll()
+
+    def on_close(self):
+        """
+        Called when the menu leaves the navigation stack: when the user goes
+        back from it or jumps elsewhere, and when the app exits. Override it
+        to stop background work or release resources the menu holds.
+        """
+
     class Config:
         extra = "allow"
         arbitrary_types_allowed = True
+        defer_build = True
@@ -0,0 +1,349 @@
+# src/typerdantic/batch.py
+
+"""
+Runs one menu action over many rows of arguments.
+
+Rows come from a CSV, JSON-lines or plain text file, or from the output of a
+command, and are read as the batch runs, so inputs of any size are never
+held in memory. Each row is merged into the item's `args`: string values are
+formatted with the row's fields, and the fields themselves become arguments.
+For an item that restarts a service:
+
+    MenuItem(
+        description="Restart services",
+        action=partial(execute_action_string, "command::systemctl restart {unit}"),
+        args={"unit": "{name}.service"},
+        batch=BatchSpec(source="services.csv", concurrency=8, retries=2),
+    )
+
+every row of services.csv (with a `name` column) restarts one unit, at most
+eight at a time, retrying each failed row twice before reporting it in the
+summary.
+"""
+
+import asyncio
+import csv
+import json
+import string
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .executors import call_action
+from .models import BatchSpec, MenuItem
+from .progress import ProgressHandle
+
+Row = Dict[str, Any]
+
+# Failed rows kept in a BatchSummary; the rest are only counted.
+MAX_FAILURES_KEPT = 100
+
+
+class BatchError(Exception):
+    """Raised when the rows of a batch cannot be read."""
+
+
+class RowResult(BaseModel):
+    """The outcome of running the action for one row."""
+
+    index: int
+    args: Dict[str, Any]
+    ok: bool
+    attempts: int
+    exit_code: Optional[int] = None
+    error: Optional[str] = None
+    duration: float
+
+
+class BatchSummary(BaseModel):
+    """The outcome of a whole batch."""
+
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    duration: float = 0.0
+    failures: List[RowResult] = []
+    source_error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.failed == 0 and self.source_error is None
+
+
+class _KeepMissing(dict):
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def row_args(
+    defaults: Optional[Dict[str, Any]],
+    row: Row,
+    overrides: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Builds the arguments for one row: `defaults` with string values formatted
+    with the row's fields (unknown placeholders are left as they are), then
+    the row's fields, then `overrides`.
+    """
+    fields = _KeepMissing(row)
+    formatter = string.Formatter()
+    args = {
+        name: formatter.vformat(value, (), fields) if isinstance(value, str) else value
+        for name, value in (defaults or {}).items()
+    }
+    args.update(row)
+    args.update(overrides or {})
+    return args
+
+
+def _format_of(path: str, format: Optional[str]) -> str:
+    if format:
+        return format
+    suffix = Path(path).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    return "lines"
+
+
+def _parse_line(line: str, format: str, line_number: int) -> Optional[Row]:
+    if not line.strip():
+        return None
+    if format == "jsonl":
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as error:
+            raise BatchError(f"Line {line_number} is not valid JSON: {error}")
+        if not isinstance(row, dict):
+            raise BatchError(f"Line {line_number} is not a JSON object.")
+        return row
+    return {"line": line}
+
+
+def file_rows(path: Union[str, Path], format: Optional[str] = None) -> Iterable[Row]:
+    """
+    Yields the rows of a file, one at a time.
+
+    Formats: "csv" (the header names the fields), "jsonl" (one JSON object
+    per line) and "lines" (each non-blank line is a row with a `line`
+    field). By default, the format follows the file's suffix.
+    """
+    format = _format_of(str(path), format)
+    with open(path, newline="", encoding="utf-8") as f:
+        if format == "csv":
+            yield from csv.DictReader(f)
+            return
+        for line_number, line in enumerate(f, start=1):
+            row = _parse_line(line.rstrip("\r\n"), format, line_number)
+            if row is not None:
+                yield row
+
+
+async def command_rows(command: str, format: str = "lines") -> AsyncIterator[Row]:
+    """
+    Yields rows from the standard output of a shell command as it prints
+    them. CSV output must have one record per line, after a header line.
+    """
+    process = await asyncio.create_subprocess_shell(
+        command, stdout=asyncio.subprocess.PIPE
+    )
+    header: Optional[List[str]] = None
+    try:
+        line_number = 0
+        async for raw in process.stdout:
+            line_number += 1
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            if format != "csv":
+                row = _parse_line(line, format, line_number)
+            elif not line.strip():
+                row = None
+            elif header is None:
+                header = next(csv.reader([line]))
+                row = None
+            else:
+                row = dict(zip(header, next(csv.reader([line]))))
+            if row is not None:
+                yield row
+    finally:
+        if process.returncode is None:
+            # Stop a producer that is still running when the batch ends early.
+            if process.stdout.at_eof():
+                await process.wait()
+            else:
+                process.kill()
+                await process.wait()
+    if process.returncode:
+        raise BatchError(f"Row command exited with code {process.returncode}.")
+
+
+def batch_rows(spec: BatchSpec) -> Union[Iterable[Row], AsyncIterable[Row]]:
+    """The rows described by `spec`."""
+    if spec.command is not None:
+        return command_rows(spec.command, spec.format or "lines")
+    return file_rows(spec.source, spec.format)
+
+
+async def _aiter_rows(rows: Union[Iterable[Row], AsyncIterable[Row]]):
+    if hasattr(rows, "__aiter__"):
+        async for row in rows:
+            yield row
+    else:
+        for row in rows:
+            yield row
+
+
+def _failure_of(result: Any) -> Optional[str]:
+    """Commands and scripts report failure with a non-zero exit code."""
+    if isinstance(result, int) and not isinstance(result, bool) and result != 0:
+        return f"exit code {result}"
+    return None
+
+
+async def _default_call(item: MenuItem, context: Dict[str, Any], args: Dict[str, Any]):
+    return await call_action(
+        item.action, context=context, args=args, in_thread=item.run_in_thread
+    )
+
+
+async def run_batch(
+    item: MenuItem,
+    rows: Union[Iterable[Row], AsyncIterable[Row]],
+    context: Optional[Dict[str, Any]] = None,
+    overrides: Optional[Dict[str, Any]] = None,
+    concurrency: int = 4,
+    retries: int = 0,
+    retry_delay: float = 1.0,
+    on_result: Optional[Callable[[RowResult], None]] = None,
+    call: Optional[Callable[[MenuItem, dict, dict], Awaitable[Any]]] = None,
+) -> BatchSummary:
+    """
+    Runs `item.action` once per row, with at most `concurrency` rows at once.
+
+    Rows are pulled from `rows` only as workers become free. A row whose
+    action raises or returns a non-zero exit code is retried up to `retries`
+    times, waiting `retry_delay` seconds (doubling each time) in between.
+
+    Args:
+        item: The item whose action to run; see `row_args` for its arguments.
+        rows: The argument rows, e.g. from `batch_rows`.
+        context: The action context. Each row's action gets a copy with its
+            own `progress` handle and `batch_row` (the row's index); the
+            batch reports the rows done on `context["progress"]`.
+        overrides: Arguments that take precedence over every row.
+        on_result: Called with each row's result as soon as it is known.
+        call: Runs the action; defaults to `call_action`.
+
+    Returns:
+        A BatchSummary. Only the first MAX_FAILURES_KEPT failures are kept.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    call = call or _default_call
+    context = context or {}
+    progress: Optional[ProgressHandle] = context.get("progress")
+    summary = BatchSummary()
+    queue: "asyncio.Queue[Optional[tuple]]" = asyncio.Queue(maxsize=concurrency)
+    started = time.perf_counter()
+
+    async def produce():
+        index = 0
+        try:
+            async for row in _aiter_rows(rows):
+                await queue.put((index, row))
+                index += 1
+                if progress is not None:
+                    progress.message = f"{index} rows read"
+        except (BatchError, OSError, csv.Error, UnicodeDecodeError) as error:
+            summary.source_error = str(error)
+        finally:
+            for _ in range(concurrency):
+                await queue.put(None)
+
+    async def run_row(index: int, row: Row) -> RowResult:
+        args = row_args(item.args, row, overrides)
+        row_started = time.perf_counter()
+        attempt = 0
+        while True:
+            attempt += 1
+            row_context = {**context, "progress": ProgressHandle(), "batch_row": index}
+            exit_code = None
+            try:
+                result = await call(item, row_context, args)
+                error = _failure_of(result)
+                if isinstance(result, int) and not isinstance(result, bool):
+                    exit_code = result
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            if error is None or attempt > retries:
+                break
+            summary.retries += 1
+            await asyncio.sleep(retry_delay * 2 ** (attempt - 1))
+        return RowResult(
+            index=index,
+            args=args,
+            ok=error is None,
+            attempts=attempt,
+            exit_code=exit_code,
+            error=error,
+            duration=time.perf_counter() - row_started,
+        )
+
+    async def work():
+        while True:
+            job = await queue.get()
+            if job is None:
+                return
+            result = await run_row(*job)
+            summary.total += 1
+            if result.ok:
+                summary.succeeded += 1
+            else:
+                summary.failed += 1
+                if len(summary.failures) < MAX_FAILURES_KEPT:
+                    summary.failures.append(result)
+            if progress is not None:
+                progress.advance()
+            if on_result is not None:
+                on_result(result)
+
+    tasks = [asyncio.ensure_future(produce())]
+    tasks += [asyncio.ensure_future(work()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+    summary.failures.sort(key=lambda failure: failure.index)
+    summary.duration = time.perf_counter() - started
+    return summary
+
+
+def format_summary(summary: BatchSummary) -> str:
+    """A short human-readable report of a batch."""
+    lines = [
+        f"Batch finished in {summary.duration:.1f}s: {summary.total} rows, "
+        f"{summary.succeeded} succeeded, {summary.failed} failed "
+        f"({summary.retries} retries)."
+    ]
+    for failure in summary.failures:
+        lines.append(f"  row {failure.index}: {failure.error}  {failure.args}")
+    if summary.failed > len(summary.failures):
+        lines.append(f"  ... and {summary.failed - len(summary.failures)} more")
+    if summary.source_error:
+        lines.append(f"Stopped reading rows: {summary.source_error}")
+    return "\n".join(lines)
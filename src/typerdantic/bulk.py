@@ -0,0 +1,135 @@
+# src/typerdantic/bulk.py
+
+"""
+Runs the actions of several marked menu items at once.
+
+In a running app, Space marks the highlighted item, Shift-Up/Down mark a
+range, `*` marks every item the filter (`/`) shows, and `x` runs the marked
+items concurrently, at most `TyperdanticApp.bulk_concurrency` at a time.
+Whatever the actions print is captured per item, and the results are shown
+together in a BulkResultsMenu instead of one "Press Enter to continue..."
+prompt per item. Selecting a result shows its output.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+from pydantic import BaseModel
+
+from .base import TyperdanticMenu
+from .capture import capture_output, routed_stdout
+from .models import MenuItem
+
+
+class ItemResult(BaseModel):
+    """The outcome of one item of a bulk run."""
+
+    name: str
+    description: str
+    ok: bool
+    exit_code: Optional[int] = None
+    error: Optional[str] = None
+    output: str = ""
+    duration: float
+
+
+async def run_items(
+    items: List[Tuple[str, MenuItem]],
+    run: Callable[[MenuItem], Awaitable[Any]],
+    concurrency: int = 8,
+    on_result: Optional[Callable[[ItemResult], None]] = None,
+) -> List[ItemResult]:
+    """
+    Runs `run(item)` for every item, with at most `concurrency` at once.
+
+    An item fails when `run` raises or returns a non-zero exit code. Its
+    printed output is captured into the result.
+
+    Returns:
+        The results, in the order of `items`.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1.")
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(name: str, item: MenuItem) -> ItemResult:
+        async with semaphore:
+            started = time.perf_counter()
+            exit_code = error = None
+            with capture_output() as output:
+                try:
+                    result = await run(item)
+                    if isinstance(result, int) and not isinstance(result, bool):
+                        exit_code = result
+                        if result != 0:
+                            error = f"exit code {result}"
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+            item_result = ItemResult(
+                name=name,
+                description=item.description,
+                ok=error is None,
+                exit_code=exit_code,
+                error=error,
+                output=output.getvalue(),
+                duration=time.perf_counter() - started,
+            )
+        if on_result is not None:
+            on_result(item_result)
+        return item_result
+
+    with routed_stdout():
+        return list(await asyncio.gather(*(run_one(n, i) for n, i in items)))
+
+
+def _show_output(result: ItemResult) -> Callable[[dict, dict], None]:
+    def show(context: dict, args: dict):
+        print(f"\n{result.description}")
+        print(result.output.rstrip() or "(no output)")
+        if result.error:
+            print(f"Failed: {result.error}")
+
+    return show
+
+
+class BulkResultsMenu(TyperdanticMenu):
+    """Results"""
+
+    record_history = False
+
+    results: List[ItemResult] = []
+
+    def summary(self) -> str:
+        failed = sum(1 for result in self.results if not result.ok)
+        return (
+            f"{len(self.results)} items: "
+            f"{len(self.results) - failed} succeeded, {failed} failed"
+        )
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        # Failures first, each group in menu order.
+        ordered = sorted(self.results, key=lambda result: result.ok)
+        items = []
+        for result in ordered:
+            status = "ok" if result.ok else f"FAILED ({result.error})"
+            items.append(
+                (
+                    result.name,
+                    MenuItem(
+                        description=(
+                            f"{result.description}: {status}"
+                            f" [{result.duration:.1f}s]"
+                        ),
+                        action=_show_output(result),
+                        invalidates=[],
+                    ),
+                )
+            )
+        items.append(("back", MenuItem(description="Back", is_quit=True)))
+        return items
+
+    def get_display_fragments(self):
+        fragments = super().get_display_fragments()
+        fragments[0] = ("class:title", f"--- {self.summary()} ---\n")
+        return fragments
@@ -0,0 +1,359 @@
+# src/typerdantic/cache.py
+
+"""
+An app-scoped memoization layer for data that menus are built from.
+
+Several menus often need the same data (host lists, project lists, ...).
+Wrap the helper that fetches it with `cached`, and every menu of the app
+shares one copy until it expires or an action invalidates it:
+
+    @cached(ttl=60, tags=["hosts"])
+    def load_hosts(app) -> List[str]:
+        return inventory.fetch_hosts()
+
+    class HostMenu(TyperdanticMenu):
+        def get_items(self):
+            return [(h, MenuItem(description=h)) for h in load_hosts(self.app)]
+
+Actions find the cache in `context["cache"]`, and `app.invalidate_data(keys)`
+also drops the entries tagged with those keys.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from .metrics import get_active_metrics
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class CacheStats:
+    """Counters describing how well an AppCache is doing."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "tags")
+
+    def __init__(self, value: Any, expires_at: Optional[float], tags: frozenset):
+        self.value = value
+        self.expires_at = expires_at
+        self.tags = tags
+
+
+class _Flight:
+    """A load in progress in some thread, awaited by concurrent callers."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class AppCache:
+    """
+    A thread-safe cache with per-entry TTL, LRU eviction and tags.
+
+    Concurrent loads of the same key are coalesced: one caller runs the
+    loader while the others wait for its result ("single flight").
+
+    Args:
+        max_entries: Least recently used entries are evicted beyond this.
+        default_ttl: Seconds an entry lives unless `ttl` is given when it is
+            stored. None means entries only leave by eviction or invalidation.
+        clock: Returns the current time in seconds (for tests).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        default_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._async_flights: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        # Bumped by every invalidation, so that a load that started before
+        # an invalidation does not store data that may already be stale.
+        self._generation = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._lookup(key, count=False) is not _MISSING
+
+    def _lookup(self, key: Hashable, count: bool = True) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at is not None:
+                if self.clock() >= entry.expires_at:
+                    del self._entries[key]
+                    self.stats.expirations += 1
+                    entry = None
+            if entry is None:
+                if count:
+                    self._record("miss")
+                return _MISSING
+            self._entries.move_to_end(key)
+            if count:
+                self._record("hit")
+            return entry.value
+
+    def _record(self, result: str):
+        if result == "hit":
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+        metrics = get_active_metrics()
+        if metrics:
+            metrics.inc("typerdantic_cache_requests_total", result=result)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ):
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = self.clock() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = _Entry(value, expires_at, frozenset(tags))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], T],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> T:
+        """
+        Returns the cached value of `key`, calling `loader()` to fill it on a
+        miss. Threads asking for a key that is being loaded wait for that load
+        instead of starting their own.
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                generation = self._generation
+            else:
+                self.stats.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+            self._store(key, flight.value, ttl, tags, generation)
+            return flight.value
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+
+    async def aget_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[T]],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> T:
+        """Like `get_or_load`, for an async loader on the running event loop."""
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return value
+
+        future = self._async_flights.get(key)
+        if future is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_flights[key] = future
+        generation = self._generation
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark the exception as retrieved if nobody else was waiting.
+            future.exception()
+            raise
+        else:
+            self._store(key, value, ttl, tags, generation)
+            future.set_result(value)
+            return value
+        finally:
+            del self._async_flights[key]
+
+    def _store(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: Optional[float],
+        tags: Iterable[str],
+        generation: int,
+    ):
+        with self._lock:
+            if generation == self._generation:
+                self.set(key, value, ttl=ttl, tags=tags)
+
+    def invalidate(self, key: Hashable = _MISSING, tag: Optional[str] = None) -> int:
+        """
+        Drops the entry for `key`, or every entry tagged with `tag`. Returns
+        the number of entries dropped.
+        """
+        with self._lock:
+            if key is not _MISSING:
+                self._generation += 1
+                return 1 if self._entries.pop(key, None) is not None else 0
+            if tag is not None:
+                return self.invalidate_tags([tag])
+        return 0
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        tags = set(tags)
+        with self._lock:
+            self._generation += 1
+            stale = [k for k, entry in self._entries.items() if entry.tags & tags]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+def _cache_of(owner: Any) -> AppCache:
+    cache = getattr(owner, "cache", None)
+    if cache is None:
+        cache = getattr(getattr(owner, "app", None), "cache", None)
+    if not isinstance(cache, AppCache):
+        raise TypeError(
+            "@cached functions must take a TyperdanticApp or a menu as their "
+            f"first argument, got {type(owner).__name__}."
+        )
+    return cache
+
+
+def cached(
+    ttl: Optional[float] = None,
+    tags: Iterable[str] = (),
+    key: Optional[Callable[..., Hashable]] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Memoizes a data helper in the app's cache.
+
+    The helper's first argument must be the app or a menu; it selects the
+    cache but is not part of the key, so every menu shares the result. The
+    remaining arguments form the key and must be hashable, unless `key`
+    computes one from them. Async helpers are supported.
+
+    Args:
+        ttl: Seconds the result stays fresh. Defaults to the cache's TTL.
+        tags: Tags to invalidate the result by, usually the data keys that
+            menus declare in `depends_on`.
+        key: Builds the cache key from the arguments after the first.
+    """
+    tags = tuple(tags)
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+            if key is not None:
+                return (name, key(*args, **kwargs))
+            return (name, args, tuple(sorted(kwargs.items())))
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(owner: Any, *args: Any, **kwargs: Any) -> Any:
+                return await _cache_of(owner).aget_or_load(
+                    make_key(args, kwargs),
+                    lambda: func(owner, *args, **kwargs),
+                    ttl=ttl,
+                    tags=tags,
+                )
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(owner: Any, *args: Any, **kwargs: Any) -> Any:
+            return _cache_of(owner).get_or_load(
+                make_key(args, kwargs),
+                lambda: func(owner, *args, **kwargs),
+                ttl=ttl,
+                tags=tags,
+            )
+
+        return wrapper
+
+    return decorator
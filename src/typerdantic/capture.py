@@ -0,0 +1,91 @@
+# src/typerdantic/capture.py
+
+"""
+Per-task capture of what actions print.
+
+While `routed_stdout()` is active, sys.stdout sends each write to the
+buffer of the innermost `capture_output()` block of the task (or thread,
+when it was started with a copy of the task's context) that made it, and
+everything else to the real stdout:
+
+    with routed_stdout(), capture_output() as output:
+        await call_action(item.action, context=context, args=args)
+    print(output.getvalue())
+
+A capture with `echo=True` also passes the text on, to the enclosing
+capture or to the terminal, so it records output without hiding it.
+"""
+
+import contextlib
+import contextvars
+import io
+import sys
+from typing import Any, Iterator, NamedTuple, Optional, TextIO
+
+
+class _Capture(NamedTuple):
+    buffer: io.StringIO
+    echo: bool
+    parent: Optional["_Capture"]
+
+
+# The innermost capture of the current task, if any.
+_current_capture: contextvars.ContextVar[Optional[_Capture]] = contextvars.ContextVar(
+    "typerdantic_current_capture", default=None
+)
+
+_router_users = 0
+_original_stdout: Optional[TextIO] = None
+
+
+class _RoutedStdout:
+    """Sends writes to the current task's captures, or to `stream`."""
+
+    def __init__(self, stream: TextIO):
+        self._stream = stream
+
+    def write(self, text: str) -> int:
+        capture = _current_capture.get()
+        while capture is not None:
+            capture.buffer.write(text)
+            if not capture.echo:
+                return len(text)
+            capture = capture.parent
+        return self._stream.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+@contextlib.contextmanager
+def routed_stdout() -> Iterator[None]:
+    """
+    Routes sys.stdout through the captures while the block runs. Blocks may
+    overlap (e.g. in concurrent tasks); stdout is restored after the last.
+    """
+    global _router_users, _original_stdout
+    if _router_users == 0:
+        _original_stdout = sys.stdout
+        sys.stdout = _RoutedStdout(_original_stdout)
+    _router_users += 1
+    try:
+        yield
+    finally:
+        _router_users -= 1
+        if _router_users == 0:
+            sys.stdout = _original_stdout
+            _original_stdout = None
+
+
+@contextlib.contextmanager
+def capture_output(echo: bool = False) -> Iterator[io.StringIO]:
+    """Captures what the current task prints inside `routed_stdout`."""
+    buffer = io.StringIO()
+    token = _current_capture.set(_Capture(buffer, echo, _current_capture.get()))
+    try:
+        yield buffer
+    finally:
+        _current_capture.reset(token)
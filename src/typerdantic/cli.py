@@ -0,0 +1,422 @@
+# src/typerdantic/cli.py
+
+"""
+Generates a Click command-line from a TyperdanticApp's menu tree.
+
+Every menu becomes a Click group and every actionable item a command, so the
+same actions can be run from scripts, cron, or CI without starting the
+full-screen application:
+
+    app = TyperdanticApp(main_menu=MainMenu)
+    app.register_menu("deploy", DeployMenu)
+    cli = build_cli(app, name="mytool")
+
+    # $ mytool deploy staging --version 1.2
+    # $ mytool                # no subcommand: starts the interactive TUI
+    # $ mytool --profile prof deploy staging --version 1.2
+    # $ mytool deploy staging --batch versions.csv --concurrency 8
+"""
+
+import asyncio
+import contextlib
+import functools
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+import click
+from click.core import ParameterSource
+
+from .app import TyperdanticApp
+from .base import TyperdanticMenu
+from .executors import call_action
+from .models import BatchSpec, MenuItem
+from .profiling import Profiler
+from .progress import ProgressHandle
+
+
+def command_name(item_name: str) -> str:
+    """Converts a menu item key (e.g. 'deploy_staging') into a command name."""
+    return re.sub(r"[\s_]+", "-", item_name.strip()).strip("-").lower()
+
+
+def _menu_help(menu_class: type) -> Optional[str]:
+    doc = (menu_class.__doc__ or "").strip()
+    return doc.splitlines()[0] if doc else None
+
+
+def _item_params(item: MenuItem) -> Tuple[List[click.Option], Dict[str, str]]:
+    """
+    Builds Click options for an item's arguments.
+
+    Pre-defined `args` become optional options whose default is the
+    configured value, typed like it when it is a bool, int or float. Like in
+    the app, `prompt_args` are strings; they become options that are required
+    unless the spec (or `args`) has a default or the item runs as a batch (its
+    rows then provide them). Returns the options and a map from option name
+    to argument name.
+    """
+    params: List[click.Option] = []
+    arg_names: Dict[str, str] = {}
+    args = item.args or {}
+
+    def add_option(
+        arg_name: str,
+        default: Any,
+        help_text: Optional[str],
+        option_type: Any = click.STRING,
+        required: bool = False,
+    ):
+        flag = "--" + command_name(arg_name)
+        param_name = re.sub(r"\W", "_", arg_name)
+        if not param_name.isidentifier():
+            param_name = f"arg_{len(arg_names)}"
+        arg_names[param_name] = arg_name
+        params.append(
+            click.Option(
+                [flag, param_name],
+                type=option_type,
+                default=default,
+                required=required,
+                show_default=default is not None,
+                help=help_text,
+            )
+        )
+
+    for arg_name, value in args.items():
+        if item.prompt_args and any(s.name == arg_name for s in item.prompt_args):
+            continue
+        typed = isinstance(value, (bool, int, float))
+        add_option(arg_name, value, None, type(value) if typed else click.STRING)
+
+    for spec in item.prompt_args or []:
+        default = spec.default
+        if default is None:
+            default = args.get(spec.name)
+        add_option(
+            spec.name,
+            None if default is None else str(default),
+            spec.prompt,
+            required=(default is None and spec.name not in args and item.batch is None),
+        )
+
+    return params, arg_names
+
+
+def _relax_required(ctx: click.Context, param: click.Parameter, value: Any) -> Any:
+    # Eager: runs before the other options are checked, so that rows of the
+    # batch can provide the arguments that are otherwise required.
+    if value is not None:
+        for other in ctx.command.params:
+            other.required = False
+    return value
+
+
+def _batch_params() -> List[click.Option]:
+    """Options that run an action once per row of a file or command output."""
+    return [
+        click.Option(
+            ["--batch", "batch_source"],
+            type=click.Path(exists=True, dir_okay=False),
+            is_eager=True,
+            callback=_relax_required,
+            help="Run once per row of this CSV, JSONL or text file.",
+        ),
+        click.Option(
+            ["--batch-command"],
+            is_eager=True,
+            callback=_relax_required,
+            help="Run once per line printed by this shell command.",
+        ),
+        click.Option(
+            ["--batch-format"],
+            type=click.Choice(["csv", "jsonl", "lines"]),
+            help="Row format (default: from the file suffix, or lines).",
+        ),
+        click.Option(
+            ["--concurrency"],
+            type=click.IntRange(min=1),
+            help="Rows to run at once in a batch (default: 4).",
+        ),
+        click.Option(
+            ["--retries"],
+            type=click.IntRange(min=0),
+            help="Times to retry a failed row of a batch (default: 0).",
+        ),
+    ]
+
+
+def _batch_spec(item: MenuItem, options: Dict[str, Any]) -> Optional[BatchSpec]:
+    """The batch to run: the item's own, updated by the command-line options."""
+    source = options.pop("batch_source")
+    command = options.pop("batch_command")
+    settings = {
+        name: value
+        for name in ("batch_format", "concurrency", "retries")
+        if (value := options.pop(name)) is not None
+    }
+    if source is None and command is None and item.batch is None:
+        return None
+    spec = item.batch.model_dump() if item.batch else {}
+    if source is not None or command is not None:
+        spec.update(source=source, command=command)
+    if "batch_format" in settings:
+        settings["format"] = settings.pop("batch_format")
+    spec.update(settings)
+    try:
+        return BatchSpec(**spec)
+    except ValueError as error:
+        raise click.UsageError(str(error))
+
+
+class MenuGroup(click.Group):
+    """
+    A Click group whose subcommands are the items of a registered menu.
+
+    The menu is only instantiated when Click asks for its commands, so
+    invoking `mytool deploy staging` builds just the menus along that path,
+    and cyclic `target_menu` links are never walked eagerly.
+    """
+
+    def __init__(self, app: TyperdanticApp, menu_name: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.app = app
+        self.menu_name = menu_name
+        self._menu: Optional[TyperdanticMenu] = None
+        self._items: Optional[Dict[str, MenuItem]] = None
+
+    @property
+    def menu(self) -> TyperdanticMenu:
+        if self._menu is None:
+            if not self.app.has_menu(self.menu_name):
+                raise click.ClickException(
+                    f"Menu '{self.menu_name}' is not registered."
+                )
+            try:
+                self._menu = self.app.build_menu(self.menu_name)
+            except ValueError as error:
+                raise click.ClickException(str(error))
+        return self._menu
+
+    def _get_items(self) -> Dict[str, MenuItem]:
+        if self._items is None:
+            self._items = {}
+            for name, item in self.menu._menu_items:
+                if item.is_quit or not (item.action or item.target_menu):
+                    continue
+                self._items.setdefault(command_name(name), item)
+        return self._items
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return list(self._get_items())
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        item = self._get_items().get(cmd_name)
+        if item is None:
+            return None
+
+        params, arg_names = _item_params(item) if item.action else ([], {})
+        if item.action:
+            params += _batch_params()
+        callback = _action_callback(self.app, self.menu, item, arg_names)
+
+        if item.target_menu:
+            return MenuGroup(
+                self.app,
+                item.target_menu,
+                name=cmd_name,
+                help=item.description,
+                params=params,
+                callback=callback if item.action else None,
+            )
+        return click.Command(
+            name=cmd_name, help=item.description, params=params, callback=callback
+        )
+
+
+async def _call(
+    app: TyperdanticApp,
+    menu: TyperdanticMenu,
+    item: MenuItem,
+    context: Dict[str, Any],
+    args: Dict[str, Any],
+) -> Any:
+    """Runs `item.action`, recording the run if the app keeps a history."""
+    call = call_action(
+        item.action, context=context, args=args, in_thread=item.run_in_thread
+    )
+    if app.history is None or not menu.record_history:
+        return await call
+    menu_name = app.menu_name_of(menu) or type(menu).__name__
+    with app.history.track(menu_name, item, args) as run:
+        run.result = await call
+    return run.result
+
+
+# Where an option's value counts as given by the user.
+_GIVEN_SOURCES = (ParameterSource.COMMANDLINE, ParameterSource.ENVIRONMENT)
+
+
+def _action_callback(
+    app: TyperdanticApp,
+    menu: TyperdanticMenu,
+    item: MenuItem,
+    arg_names: Dict[str, str],
+):
+    """Returns a Click callback that runs `item.action` through the executor."""
+
+    def callback(**options: Any):
+        batch = _batch_spec(item, options)
+        # Only values given on the command line (or in the environment)
+        # override the rows of a batch and the configured `args`, which keep
+        # their original values otherwise.
+        ctx = click.get_current_context()
+        given = {
+            arg_names[param_name]: value
+            for param_name, value in options.items()
+            if value is not None
+            and ctx.get_parameter_source(param_name) in _GIVEN_SOURCES
+        }
+        if batch is not None:
+            _run_batch_command(app, menu, item, batch, given)
+            return
+        final_args = item.args.copy() if item.args else {}
+        # Prompted arguments that weren't given take their default, as in the app.
+        prompted = {spec.name for spec in item.prompt_args or ()}
+        final_args.update(
+            (arg_names[param_name], value)
+            for param_name, value in options.items()
+            if value is not None and arg_names[param_name] in prompted
+        )
+        final_args.update(given)
+
+        context = {
+            "app": app,
+            "menu": menu,
+            "progress": ProgressHandle(),
+            "cache": app.cache,
+        }
+        section = contextlib.nullcontext()
+        if app.profiler:
+            label = f"{type(menu).__name__}.action.{item.description}"
+            section = app.profiler.section(label)
+        with section:
+            result = asyncio.run(_call(app, menu, item, context, final_args))
+        if app.history is not None:
+            app.history.flush()
+        # Command and script actions return their exit code; propagate failures.
+        if isinstance(result, int) and not isinstance(result, bool) and result != 0:
+            raise click.exceptions.Exit(result)
+
+    return callback
+
+
+def _run_batch_command(
+    app: TyperdanticApp,
+    menu: TyperdanticMenu,
+    item: MenuItem,
+    batch: BatchSpec,
+    overrides: Dict[str, Any],
+):
+    """Runs `item` over the rows of `batch`; `overrides` win over the rows."""
+    from .batch import batch_rows, format_summary, run_batch
+
+    context = {
+        "app": app,
+        "menu": menu,
+        "progress": ProgressHandle(),
+        "cache": app.cache,
+    }
+    summary = asyncio.run(
+        run_batch(
+            item,
+            batch_rows(batch),
+            context=context,
+            overrides=overrides,
+            concurrency=batch.concurrency,
+            retries=batch.retries,
+            retry_delay=batch.retry_delay,
+            call=functools.partial(_call, app, menu),
+        )
+    )
+    if app.history is not None:
+        app.history.flush()
+    click.echo(format_summary(summary))
+    if not summary.ok:
+        raise click.exceptions.Exit(1)
+
+
+def build_cli(
+    app: TyperdanticApp, name: Optional[str] = None, help: Optional[str] = None
+) -> click.Group:
+    """
+    Builds a Click group hierarchy mirroring the app's menus.
+
+    Items with a `target_menu` become subgroups, items with an `action` become
+    commands, and their `args`/`prompt_args` become options. Invoking the
+    group without a subcommand runs the interactive application.
+
+    The root group accepts `--profile DIR` (and `--trace-memory`) to write
+    profiling reports for either the interactive session or the command run,
+    and `--record FILE` to record an interactive session for replay.
+
+    Args:
+        app: The application whose `menu_registry` defines the tree.
+        name: The program name shown in help output.
+        help: Help text for the root group. Defaults to the main menu's title.
+
+    Returns:
+        A Click group ready to be called, e.g. `build_cli(app)()`.
+    """
+
+    @click.pass_context
+    def run_root(
+        ctx: click.Context,
+        profile_dir: Optional[str],
+        trace_memory: bool,
+        record_path: Optional[str],
+    ):
+        if ctx.invoked_subcommand is None:
+            asyncio.run(
+                app.run(
+                    profile_dir=profile_dir,
+                    trace_memory=trace_memory,
+                    record_path=record_path,
+                )
+            )
+        elif profile_dir:
+            profiler = Profiler(profile_dir, trace_memory=trace_memory)
+            profiler.start()
+            app.profiler = profiler
+
+            def finish_profiling():
+                profiler.write_reports()
+                profiler.stop()
+                app.profiler = None
+
+            ctx.call_on_close(finish_profiling)
+
+    return MenuGroup(
+        app,
+        "main",
+        name=name,
+        help=help or _menu_help(app.menu_registry["main"]),
+        invoke_without_command=True,
+        callback=run_root,
+        params=[
+            click.Option(
+                ["--profile", "profile_dir"],
+                type=click.Path(file_okay=False),
+                help="Write cProfile reports for this run to DIR.",
+            ),
+            click.Option(
+                ["--trace-memory"],
+                is_flag=True,
+                help="With --profile, also report top allocation sites.",
+            ),
+            click.Option(
+                ["--record", "record_path"],
+                type=click.Path(dir_okay=False),
+                help="Record the interactive session to FILE for replay.",
+            ),
+        ],
+    )
@@ -0,0 +1,210 @@
+# src/typerdantic/completion.py
+
+"""
+Completion of prompted arguments from lists, commands, globs or functions.
+
+Give an ArgumentSpec a CompletionSpec, and its field in the argument form
+(or its terminal prompt) completes the value while it is typed:
+
+    ArgumentSpec(
+        name="host",
+        prompt="Host",
+        completions=CompletionSpec(command="cat /etc/hosts.list", ttl=300),
+    )
+
+Choices are loaded in the background when the form opens, at most once at
+a time per source, and kept in the app's cache for `ttl` seconds under the
+"completions" tag. They are matched case-insensitively anywhere in the
+text, prefix matches first. Each keystroke that extends the text only
+searches the matches of the previous one, so typing stays fast with tens
+of thousands of choices.
+"""
+
+import asyncio
+import glob
+import inspect
+from typing import (
+    Any,
+    AsyncGenerator,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+from .cache import AppCache
+from .executors import run_command
+from .models import CompletionSpec
+from .registry import get_action
+
+# The cache tag of loaded choices, e.g. for app.cache.invalidate(tag=...).
+COMPLETIONS_TAG = "completions"
+
+
+class CandidateIndex:
+    """
+    Case-insensitive substring search over a list of choices, narrowing the
+    previous matches when the query extends the previous query.
+    """
+
+    def __init__(self, candidates: Iterable[str]):
+        # Duplicates are dropped; the first occurrence keeps its place.
+        self.candidates: List[str] = list(dict.fromkeys(candidates))
+        self._folded = [candidate.casefold() for candidate in self.candidates]
+        self._last_query: Optional[str] = None
+        self._last_matches: Sequence[int] = ()
+
+    def __len__(self) -> int:
+        return len(self.candidates)
+
+    def _matching(self, query: str) -> Sequence[int]:
+        if not query:
+            return range(len(self.candidates))
+        last = self._last_query
+        if last is not None and query.startswith(last):
+            pool = self._last_matches
+        else:
+            pool = range(len(self.candidates))
+        folded = self._folded
+        matches = [i for i in pool if query in folded[i]]
+        self._last_query, self._last_matches = query, matches
+        return matches
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[str]:
+        """The choices containing `query`, those starting with it first."""
+        query = query.casefold()
+        matches = self._matching(query)
+        folded = self._folded
+        prefixed = [i for i in matches if folded[i].startswith(query)]
+        if len(prefixed) < len(matches):
+            first = set(prefixed)
+            prefixed += [i for i in matches if i not in first]
+        if limit is not None:
+            prefixed = prefixed[:limit]
+        return [self.candidates[i] for i in prefixed]
+
+
+def _source_key(spec: CompletionSpec) -> Hashable:
+    if spec.command is not None:
+        return ("command", spec.command)
+    if spec.glob is not None:
+        return ("glob", spec.glob)
+    source = spec.source
+    return ("source", source if isinstance(source, str) else id(source))
+
+
+def _as_strings(values: Any) -> List[str]:
+    return [str(value) for value in values or ()]
+
+
+async def load_choices(spec: CompletionSpec) -> List[str]:
+    """Loads the choices of `spec` from its source."""
+    if spec.choices is not None:
+        return list(spec.choices)
+    loop = asyncio.get_running_loop()
+    if spec.command is not None:
+        _, stdout, _ = await run_command(spec.command)
+        return [line.strip() for line in stdout.splitlines() if line.strip()]
+    if spec.glob is not None:
+        pattern = spec.glob
+        return await loop.run_in_executor(
+            None, lambda: sorted(glob.iglob(pattern, recursive=True))
+        )
+    source = spec.source
+    if isinstance(source, str):
+        function = get_action(source)
+        if function is None:
+            raise ValueError(f"No completion source registered as '{source}'.")
+        source = function
+    if inspect.iscoroutinefunction(source):
+        return _as_strings(await source())
+    return _as_strings(await loop.run_in_executor(None, source))
+
+
+class ArgumentCompleter(Completer):
+    """
+    Completes one argument from its CompletionSpec, loading the choices
+    through `cache` (see the module docs).
+
+    Args:
+        spec: Where the choices come from.
+        cache: Where loaded choices are kept (usually `app.cache`).
+        limit: The most completions shown at once.
+    """
+
+    def __init__(self, spec: CompletionSpec, cache: AppCache, limit: int = 200):
+        self.spec = spec
+        self.cache = cache
+        self.limit = limit
+        self._static: Optional[CandidateIndex] = None
+        if spec.choices is not None:
+            if spec._index is None:
+                spec._index = CandidateIndex(spec.choices)
+            self._static = spec._index
+        self._key = ("typerdantic.completions", _source_key(spec))
+        self._loading: Optional["asyncio.Future[CandidateIndex]"] = None
+
+    @property
+    def index(self) -> Optional[CandidateIndex]:
+        """The loaded choices, or None while they are not loaded."""
+        if self._static is not None:
+            return self._static
+        return self.cache.get(self._key)
+
+    async def load(self) -> CandidateIndex:
+        """The choices, loaded from the source unless they are cached."""
+        if self._static is not None:
+            return self._static
+
+        async def build() -> CandidateIndex:
+            return CandidateIndex(await load_choices(self.spec))
+
+        return await self.cache.aget_or_load(
+            self._key, build, ttl=self.spec.ttl, tags=(COMPLETIONS_TAG,)
+        )
+
+    def prefetch(self):
+        """Starts loading the choices in the background, if they aren't."""
+        if self.index is not None:
+            return
+        if self._loading is None or self._loading.done():
+            self._loading = asyncio.ensure_future(self.load())
+            # A failing source just offers no completions.
+            self._loading.add_done_callback(_ignore_error)
+
+    def _completions(self, index: CandidateIndex, document: Document):
+        text = document.text_before_cursor
+        for choice in index.search(text.strip(), limit=self.limit):
+            if choice != text:
+                yield Completion(choice, start_position=-len(text))
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterator[Completion]:
+        index = self.index
+        if index is None:
+            self.prefetch()
+            return
+        yield from self._completions(index, document)
+
+    async def get_completions_async(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> AsyncGenerator[Completion, None]:
+        index = self.index
+        if index is None:
+            try:
+                index = await self.load()
+            except Exception:
+                return
+        for completion in self._completions(index, document):
+            yield completion
+
+
+def _ignore_error(future: "asyncio.Future[Any]"):
+    if not future.cancelled():
+        future.exception()
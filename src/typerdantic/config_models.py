@@ -1,7 +1,39 @@
 # src/typerdantic/config_models.py
 
-from pydantic import BaseModel, Field
-from typing import Dict, Optional, Any, Union, List
+from pydantic import BaseModel, Field, model_validator
+from typing import Dict, Optional, Any, Literal, Union, List
+
+from .governor import ResourcePolicy
+
+
+class CompletionConfig(BaseModel):
+    """Where the completions of a prompted argument come from."""
+
+    choices: Optional[List[str]] = None
+    command: Optional[str] = Field(
+        default=None, description="A shell command whose output lines are choices."
+    )
+    glob: Optional[str] = Field(
+        default=None, description="A glob pattern of paths, e.g. 'logs/**/*.log'."
+    )
+    source: Optional[str] = Field(
+        default=None,
+        description="The name of a registered function returning the choices.",
+    )
+    ttl: Optional[float] = Field(default=60.0, ge=0)
+
+    @model_validator(mode="after")
+    def _one_source(self) -> "CompletionConfig":
+        sources = (self.choices, self.command, self.glob, self.source)
+        if sum(source is not None for source in sources) != 1:
+            raise ValueError(
+                "Completions need exactly one of 'choices', 'command', 'glob'"
+                " or 'source'."
+            )
+        return self
+
+    class Config:
+        defer_build = True
 
 
 class ArgumentSpec(BaseModel):
@@ -13,6 +45,57 @@ class ArgumentSpec(BaseModel):
         None,
         description="An optional default value if the user enters nothing.",
     )
+    completions: Optional[CompletionConfig] = Field(
+        default=None,
+        description="Where to complete the value from while it is typed.",
+    )
+
+    class Config:
+        # Schemas are built on first validation rather than at import time.
+        defer_build = True
+
+
+class BatchConfig(BaseModel):
+    """Runs the action once per row of a file or of a command's output."""
+
+    source: Optional[str] = Field(
+        default=None, description="A CSV, JSON-lines or text file of rows."
+    )
+    command: Optional[str] = Field(
+        default=None, description="A shell command whose output lines are rows."
+    )
+    format: Optional[Literal["csv", "jsonl", "lines"]] = None
+    concurrency: int = Field(default=4, ge=1)
+    retries: int = Field(default=0, ge=0)
+    retry_delay: float = Field(default=1.0, ge=0)
+
+    @model_validator(mode="after")
+    def _one_source(self) -> "BatchConfig":
+        if (self.source is None) == (self.command is None):
+            raise ValueError("A batch needs exactly one of 'source' or 'command'.")
+        return self
+
+    class Config:
+        defer_build = True
+
+
+class WatchConfig(BaseModel):
+    """Runs the action repeatedly, showing its latest output."""
+
+    interval: Optional[float] = Field(default=2.0, gt=0)
+    paths: Optional[List[str]] = Field(
+        default=None, description="Files whose changes also trigger a run."
+    )
+    max_lines: int = Field(default=500, ge=1)
+
+    @model_validator(mode="after")
+    def _has_trigger(self) -> "WatchConfig":
+        if self.interval is None and not self.paths:
+            raise ValueError("A watch needs an 'interval' or 'paths' to watch.")
+        return self
+
+    class Config:
+        defer_build = True
 
 
 class ActionConfig(BaseModel):
@@ -22,7 +105,7 @@ class ActionConfig(BaseModel):
 
     type: str = Field(
         ...,
-        description="The type of action (e.g., 'internal', 'command', 'script').",
+        description="The type of action (e.g., 'internal', 'command', 'script', 'sql').",
     )
     value: str = Field(
         ...,
@@ -35,6 +118,39 @@ class ActionConfig(BaseModel):
         default=None,
         description="A list of arguments to prompt for at runtime.",
     )
+    progress_pattern: Optional[str] = Field(
+        default=None,
+        description="A regex that reads progress from command or script output.",
+        examples=[r"(?P<percent>\d+)%", r"\[(?P<completed>\d+)/(?P<total>\d+)\]"],
+    )
+    resources: Optional[ResourcePolicy] = Field(
+        default=None,
+        description="Resource limits for command and script actions.",
+        examples=[{"nice": 10, "ionice": "idle", "timeout": 3600}],
+    )
+    batch: Optional[BatchConfig] = Field(
+        default=None,
+        description="Runs the action once per row of arguments.",
+        examples=[{"source": "services.csv", "concurrency": 8, "retries": 2}],
+    )
+    watch: Optional[WatchConfig] = Field(
+        default=None,
+        description="Runs the action repeatedly into a live output pane.",
+        examples=[{"interval": 5}, {"interval": None, "paths": ["queue.db"]}],
+    )
+    database: Optional[str] = Field(
+        default=None,
+        description="For 'sql' actions, the database to query.",
+        examples=["inventory.db", "sqlite:///var/lib/app/state.db"],
+    )
+    page_size: int = Field(
+        default=50,
+        gt=0,
+        description="For 'sql' actions, the rows fetched and shown at a time.",
+    )
+
+    class Config:
+        defer_build = True
 
 
 class MenuItemConfig(BaseModel):
@@ -58,6 +174,17 @@ class MenuItemConfig(BaseModel):
     )
     target_menu: Optional[str] = None
     is_quit: bool = False
+    invalidates: Optional[List[str]] = Field(
+        default=None,
+        description="Data keys the action changes; [] for a read-only action.",
+    )
+    style: Optional[str] = Field(
+        default=None,
+        description="Extra style classes for this item's row, e.g. 'danger'.",
+    )
+
+    class Config:
+        defer_build = True
 
 
 class MenuConfig(BaseModel):
@@ -65,3 +192,20 @@ class MenuConfig(BaseModel):
 
     doc: str = "Typerdantic Menu"
     items: Dict[str, MenuItemConfig]
+    depends_on: Optional[List[str]] = Field(
+        default=None,
+        description="Data keys the menu is built from; None means all.",
+    )
+    style: Optional[str] = Field(
+        default=None,
+        description="Extra style classes for the menu's title and rows.",
+    )
+    params: Optional[List[str]] = Field(
+        default=None,
+        description="Parameter names that make the menu a template, opened "
+        "with a target_menu like 'service_menu(env=prod, svc=api)'.",
+        examples=[["env", "svc"]],
+    )
+
+    class Config:
+        defer_build = True
@@ -0,0 +1,309 @@
+# src/typerdantic/daemon.py
+
+"""
+Daemon mode: a warm process that serves TyperdanticApp sessions over a local
+Unix socket.
+
+Starting a TUI pays for Python startup, pydantic schema building, config
+loading and action registration on every launch. The daemon does that once
+and then gives every client that attaches its own TyperdanticApp, running in
+the daemon's event loop with the client's terminal as input and output, in
+the same application-per-connection model as prompt_toolkit's telnet server.
+
+    # myapp.py
+    def make_app(input, output):
+        app = TyperdanticApp(main_menu=MainMenu, input=input, output=output)
+        app.register_menu("deploy", DeployMenu)
+        return app
+
+    $ python -m typerdantic.daemon myapp:make_app &
+    $ python -m typerdantic.attach
+
+See `typerdantic.attach` for the client and the wire format.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import contextvars
+import importlib
+import json
+import os
+import socket
+import stat
+import sys
+from typing import Any, Callable, Optional, Set, TextIO
+
+from prompt_toolkit.application import create_app_session, get_app_session
+from prompt_toolkit.data_structures import Size
+from prompt_toolkit.input import Input, create_pipe_input
+from prompt_toolkit.output import DummyOutput, Output
+from prompt_toolkit.output.vt100 import Vt100_Output
+
+from .app import TyperdanticApp
+from .attach import default_socket_path
+
+AppFactory = Callable[[Input, Output], TyperdanticApp]
+
+# The terminal of the connection whose task is running, so that actions'
+# print() output reaches the client that ran them.
+_connection_stdout: contextvars.ContextVar[Optional["_ConnectionStdout"]] = (
+    contextvars.ContextVar("typerdantic_connection_stdout", default=None)
+)
+
+
+class _ConnectionStdout:
+    """A text stream that writes to a client connection."""
+
+    def __init__(self, writer: asyncio.StreamWriter, encoding: str = "utf-8"):
+        self._writer = writer
+        self.encoding = encoding
+        self.errors = "replace"
+
+    def write(self, data: str) -> int:
+        if not self._writer.is_closing():
+            self._writer.write(data.encode(self.encoding, errors=self.errors))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+
+class _StdoutRouter:
+    """
+    Replaces sys.stdout while the daemon runs, sending writes made on behalf
+    of a connection to that connection and everything else to the daemon's
+    own stdout.
+    """
+
+    def __init__(self, fallback: TextIO):
+        self.fallback = fallback
+
+    def _target(self):
+        return _connection_stdout.get() or self.fallback
+
+    def write(self, data: str) -> int:
+        return self._target().write(data)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target(), name)
+
+
+class TyperdanticDaemon:
+    """
+    Serves one TyperdanticApp per client connection over a Unix socket.
+
+    Args:
+        app_factory: Builds an app for the given input and output, e.g.
+            `lambda i, o: make_app(input=i, output=o)`. Called once at start
+            to warm up, then once per connection.
+        socket_path: Where to listen. Defaults to a per-user path, see
+            `typerdantic.attach.default_socket_path`.
+        mode: Permissions of the socket file. The default only lets the
+            daemon's user attach; use e.g. 0o660 to share it with a group.
+    """
+
+    def __init__(
+        self,
+        app_factory: AppFactory,
+        socket_path: Optional[str] = None,
+        mode: int = 0o600,
+    ):
+        self.app_factory = app_factory
+        self.socket_path = socket_path or default_socket_path()
+        self.mode = mode
+        self.connections: Set[asyncio.Task] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._router: Optional[_StdoutRouter] = None
+
+    def warm_up(self):
+        """
+        Builds a throwaway app, the schema of every registered menu and the
+        command palette's index, so the first client does not pay for it.
+        """
+        with create_pipe_input() as pipe_input:
+            app = self.app_factory(pipe_input, DummyOutput())
+        app.command_index.sync()
+        for menu_class in app.menu_registry.values():
+            if not menu_class.__pydantic_complete__:
+                menu_class._rebuild_with_app()
+
+    async def start(self):
+        self.warm_up()
+        self._remove_stale_socket()
+        # Create the socket owner-only, so that no other user can connect
+        # before its mode is set.
+        umask = os.umask(0o177)
+        try:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=self.socket_path
+            )
+        finally:
+            os.umask(umask)
+        os.chmod(self.socket_path, self.mode)
+        self._router = _StdoutRouter(sys.stdout)
+        sys.stdout = self._router
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+        # End the sessions first: the server waits for its connections.
+        for task in list(self.connections):
+            task.cancel()
+        if self.connections:
+            await asyncio.gather(*self.connections, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+        if self._router is not None:
+            if sys.stdout is self._router:
+                sys.stdout = self._router.fallback
+            self._router = None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.socket_path)
+
+    def _remove_stale_socket(self):
+        try:
+            mode = os.stat(self.socket_path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            # Connecting to any other file is refused too; never delete it.
+            raise RuntimeError(f"{self.socket_path} exists and is not a socket")
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except ConnectionRefusedError:
+            os.unlink(self.socket_path)
+        else:
+            raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ):
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            line = await reader.readline()
+            if not line:
+                return
+            hello = json.loads(line)
+            await self._run_session(hello, reader, writer)
+        except (ConnectionError, json.JSONDecodeError):
+            pass
+        finally:
+            self.connections.discard(task)
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _run_session(
+        self,
+        hello: dict,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        size = Size(rows=hello.get("rows", 24), columns=hello.get("columns", 80))
+        stdout = _ConnectionStdout(writer)
+        output = Vt100_Output(stdout, lambda: size, term=hello.get("term"))
+
+        with create_pipe_input() as pipe_input:
+            with create_app_session(input=pipe_input, output=output):
+                _connection_stdout.set(stdout)
+                app = self.app_factory(pipe_input, output)
+                run_task = asyncio.ensure_future(app.run())
+
+                async def read_messages():
+                    nonlocal size
+                    while True:
+                        line = await reader.readline()
+                        if not line:
+                            # The client went away; end its session.
+                            run_task.cancel()
+                            return
+                        message = json.loads(line)
+                        if message["type"] == "input":
+                            pipe_input.send_text(message["data"])
+                        elif message["type"] == "resize":
+                            size = Size(
+                                rows=message["rows"], columns=message["columns"]
+                            )
+                            running = get_app_session().app
+                            if running is not None:
+                                running._on_resize()
+
+                read_task = asyncio.ensure_future(read_messages())
+                try:
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await run_task
+                finally:
+                    read_task.cancel()
+                    run_task.cancel()
+                    with contextlib.suppress(asyncio.CancelledError):
+                        await run_task
+                    await asyncio.gather(read_task, return_exceptions=True)
+                    if not writer.is_closing():
+                        await writer.drain()
+
+
+async def serve(
+    app_factory: AppFactory, socket_path: Optional[str] = None, mode: int = 0o600
+):
+    """Runs a TyperdanticDaemon until cancelled."""
+    await TyperdanticDaemon(app_factory, socket_path, mode).serve_forever()
+
+
+def _load_factory(spec: str) -> AppFactory:
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"Expected 'module:factory', got '{spec}'.")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m typerdantic.daemon",
+        description="Serve TyperdanticApp sessions over a Unix socket.",
+    )
+    parser.add_argument(
+        "factory",
+        help="'module:callable' returning a TyperdanticApp for (input, output).",
+    )
+    parser.add_argument(
+        "--socket",
+        default=default_socket_path(),
+        help="The Unix socket to listen on (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--mode",
+        default="600",
+        help="Octal permissions of the socket file (default: %(default)s).",
+    )
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    factory = _load_factory(args.factory)
+    print(f"typerdantic daemon listening on {args.socket}", file=sys.stderr)
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve(factory, args.socket, int(args.mode, 8)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
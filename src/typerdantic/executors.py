@@ -1,40 +1,217 @@
 # src/typerdantic/executors.py
 
 import asyncio
+import contextvars
+import functools
+import os
+import re
 import sys
+import time
 from pathlib import Path
-from typing import Tuple, Dict, Any, Optional
+from typing import Tuple, Dict, Any, Callable, Optional
 
 from . import registry
+from .governor import ResourcePolicy, get_governor, terminate_process_group
+from .metrics import get_active_metrics
+from .progress import progress_line_parser
 
 # --- Action Executor ---
 
 
-async def run_command(command: str) -> Tuple[int, str, str]:
+async def call_action(
+    action: Callable[..., Any],
+    context: Optional[Dict[str, Any]] = None,
+    args: Optional[Dict[str, Any]] = None,
+    in_thread: bool = False,
+) -> Any:
+    """
+    Invokes an action callable with `context` and `args`, awaiting it if it is
+    a coroutine function. Returns whatever the action returns.
+
+    With `in_thread`, a synchronous action runs in the default executor so the
+    event loop (and the UI) stays responsive while it works.
+    """
+    if asyncio.iscoroutinefunction(action):
+        return await action(context=context, args=args)
+    if in_thread:
+        call = functools.partial(action, context=context, args=args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, contextvars.copy_context().run, call)
+    return action(context=context, args=args)
+
+
+async def _read_lines(
+    stream: asyncio.StreamReader, on_line: Callable[[str], None]
+) -> bytes:
+    """
+    Reads `stream` to the end, calling `on_line` for every line as it arrives.
+    Carriage returns also end a line, as progress meters redraw with them.
+    """
+    output = bytearray()
+    pending = b""
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            break
+        output += chunk
+        *lines, pending = re.split(rb"\r\n|\r|\n", pending + chunk)
+        for line in lines:
+            on_line(line.decode("utf-8", errors="ignore"))
+    if pending:
+        on_line(pending.decode("utf-8", errors="ignore"))
+    return bytes(output)
+
+
+async def _spawn(
+    command: str, policy: Optional[ResourcePolicy]
+) -> asyncio.subprocess.Process:
+    pipes = {"stdout": asyncio.subprocess.PIPE, "stderr": asyncio.subprocess.PIPE}
+    if policy is None:
+        return await asyncio.create_subprocess_shell(command, **pipes)
+    prefix = policy.command_prefix()
+    options: Dict[str, Any] = dict(pipes)
+    if policy.needs_process_group and os.name == "posix":
+        # Its own session (and process group), so a timeout kills its
+        # children too.
+        options["start_new_session"] = True
+    if prefix:
+        # Run the shell under the prefix, as create_subprocess_shell would.
+        return await asyncio.create_subprocess_exec(
+            *prefix, "/bin/sh", "-c", command, **options
+        )
+    return await asyncio.create_subprocess_shell(command, **options)
+
+
+async def run_command(
+    command: str,
+    on_line: Optional[Callable[[str], None]] = None,
+    policy: Optional[ResourcePolicy] = None,
+) -> Tuple[int, str, str]:
     """
     Runs a shell command asynchronously and returns status and output.
+
+    If `on_line` is given, it is called with each line of standard output
+    while the command runs.
+
+    The command runs under `policy` combined with the process-wide default
+    policy, and waits for a free slot if the governor caps how many commands
+    run at once (see `typerdantic.governor`). If it times out, its process
+    group is killed and the exit code is the negative signal number.
     """
-    process = await asyncio.create_subprocess_shell(
-        command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
-    )
-    stdout, stderr = await process.communicate()
-    return (
-        process.returncode if process.returncode is not None else -1,
-        stdout.decode("utf-8", errors="ignore"),
-        stderr.decode("utf-8", errors="ignore"),
-    )
+    governor = get_governor()
+    policy = governor.policy_for(policy)
+    metrics = get_active_metrics()
+
+    queued = time.perf_counter()
+    async with governor.slot():
+        start = time.perf_counter()
+        if metrics and governor.max_concurrent is not None:
+            metrics.observe("typerdantic_subprocess_queue_seconds", start - queued)
+
+        process = await _spawn(command, policy)
+        if on_line is None:
+            output = asyncio.ensure_future(process.communicate())
+        else:
+            output = asyncio.gather(
+                _read_lines(process.stdout, on_line), process.stderr.read()
+            )
+        timeout = policy.timeout if policy is not None else None
+        timed_out = False
+        try:
+            stdout, stderr = await asyncio.wait_for(asyncio.shield(output), timeout)
+        except asyncio.TimeoutError:
+            timed_out = True
+            await terminate_process_group(process, policy.kill_grace)
+            stdout, stderr = await output
+        except BaseException:
+            output.cancel()
+            if process.returncode is None:
+                process.kill()
+            raise
+        await process.wait()
+    return_code = process.returncode if process.returncode is not None else -1
+
+    if metrics:
+        metrics.observe("typerdantic_subprocess_seconds", time.perf_counter() - start)
+        metrics.inc("typerdantic_subprocesses_total", exit_code=return_code)
+
+    stderr = stderr.decode("utf-8", errors="ignore")
+    if timed_out:
+        stderr += f"\nKilled after timing out ({timeout:g}s).\n"
+    return (return_code, stdout.decode("utf-8", errors="ignore"), stderr)
+
+
+def command_line(action_type: str, value: str, args: Dict[str, Any]) -> str:
+    """
+    The shell command of a `command` or `script` action, with `args`
+    formatted into it. Scripts run with the interpreter for their suffix.
+    """
+    # Format the command or script path with the provided arguments
+    command_to_run = value.format(**args)
+
+    if action_type == "script":
+        script_path = Path(command_to_run)
+        if sys.platform == "win32" and script_path.suffix.lower() == ".ps1":
+            command_to_run = (
+                f'powershell.exe -ExecutionPolicy Bypass -File "{script_path}"'
+            )
+        elif script_path.suffix.lower() in [".sh", ".bash"]:
+            command_to_run = f'bash "{script_path}"'
+        elif script_path.suffix.lower() in [".bat", ".cmd"]:
+            command_to_run = f'cmd.exe /c "{script_path}"'
+        elif script_path.suffix.lower() == ".py":
+            command_to_run = f'"{sys.executable}" "{script_path}"'
+        elif script_path.suffix.lower() == ".js":
+            command_to_run = f'node "{script_path}"'
+    return command_to_run
+
+
+def command_of(
+    action: Any, args: Optional[Dict[str, Any]] = None
+) -> Optional[Tuple[str, Optional[ResourcePolicy]]]:
+    """
+    If `action` runs a `command` or `script` action string (as config
+    actions do), returns its shell command for `args` and its resource
+    policy. Returns None for any other action.
+    """
+    if not (
+        isinstance(action, functools.partial)
+        and action.func is execute_action_string
+        and action.args
+    ):
+        return None
+    action_type, _, value = action.args[0].partition("::")
+    action_type = action_type.strip().lower()
+    if action_type not in ("command", "script"):
+        return None
+    if args is None:
+        args = action.keywords.get("args") or {}
+    return command_line(action_type, value.strip(), args), action.keywords.get("policy")
 
 
 async def execute_action_string(
     action_string: str,
     context: Optional[Dict[str, Any]] = None,
     args: Optional[Dict[str, Any]] = None,
-) -> None:
+    progress_pattern: Optional[str] = None,
+    policy: Optional[ResourcePolicy] = None,
+    database: Optional[str] = None,
+    page_size: int = 50,
+) -> Optional[int]:
     """
     Parses and executes an action string from a menu configuration.
     - `action_string`: The core action, e.g., "internal::my_func".
     - `context`: App-level context (e.g., the active menu).
     - `args`: Item-specific arguments from the config.
+    - `progress_pattern`: For commands and scripts, a regex that reports
+      progress from their output (see `progress.progress_line_parser`).
+    - `policy`: For commands and scripts, the resource limits to run them
+      under (see `governor.ResourcePolicy`).
+    - `database`, `page_size`: For `sql` actions, the database to query and
+      the rows fetched at a time (see `typerdantic.sql`).
+
+    Returns the exit code for `command`, `script` and `sql` actions,
+    otherwise None.
     """
     if not isinstance(action_string, str):
         print(
@@ -61,33 +238,20 @@ async def execute_action_string(
         action_func = registry.get_action(value)
         if action_func:
             # Pass both context from the app and args from the menu item
-            if asyncio.iscoroutinefunction(action_func):
-                await action_func(context=context, args=args)
-            else:
-                action_func(context=context, args=args)
+            await call_action(action_func, context=context, args=args)
         else:
             print(f"\nError: Internal action '{value}' not found in registry.")
 
     elif action_type in ["command", "script"]:
-        # Format the command or script path with the provided arguments
-        command_to_run = value.format(**args)
-
-        if action_type == "script":
-            script_path = Path(command_to_run)
-            if sys.platform == "win32" and script_path.suffix.lower() == ".ps1":
-                command_to_run = (
-                    f'powershell.exe -ExecutionPolicy Bypass -File "{script_path}"'
-                )
-            elif script_path.suffix.lower() in [".sh", ".bash"]:
-                command_to_run = f'bash "{script_path}"'
-            elif script_path.suffix.lower() in [".bat", ".cmd"]:
-                command_to_run = f'cmd.exe /c "{script_path}"'
-            elif script_path.suffix.lower() == ".py":
-                command_to_run = f'"{sys.executable}" "{script_path}"'
-            elif script_path.suffix.lower() == ".js":
-                command_to_run = f'node "{script_path}"'
-
-        return_code, stdout, stderr = await run_command(command_to_run)
+        command_to_run = command_line(action_type, value, args)
+
+        options: Dict[str, Any] = {}
+        progress = (context or {}).get("progress")
+        if progress_pattern and progress is not None:
+            options["on_line"] = progress_line_parser(progress_pattern, progress)
+        if policy is not None:
+            options["policy"] = policy
+        return_code, stdout, stderr = await run_command(command_to_run, **options)
 
         print("-" * 20)
         if stdout:
@@ -96,6 +260,15 @@ async def execute_action_string(
             print("Errors:\n" + stderr)
         print(f"Process finished with exit code: {return_code}")
         print("-" * 20)
+        return return_code
+
+    elif action_type == "sql":
+        from .sql import execute_sql
+
+        # Arguments are bound as query parameters, never formatted in.
+        return await execute_sql(
+            value, database, context=context, args=args, page_size=page_size
+        )
 
     else:
         print(f"\nError: Unknown action type '{action_type}'.")
@@ -0,0 +1,197 @@
+# src/typerdantic/forms.py
+
+"""
+The form that asks for an item's `prompt_args` inside a running app.
+
+Instead of leaving the full-screen application for a prompt per argument,
+the form is drawn over the menu by the same Application: one input row per
+argument, filled with its default. Tab and Shift-Tab move between the
+fields, Up and Down browse what was entered in a field before, and Enter
+moves to the next field or, on the last one, submits the form. Esc or
+Ctrl-C cancels it, and the action is not run.
+
+Each field keeps its history, by argument name, for the life of the app.
+Arguments with `completions` show matching choices while they are typed
+(see `typerdantic.completion`); Up and Down pick one, Enter accepts it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.completion import Completer, DynamicCompleter
+from prompt_toolkit.filters import Condition, Filter
+from prompt_toolkit.history import InMemoryHistory
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout.containers import (
+    ConditionalContainer,
+    DynamicContainer,
+    HSplit,
+    VSplit,
+    Window,
+)
+from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
+from prompt_toolkit.widgets import Frame
+
+if TYPE_CHECKING:
+    from .app import TyperdanticApp
+    from .completion import ArgumentCompleter
+
+
+class FormField:
+    """An input row of the form, reused for every argument of its name."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.completer: Optional[Completer] = None
+        self.buffer = Buffer(
+            multiline=False,
+            history=InMemoryHistory(),
+            completer=DynamicCompleter(lambda: self.completer),
+            complete_while_typing=True,
+        )
+        self.window = Window(BufferControl(self.buffer), height=1)
+        self.prompt = name
+        self.row = VSplit(
+            [
+                Window(
+                    FormattedTextControl(lambda: f"{self.prompt}: "),
+                    dont_extend_width=True,
+                    style="class:form.label",
+                ),
+                self.window,
+            ]
+        )
+
+    def reset(self, prompt: str, value: str, completer: Optional["ArgumentCompleter"]):
+        self.prompt = prompt
+        self.completer = completer
+        if completer is not None:
+            completer.prefetch()
+        self.buffer.reset()
+        self.buffer.text = value
+        self.buffer.cursor_position = len(value)
+
+
+class ArgumentForm:
+    """The argument form popup, bound to a TyperdanticApp (see the module docs)."""
+
+    def __init__(self, app: "TyperdanticApp"):
+        self.app = app
+        self.visible = False
+        self.title = ""
+        # Fields by argument name, and the ones the open form shows.
+        self.fields: Dict[str, FormField] = {}
+        self.shown: List[FormField] = []
+        self.focused_index = 0
+        self._result: Optional[asyncio.Future] = None
+        self.container = ConditionalContainer(
+            Frame(
+                DynamicContainer(lambda: HSplit([f.row for f in self.shown])),
+                title=lambda: self.title,
+                style="class:form",
+            ),
+            filter=Condition(lambda: self.visible),
+        )
+
+    async def ask(
+        self,
+        arg_specs: Iterable[Any],
+        defaults: Optional[Dict[str, Any]] = None,
+        title: str = "",
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Shows the form for `arg_specs` and waits until it is submitted.
+        Returns the entered values by argument name, or None if cancelled.
+        """
+        defaults = defaults or {}
+        self.shown = []
+        for spec in arg_specs:
+            field = self.fields.get(spec.name)
+            if field is None:
+                field = self.fields[spec.name] = FormField(spec.name)
+            value = defaults.get(spec.name, spec.default)
+            field.reset(
+                spec.prompt,
+                "" if value is None else str(value),
+                self.app.completer_for(spec),
+            )
+            self.shown.append(field)
+        if not self.shown:
+            return {}
+        self.title = title
+        self.visible = True
+        self._result = asyncio.get_running_loop().create_future()
+        self.focus(0)
+        try:
+            return await self._result
+        finally:
+            self.visible = False
+            self._result = None
+            self.app.focus_menu()
+
+    @property
+    def focused(self) -> FormField:
+        return self.shown[self.focused_index]
+
+    def focus(self, index: int):
+        self.focused_index = index % len(self.shown)
+        self.app.application.layout.focus(self.shown[self.focused_index].window)
+
+    def submit(self):
+        values = {}
+        for field in self.shown:
+            field.buffer.append_to_history()
+            values[field.name] = field.buffer.text
+        self._finish(values)
+
+    def cancel(self):
+        self._finish(None)
+
+    def _finish(self, values: Optional[Dict[str, Any]]):
+        if self._result is not None and not self._result.done():
+            self._result.set_result(values)
+
+    def add_key_bindings(self, kb: KeyBindings) -> Filter:
+        """
+        Adds the bindings active while the form is open to `kb`. Returns the
+        filter that tells whether it is open, so that the app can disable its
+        own bindings meanwhile.
+        """
+        is_open = Condition(lambda: self.visible)
+
+        @kb.add("tab", filter=is_open)
+        def _(event):
+            self.focus(self.focused_index + 1)
+
+        @kb.add("s-tab", filter=is_open)
+        def _(event):
+            self.focus(self.focused_index - 1)
+
+        @kb.add("enter", filter=is_open)
+        def _(event):
+            buffer = self.focused.buffer
+            if buffer.complete_state and buffer.complete_state.current_completion:
+                # Accept the highlighted completion, already in the field.
+                buffer.complete_state = None
+                return
+            if self.focused_index == len(self.shown) - 1:
+                self.submit()
+            else:
+                self.focus(self.focused_index + 1)
+
+        @kb.add("escape", filter=is_open, eager=True)
+        def _(event):
+            buffer = self.focused.buffer
+            if buffer.complete_state:
+                buffer.cancel_completion()
+            else:
+                self.cancel()
+
+        @kb.add("c-c", filter=is_open)
+        def _(event):
+            self.cancel()
+
+        return is_open
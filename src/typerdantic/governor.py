@@ -0,0 +1,265 @@
+# src/typerdantic/governor.py
+
+"""
+Resource limits for commands launched from menus.
+
+A ResourcePolicy lowers a command's CPU and I/O priority, caps its memory
+and CPU time, and kills its whole process group when it runs too long. Set
+one per action, in Python or in a config file:
+
+    [items.backup.action]
+    type = "command"
+    value = "./backup.sh"
+    resources = { nice = 10, ionice = "idle", timeout = 3600, max_memory = "2G" }
+
+and a default for every command, plus a cap on how many commands run at
+once (extra commands wait in a queue), through the process-wide governor:
+
+    set_governor(SubprocessGovernor(
+        max_concurrent=2, default_policy=ResourcePolicy(nice=5)
+    ))
+
+Only local POSIX facilities are used: the command runs under `nice` and
+the util-linux `prlimit` and `ionice` tools (or, where `nice` or `prlimit`
+is missing, a small Python launcher that sets the limits and execs it), in
+a session of its own so that signals reach all of its processes. Nothing
+runs in the child between fork and exec, which is unsafe once the app
+has threads. On other platforms, only the timeout and the concurrency cap
+apply.
+"""
+
+import asyncio
+import os
+import re
+import shutil
+import signal
+import sys
+import weakref
+from typing import List, Literal, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field, field_validator
+
+_SIZE_UNITS = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+# ionice scheduling classes, see ioprio_set(2).
+_IONICE_CLASSES = {"best-effort": "2", "idle": "3"}
+
+# Sets the niceness and rlimits given before "--", then execs the command
+# after it. Used where the `nice` or `prlimit` tool is missing.
+_LAUNCHER = """\
+import os, resource, sys
+args = sys.argv[1:]
+end = args.index("--")
+os.nice(int(args[0]))
+for limit in args[1:end]:
+    name, value = limit.split("=")
+    resource.setrlimit(getattr(resource, name), (int(value), int(value)))
+os.execvp(args[end + 1], args[end + 1:])
+"""
+
+
+def parse_size(value: Union[int, str]) -> int:
+    """Parses a byte count such as 512000, "512M" or "2G"."""
+    if isinstance(value, int):
+        return value
+    match = re.fullmatch(r"\s*(\d+)\s*([KMGT]?)i?B?\s*", value, re.IGNORECASE)
+    if not match:
+        raise ValueError(f"Invalid size '{value}'. Use e.g. 512M or 2G.")
+    return int(match.group(1)) * _SIZE_UNITS[match.group(2).upper()]
+
+
+class ResourcePolicy(BaseModel):
+    """Resource limits applied to a spawned command. Unset fields don't apply."""
+
+    nice: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=19,
+        description="Niceness added to the command (higher is lower priority).",
+    )
+    ionice: Optional[Literal["best-effort", "idle"]] = Field(
+        default=None,
+        description="I/O class; 'idle' only gets disk time nobody else uses.",
+    )
+    ionice_level: Optional[int] = Field(
+        default=None,
+        ge=0,
+        le=7,
+        description="I/O priority in the best-effort class (7 is lowest).",
+    )
+    max_memory: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="Address space limit (RLIMIT_AS) in bytes, or e.g. '2G'.",
+    )
+    max_cpu_seconds: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description="CPU time limit (RLIMIT_CPU) in seconds.",
+    )
+    timeout: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Wall-clock seconds before the process group is killed.",
+    )
+    kill_grace: float = Field(
+        default=5.0,
+        ge=0,
+        description="Seconds between SIGTERM and SIGKILL after a timeout.",
+    )
+
+    @field_validator("max_memory", mode="before")
+    @classmethod
+    def _parse_memory(cls, value):
+        return parse_size(value) if isinstance(value, str) else value
+
+    class Config:
+        defer_build = True
+
+    def merged_over(self, default: Optional["ResourcePolicy"]) -> "ResourcePolicy":
+        """This policy, with the fields it leaves unset taken from `default`."""
+        if default is None:
+            return self
+        return default.model_copy(update=self.model_dump(exclude_unset=True))
+
+    @property
+    def needs_process_group(self) -> bool:
+        return self.timeout is not None
+
+    def _limits(self) -> List[Tuple[str, int]]:
+        """The rlimits to set, as (prlimit option, value) pairs."""
+        limits = []
+        if self.max_memory is not None:
+            limits.append(("as", self.max_memory))
+        if self.max_cpu_seconds is not None:
+            limits.append(("cpu", self.max_cpu_seconds))
+        return limits
+
+    def command_prefix(self) -> List[str]:
+        """
+        The commands to run the command under so that the policy applies:
+        `ionice`, then `nice` and `prlimit`, or the Python launcher if one
+        of those two is needed but not installed.
+        """
+        if os.name != "posix":
+            return []
+        prefix: List[str] = []
+        ionice = shutil.which("ionice") if self.ionice is not None else None
+        if ionice is not None:
+            prefix += [ionice, "-c", _IONICE_CLASSES[self.ionice]]
+            if self.ionice == "best-effort" and self.ionice_level is not None:
+                prefix += ["-n", str(self.ionice_level)]
+        limits = self._limits()
+        nice = shutil.which("nice") if self.nice else None
+        prlimit = shutil.which("prlimit") if limits else None
+        if (self.nice and nice is None) or (limits and prlimit is None):
+            return prefix + [
+                sys.executable,
+                "-c",
+                _LAUNCHER,
+                str(self.nice or 0),
+                *(f"RLIMIT_{name.upper()}={value}" for name, value in limits),
+                "--",
+            ]
+        if nice is not None:
+            prefix += [nice, "-n", str(self.nice)]
+        if prlimit is not None:
+            prefix += [
+                prlimit,
+                *(f"--{name}={value}:{value}" for name, value in limits),
+            ]
+        return prefix
+
+
+class SubprocessGovernor:
+    """
+    Process-wide settings for commands started by `run_command`.
+
+    Args:
+        max_concurrent: How many commands may run at once. Further commands
+            wait for a slot in the order they were started. None means no
+            limit.
+        default_policy: Applied to every command; a per-action policy
+            overrides the fields it sets.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: Optional[int] = None,
+        default_policy: Optional[ResourcePolicy] = None,
+    ):
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1.")
+        self.max_concurrent = max_concurrent
+        self.default_policy = default_policy
+        # asyncio primitives belong to one event loop, so keep one per loop.
+        self._slots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def policy_for(self, policy: Optional[ResourcePolicy]) -> Optional[ResourcePolicy]:
+        """The policy a command runs under, given its own `policy`."""
+        if policy is None:
+            return self.default_policy
+        return policy.merged_over(self.default_policy)
+
+    def slot(self) -> Union[asyncio.Semaphore, "_NoLimit"]:
+        """An async context manager holding one of the concurrency slots."""
+        if self.max_concurrent is None:
+            return _NO_LIMIT
+        loop = asyncio.get_running_loop()
+        semaphore = self._slots.get(loop)
+        if semaphore is None:
+            semaphore = self._slots[loop] = asyncio.Semaphore(self.max_concurrent)
+        return semaphore
+
+
+class _NoLimit:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+_NO_LIMIT = _NoLimit()
+
+_GOVERNOR = SubprocessGovernor()
+
+
+def get_governor() -> SubprocessGovernor:
+    """Returns the governor applied to every `run_command` call."""
+    return _GOVERNOR
+
+
+def set_governor(governor: Optional[SubprocessGovernor]) -> None:
+    """Replaces the process-wide governor; None restores the unlimited default."""
+    global _GOVERNOR
+    _GOVERNOR = governor if governor is not None else SubprocessGovernor()
+
+
+async def terminate_process_group(
+    process: asyncio.subprocess.Process, grace: float
+) -> None:
+    """
+    Sends SIGTERM to the process group led by `process`, then SIGKILL if it
+    is still running after `grace` seconds.
+    """
+    if process.returncode is not None:
+        return
+    if os.name != "posix":
+        process.kill()
+        await process.wait()
+        return
+    try:
+        os.killpg(process.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        return
+    try:
+        await asyncio.wait_for(process.wait(), grace)
+    except asyncio.TimeoutError:
+        pass
+    # Also kill children that outlived the command or ignored SIGTERM.
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    await process.wait()
@@ -0,0 +1,557 @@
+# src/typerdantic/history.py
+
+"""
+A persistent history of the actions run from menus.
+
+Give the app a RunHistory and every action it runs (from the menu, in a
+batch, in a bulk run or from the generated CLI) is recorded with its menu,
+item, arguments, start time, duration, exit status and the tail of its
+output:
+
+    app = TyperdanticApp(main_menu=MainMenu, history=RunHistory("runs.db"))
+
+Records go to an append-only SQLite database in WAL mode. Recording only
+puts the record on a queue; a background thread writes queued records in
+batches, so the UI never waits for the disk. Queries page through the runs
+newest first, using indexes on item, menu, action, status and time, so a
+page of matches comes back quickly from hundreds of thousands of runs.
+
+The app registers a HistoryMenu under the name "history" (unless a menu of
+that name exists), so an item with `target_menu="history"` opens it.
+"""
+
+import asyncio
+import contextlib
+import functools
+import json
+import queue
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .base import TyperdanticMenu
+from .capture import capture_output, routed_stdout
+from .models import ArgumentSpec, MenuItem
+
+# A page position: the (started_at, id) of the last run of the previous page.
+Cursor = Tuple[float, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    menu TEXT NOT NULL,
+    item TEXT NOT NULL,
+    action TEXT NOT NULL,
+    args TEXT NOT NULL,
+    status TEXT NOT NULL,
+    exit_code INTEGER,
+    error TEXT,
+    output TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started_at, id);
+CREATE INDEX IF NOT EXISTS runs_item ON runs (item, started_at, id);
+CREATE INDEX IF NOT EXISTS runs_menu ON runs (menu, started_at, id);
+CREATE INDEX IF NOT EXISTS runs_action ON runs (action, started_at, id);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status, started_at, id);
+"""
+
+_COLUMNS = (
+    "started_at",
+    "duration",
+    "menu",
+    "item",
+    "action",
+    "args",
+    "status",
+    "exit_code",
+    "error",
+    "output",
+)
+
+FAILED_STATUSES = ("failed", "error", "cancelled")
+
+# Tells the writer thread to stop.
+_STOP = object()
+
+
+class RunRecord(BaseModel):
+    """One recorded action run."""
+
+    id: Optional[int] = None
+    started_at: float
+    duration: float
+    menu: str
+    item: str
+    action: str
+    args: Dict[str, Any] = {}
+    status: str  # "ok", "failed" (non-zero exit code), "error" or "cancelled"
+    exit_code: Optional[int] = None
+    error: Optional[str] = None
+    output: str = ""
+
+    @property
+    def cursor(self) -> Cursor:
+        return (self.started_at, self.id or 0)
+
+
+def describe_action(action: Any) -> str:
+    """A stable name for an action: its action string, or its qualified name."""
+    if isinstance(action, functools.partial):
+        if action.args and isinstance(action.args[0], str):
+            return action.args[0]
+        action = action.func
+    module = getattr(action, "__module__", None) or ""
+    name = getattr(action, "__qualname__", None) or type(action).__name__
+    return f"{module}.{name}" if module else name
+
+
+class _RunTracker:
+    """Collects the outcome of a run inside `RunHistory.track`."""
+
+    def __init__(self):
+        self.result: Any = None
+
+
+class RunHistory:
+    """
+    An append-only store of action runs, written in the background.
+
+    Args:
+        path: The SQLite database file. It is created if needed.
+        batch_size: Most records written in one transaction.
+        flush_interval: Most seconds a record waits to be written.
+        max_output: Characters of output kept per run (the end is kept).
+        max_queued: Records waiting to be written beyond this are dropped
+            (and counted in `dropped`) rather than slowing the app down.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 200,
+        flush_interval: float = 0.5,
+        max_output: int = 65536,
+        max_queued: int = 100_000,
+    ):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_output = max_output
+        self.dropped = 0
+        self.write_errors = 0
+        self.last_error: Optional[str] = None
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queued)
+        self._writer: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._reader: Optional[sqlite3.Connection] = None
+        self._reader_lock = threading.Lock()
+        with contextlib.closing(self._connect()):
+            pass
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    # --- Writing ---
+
+    def record(self, run: RunRecord):
+        """Queues `run` to be written. Never blocks."""
+        self._ensure_writer()
+        try:
+            self._queue.put_nowait(run)
+        except queue.Full:
+            self.dropped += 1
+
+    @contextlib.contextmanager
+    def track(
+        self, menu: str, item: MenuItem, args: Optional[Dict[str, Any]] = None
+    ) -> Iterator[_RunTracker]:
+        """
+        Records the run of `item`'s action done inside the block, including
+        what it prints (which still reaches the terminal). Set the tracker's
+        `result` to the action's return value:
+
+            with history.track("main", item, args) as run:
+                run.result = await call_action(item.action, args=args)
+        """
+        tracker = _RunTracker()
+        started_at = time.time()
+        started = time.perf_counter()
+        status, error = "ok", None
+        with routed_stdout(), capture_output(echo=True) as output:
+            try:
+                yield tracker
+            except BaseException as exc:
+                cancelled = isinstance(exc, asyncio.CancelledError)
+                status = "cancelled" if cancelled else "error"
+                error = f"{type(exc).__name__}: {exc}"
+                raise
+            finally:
+                result = tracker.result
+                exit_code = None
+                if isinstance(result, int) and not isinstance(result, bool):
+                    exit_code = result
+                    if result != 0 and status == "ok":
+                        status = "failed"
+                self.record(
+                    RunRecord(
+                        started_at=started_at,
+                        duration=time.perf_counter() - started,
+                        menu=menu,
+                        item=item.description,
+                        action=describe_action(item.action),
+                        args=args or {},
+                        status=status,
+                        exit_code=exit_code,
+                        error=error,
+                        output=output.getvalue()[-self.max_output :],
+                    )
+                )
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until the runs recorded so far are written."""
+        if self._writer is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        """Writes the queued runs and stops the writer thread."""
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._queue.put(_STOP)
+            writer.join()
+        with self._reader_lock:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def _ensure_writer(self):
+        if self._writer is not None:
+            return
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name="typerdantic-history", daemon=True
+                )
+                self._writer.start()
+
+    def _write_loop(self):
+        connection = self._connect()
+        pending: List[RunRecord] = []
+        deadline = 0.0
+        try:
+            while True:
+                timeout = None
+                if pending:
+                    timeout = max(0.0, deadline - time.monotonic())
+                try:
+                    entry = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    entry = None
+                if isinstance(entry, RunRecord):
+                    if not pending:
+                        deadline = time.monotonic() + self.flush_interval
+                    pending.append(entry)
+                    if len(pending) < self.batch_size:
+                        continue
+                self._write(connection, pending)
+                pending = []
+                if isinstance(entry, threading.Event):
+                    entry.set()
+                elif entry is _STOP:
+                    return
+        finally:
+            connection.close()
+
+    def _write(self, connection: sqlite3.Connection, runs: List[RunRecord]):
+        if not runs:
+            return
+        rows = [
+            (
+                run.started_at,
+                run.duration,
+                run.menu,
+                run.item,
+                run.action,
+                json.dumps(run.args, default=str),
+                run.status,
+                run.exit_code,
+                run.error,
+                run.output,
+            )
+            for run in runs
+        ]
+        placeholders = ", ".join("?" for _ in _COLUMNS)
+        try:
+            with connection:
+                connection.executemany(
+                    f"INSERT INTO runs ({', '.join(_COLUMNS)}) VALUES ({placeholders})",
+                    rows,
+                )
+        except sqlite3.Error as error:
+            self.write_errors += 1
+            self.last_error = str(error)
+
+    # --- Reading ---
+
+    def _where(
+        self,
+        item: Optional[str],
+        menu: Optional[str],
+        action: Optional[str],
+        status: Optional[str],
+        failed: bool,
+        text: Optional[str],
+        since: Optional[float],
+        until: Optional[float],
+    ) -> Tuple[List[str], List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (
+            ("item", item),
+            ("menu", menu),
+            ("action", action),
+            ("status", status),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if failed:
+            clauses.append(f"status IN ({', '.join('?' for _ in FAILED_STATUSES)})")
+            params += FAILED_STATUSES
+        if text:
+            clauses.append("(item LIKE ? OR menu LIKE ? OR action LIKE ?)")
+            params += [f"%{text}%"] * 3
+        if since is not None:
+            clauses.append("started_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("started_at < ?")
+            params.append(until)
+        return clauses, params
+
+    def _execute(self, sql: str, params: List[Any]) -> List[tuple]:
+        with self._reader_lock:
+            if self._reader is None:
+                self._reader = self._connect()
+            return self._reader.execute(sql, params).fetchall()
+
+    def query(
+        self,
+        item: Optional[str] = None,
+        menu: Optional[str] = None,
+        action: Optional[str] = None,
+        status: Optional[str] = None,
+        failed: bool = False,
+        text: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        after: Optional[Cursor] = None,
+        limit: int = 50,
+    ) -> List[RunRecord]:
+        """
+        Returns up to `limit` runs matching every given criterion, newest
+        first. `failed` selects runs whose status is not "ok", and `text`
+        matches part of the item, menu or action. For the next page, pass
+        the `cursor` of the last run as `after`.
+        """
+        clauses, params = self._where(
+            item, menu, action, status, failed, text, since, until
+        )
+        if after is not None:
+            clauses.append("(started_at < ? OR (started_at = ? AND id < ?))")
+            params += [after[0], after[0], after[1]]
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._execute(
+            f"SELECT id, {', '.join(_COLUMNS)} FROM runs {where}"
+            " ORDER BY started_at DESC, id DESC LIMIT ?",
+            params + [limit],
+        )
+        return [
+            RunRecord(
+                id=row[0],
+                **dict(zip(_COLUMNS, row[1:]), args=json.loads(row[6])),
+            )
+            for row in rows
+        ]
+
+    def count(
+        self,
+        item: Optional[str] = None,
+        menu: Optional[str] = None,
+        action: Optional[str] = None,
+        status: Optional[str] = None,
+        failed: bool = False,
+        text: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> int:
+        """How many runs match the criteria (see `query`)."""
+        clauses, params = self._where(
+            item, menu, action, status, failed, text, since, until
+        )
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._execute(f"SELECT COUNT(*) FROM runs {where}", params)[0][0]
+
+
+def format_run(run: RunRecord) -> str:
+    """A one-line summary of a run."""
+    when = datetime.fromtimestamp(run.started_at).strftime("%Y-%m-%d %H:%M:%S")
+    if run.status == "failed":
+        outcome = f"exit {run.exit_code}"
+    else:
+        outcome = run.status
+    return f"{when}  {run.item}  {outcome}  ({run.duration:.1f}s)"
+
+
+def _show_run(run: RunRecord) -> Callable[[dict, dict], None]:
+    def show(context: dict, args: dict):
+        print(f"\n{format_run(run)}")
+        print(f"Menu: {run.menu}  Action: {run.action}")
+        if run.args:
+            print(f"Arguments: {json.dumps(run.args, default=str)}")
+        if run.error:
+            print(f"Error: {run.error}")
+        print(run.output.rstrip() or "(no output)")
+
+    return show
+
+
+class HistoryMenu(TyperdanticMenu):
+    """Run History"""
+
+    page_size: ClassVar[int] = 20
+    record_history = False
+
+    # Cursors of the pages before the current one, and the current page's.
+    _previous_pages: List[Optional[Cursor]] = []
+    _page: Optional[Cursor] = None
+    _text: str = ""
+    _failures_only: bool = False
+
+    def _criteria(self) -> Dict[str, Any]:
+        return {
+            "text": self._text or None,
+            "failed": self._failures_only,
+        }
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        back = ("back", MenuItem(description="Back", is_quit=True))
+        history: Optional[RunHistory] = getattr(self.app, "history", None)
+        if history is None:
+            return [("disabled", MenuItem(description="Run history is off.")), back]
+
+        runs = history.query(
+            after=self._page, limit=self.page_size + 1, **self._criteria()
+        )
+        items = [
+            (
+                "search",
+                MenuItem(
+                    description=f"Search: {self._text or '(all runs)'}",
+                    action=self._search,
+                    prompt_args=[
+                        ArgumentSpec(
+                            name="text",
+                            prompt="Item, menu or action contains",
+                            default=self._text,
+                        )
+                    ],
+                    invalidates=[],
+                ),
+            ),
+            (
+                "failures",
+                MenuItem(
+                    description=(
+                        "Showing failed runs only"
+                        if self._failures_only
+                        else "Showing all runs"
+                    ),
+                    action=self._toggle_failures,
+                    invalidates=[],
+                    pause=False,
+                ),
+            ),
+        ]
+        for run in runs[: self.page_size]:
+            items.append(
+                (
+                    f"run_{run.id}",
+                    MenuItem(
+                        description=format_run(run),
+                        action=_show_run(run),
+                        invalidates=[],
+                    ),
+                )
+            )
+        if len(runs) > self.page_size:
+            items.append(
+                (
+                    "older",
+                    MenuItem(
+                        description="Older runs",
+                        action=functools.partial(
+                            self._turn_page, runs[self.page_size - 1].cursor
+                        ),
+                        invalidates=[],
+                        pause=False,
+                    ),
+                )
+            )
+        if self._previous_pages:
+            items.append(
+                (
+                    "newer",
+                    MenuItem(
+                        description="Newer runs",
+                        action=functools.partial(self._turn_page, None),
+                        invalidates=[],
+                        pause=False,
+                    ),
+                )
+            )
+        items.append(back)
+        return items
+
+    def _search(self, context: dict, args: dict):
+        self._text = (args.get("text") or "").strip()
+        self._previous_pages, self._page = [], None
+        self.refresh_items()
+
+    def _toggle_failures(self, context: dict, args: dict):
+        self._failures_only = not self._failures_only
+        self._previous_pages, self._page = [], None
+        self.refresh_items()
+
+    def _turn_page(self, cursor: Optional[Cursor], context: dict, args: dict):
+        """Shows the page after `cursor`, or the previous page with None."""
+        if cursor is None:
+            self._page = self._previous_pages.pop()
+        else:
+            self._previous_pages = self._previous_pages + [self._page]
+            self._page = cursor
+        self.refresh_items()
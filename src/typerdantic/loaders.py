@@ -5,7 +5,7 @@ from pydantic import Field, create_model
 import functools
 
 from .base import TyperdanticMenu
-from .models import MenuItem
+from .models import ArgumentSpec, BatchSpec, MenuItem, WatchSpec
 from .config_models import MenuConfig, ActionConfig
 from .executors import execute_action_string
 
@@ -21,20 +21,44 @@ def create_menu_from_config(name: str, config: MenuConfig) -> Type[TyperdanticMe
         action_args = None
         prompt_args = None
         action_string = None
+        action_options: Dict[str, Any] = {}
+        batch = None
+        watch = None
+        pause = True
 
         if isinstance(item_config.action, str):
             action_string = item_config.action
         elif isinstance(item_config.action, ActionConfig):
             action_string = f"{item_config.action.type}::{item_config.action.value}"
             action_args = item_config.action.args
-            prompt_args = item_config.action.prompt_args  # <-- Get prompt_args
+            if item_config.action.progress_pattern:
+                action_options["progress_pattern"] = item_config.action.progress_pattern
+            if item_config.action.resources:
+                action_options["policy"] = item_config.action.resources
+            if item_config.action.database:
+                action_options["database"] = item_config.action.database
+                action_options["page_size"] = item_config.action.page_size
+            if item_config.action.batch:
+                batch = BatchSpec(**item_config.action.batch.model_dump())
+            if item_config.action.watch:
+                watch = WatchSpec(**item_config.action.watch.model_dump())
+            if item_config.action.prompt_args:
+                # Convert the config specs into the runtime ArgumentSpec model.
+                prompt_args = [
+                    ArgumentSpec(**spec.model_dump())
+                    for spec in item_config.action.prompt_args
+                ]
 
         if action_string:
+            if action_string.partition("::")[0].strip().lower() == "sql":
+                # The rows, or the error, are shown in a results menu.
+                pause = False
             action_callable = functools.partial(
                 execute_action_string,
                 action_string,
                 # Pass pre-defined args to the partial. Runtime args will be handled by the app.
                 args=action_args,
+                **action_options,
             )
 
         menu_item = MenuItem(
@@ -42,17 +66,28 @@ def create_menu_from_config(name: str, config: MenuConfig) -> Type[TyperdanticMe
             action=action_callable,
             target_menu=item_config.target_menu,
             is_quit=item_config.is_quit,
+            invalidates=item_config.invalidates,
+            batch=batch,
+            watch=watch,
+            pause=pause,
             args=action_args,
             prompt_args=prompt_args,  # <-- Pass prompt_args to the MenuItem
+            style=item_config.style,
         )
 
         field_definitions[item_name] = (MenuItem, Field(default=menu_item))
 
+    # The model schema is built on first instantiation (see
+    # TyperdanticMenu._rebuild_with_app), so loading a config does not
+    # import the TUI.
     NewMenu = create_model(name, __base__=TyperdanticMenu, **field_definitions)
 
-    from typerdantic.app import TyperdanticApp  # noqa: F401
-
-    NewMenu.model_rebuild(force=True)
-
     NewMenu.__doc__ = config.doc
+    if config.depends_on is not None:
+        NewMenu.depends_on = frozenset(config.depends_on)
+    if config.style is not None:
+        NewMenu.style_class = config.style
+    if config.params is not None:
+        # One class serves every binding of the template.
+        NewMenu.template_params = tuple(config.params)
     return NewMenu
@@ -0,0 +1,215 @@
+# src/typerdantic/metrics.py
+
+"""
+Lightweight in-process metrics for a running TyperdanticApp.
+
+Counters and histograms are keyed by a metric name plus optional labels, and
+can be exported as JSON or in the OpenMetrics text format.
+"""
+
+import bisect
+import json
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# Histogram bucket upper bounds in seconds, from 0.5ms up to 10s.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+# The Metrics instance used by code that has no access to the app, such as
+# executors.run_command. Set by TyperdanticApp when metrics are enabled.
+_ACTIVE_METRICS: Optional["Metrics"] = None
+
+
+def get_active_metrics() -> Optional["Metrics"]:
+    """Returns the metrics of the running app, or None if disabled."""
+    return _ACTIVE_METRICS
+
+
+def set_active_metrics(metrics: Optional["Metrics"]) -> None:
+    global _ACTIVE_METRICS
+    _ACTIVE_METRICS = metrics
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: str = "") -> str:
+    parts = [f'{name}="{_escape(value)}"' for name, value in key]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Histogram:
+    """A cumulative histogram with fixed bucket bounds."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts: List[int] = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimates the q-quantile as the upper bound of its bucket."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank:
+                return bound
+        return self.max
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min,
+            "max": self.max,
+            "buckets": dict(
+                zip([str(b) for b in self.buckets] + ["+Inf"], self.bucket_counts)
+            ),
+        }
+
+
+class Metrics:
+    """
+    A registry of counters and histograms.
+
+    Example:
+        metrics = Metrics(export_path=Path("metrics.prom"))
+        with metrics.time("typerdantic_refresh_seconds", menu="main"):
+            menu.refresh_items()
+        metrics.inc("typerdantic_actions_total", status="ok")
+    """
+
+    def __init__(self, export_path: Optional[Union[str, Path]] = None):
+        self.export_path = Path(export_path) if export_path else None
+        self.counters: Dict[str, Dict[LabelKey, float]] = {}
+        self.histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+
+    def inc(self, name: str, value: float = 1, **labels: object):
+        series = self.counters.setdefault(name, {})
+        key = _label_key(labels)
+        series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: object):
+        series = self.histograms.setdefault(name, {})
+        key = _label_key(labels)
+        histogram = series.get(key)
+        if histogram is None:
+            histogram = series[key] = Histogram()
+        histogram.observe(value)
+
+    @contextmanager
+    def time(self, name: str, **labels: object) -> Iterator[None]:
+        """Observes the wall-clock duration of the `with` block in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    # --- Export ---
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "counters": {
+                name: [{"labels": dict(key), "value": v} for key, v in series.items()]
+                for name, series in self.counters.items()
+            },
+            "histograms": {
+                name: [
+                    {"labels": dict(key), **histogram.to_dict()}
+                    for key, histogram in series.items()
+                ]
+                for name, series in self.histograms.items()
+            },
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    def to_openmetrics(self) -> str:
+        lines: List[str] = []
+        for name, series in sorted(self.counters.items()):
+            family = name[: -len("_total")] if name.endswith("_total") else name
+            lines.append(f"# TYPE {family} counter")
+            for key, value in series.items():
+                lines.append(f"{family}_total{_format_labels(key)} {value}")
+        for name, series in sorted(self.histograms.items()):
+            lines.append(f"# TYPE {name} histogram")
+            lines.append(f"# UNIT {name} seconds")
+            for key, histogram in series.items():
+                cumulative = 0
+                bounds = [str(b) for b in histogram.buckets] + ["+Inf"]
+                for bound, bucket_count in zip(bounds, histogram.bucket_counts):
+                    cumulative += bucket_count
+                    labels = _format_labels(key, f'le="{bound}"')
+                    lines.append(f"{name}_bucket{labels} {cumulative}")
+                lines.append(f"{name}_count{_format_labels(key)} {histogram.count}")
+                lines.append(f"{name}_sum{_format_labels(key)} {histogram.sum}")
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """
+        Writes the metrics to `path` (or `export_path`). A `.json` suffix
+        selects JSON; anything else is written as OpenMetrics text.
+        """
+        target = Path(path) if path else self.export_path
+        if target is None:
+            raise ValueError("No export path given for metrics.")
+        text = self.to_json() if target.suffix == ".json" else self.to_openmetrics()
+        target.write_text(text, encoding="utf-8")
+        return target
+
+    def summary_lines(self) -> List[str]:
+        """Returns one human-readable line per series, for the debug overlay."""
+        lines = []
+        for name, series in sorted(self.histograms.items()):
+            for key, histogram in series.items():
+                p50, p99 = histogram.quantile(0.5), histogram.quantile(0.99)
+                lines.append(
+                    f"{name}{_format_labels(key)} n={histogram.count} "
+                    f"p50<={p50 * 1000:.1f}ms p99<={p99 * 1000:.1f}ms "
+                    f"max={histogram.max * 1000:.1f}ms"
+                )
+        for name, series in sorted(self.counters.items()):
+            for key, value in series.items():
+                lines.append(f"{name}{_format_labels(key)} {value:g}")
+        return lines
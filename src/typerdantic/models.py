@@ -1,7 +1,53 @@
 # src/typerdantic/models.py
 
-from pydantic import BaseModel, Field
-from typing import Any, Callable, Optional, Dict, List
+import os
+from functools import lru_cache
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, model_validator
+from typing import Any, Callable, Optional, Dict, Iterable, List, Literal, Type, Union
+
+# When enabled (TYPERDANTIC_DEBUG=1), trusted constructors run full validation
+# so that mistakes in dynamic `get_items` implementations surface early.
+DEBUG_VALIDATION: bool = os.environ.get("TYPERDANTIC_DEBUG", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+
+class CompletionSpec(BaseModel):
+    """Where the completions of a prompted argument come from."""
+
+    choices: Optional[List[str]] = Field(default=None, description="A fixed list.")
+    command: Optional[str] = Field(
+        default=None, description="A shell command whose output lines are choices."
+    )
+    glob: Optional[str] = Field(
+        default=None, description="A glob pattern of paths, e.g. 'logs/**/*.log'."
+    )
+    source: Optional[Union[str, Callable[[], Any]]] = Field(
+        default=None,
+        description=(
+            "A callable returning the choices (it may be async), or the name of "
+            "one registered with register_action."
+        ),
+    )
+    ttl: Optional[float] = Field(
+        default=60.0,
+        ge=0,
+        description="Seconds loaded choices are reused; None keeps them.",
+    )
+    # The search index of `choices`, built on first use (typerdantic.completion).
+    _index: Any = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _one_source(self) -> "CompletionSpec":
+        sources = (self.choices, self.command, self.glob, self.source)
+        if sum(source is not None for source in sources) != 1:
+            raise ValueError(
+                "Completions need exactly one of 'choices', 'command', 'glob'"
+                " or 'source'."
+            )
+        return self
 
 
 # Forward reference for ArgumentSpec
@@ -9,6 +55,53 @@ class ArgumentSpec(BaseModel):
     name: str
     prompt: str
     default: Optional[Any] = None
+    completions: Optional[CompletionSpec] = None
+
+
+class BatchSpec(BaseModel):
+    """Where the argument rows of a batch come from, and how to run them."""
+
+    source: Optional[str] = Field(
+        default=None, description="A CSV, JSON-lines or text file of rows."
+    )
+    command: Optional[str] = Field(
+        default=None, description="A shell command whose output lines are rows."
+    )
+    format: Optional[Literal["csv", "jsonl", "lines"]] = Field(
+        default=None,
+        description="The row format; by default from the file suffix, or 'lines'.",
+    )
+    concurrency: int = Field(default=4, ge=1, description="Rows run at once.")
+    retries: int = Field(default=0, ge=0, description="Retries of a failed row.")
+    retry_delay: float = Field(
+        default=1.0, ge=0, description="Seconds before the first retry; doubles."
+    )
+
+    @model_validator(mode="after")
+    def _one_source(self) -> "BatchSpec":
+        if (self.source is None) == (self.command is None):
+            raise ValueError("A batch needs exactly one of 'source' or 'command'.")
+        return self
+
+
+class WatchSpec(BaseModel):
+    """When a watched action runs again, and how much output it keeps."""
+
+    interval: Optional[float] = Field(
+        default=2.0, gt=0, description="Seconds between runs; None: only on changes."
+    )
+    paths: Optional[List[str]] = Field(
+        default=None, description="Files whose changes also trigger a run."
+    )
+    max_lines: int = Field(
+        default=500, ge=1, description="The last lines of output that are shown."
+    )
+
+    @model_validator(mode="after")
+    def _has_trigger(self) -> "WatchSpec":
+        if self.interval is None and not self.paths:
+            raise ValueError("A watch needs an 'interval' or 'paths' to watch.")
+        return self
 
 
 class MenuItem(BaseModel):
@@ -37,6 +130,97 @@ class MenuItem(BaseModel):
         default=None,
         description="A list of argument specifications to prompt for at runtime.",
     )
+    invalidates: Optional[List[str]] = Field(
+        default=None,
+        description=(
+            "Data keys the action changes. Menus depending on them are refreshed "
+            "afterwards. None invalidates everything; [] marks a read-only action."
+        ),
+    )
+    run_in_thread: bool = Field(
+        default=False,
+        description="If True, a synchronous action runs in a worker thread.",
+    )
+    batch: Optional[BatchSpec] = Field(
+        default=None,
+        description="If set, the action runs once per row of arguments.",
+    )
+    watch: Optional[WatchSpec] = Field(
+        default=None,
+        description="If set, the action runs repeatedly into a live output pane.",
+    )
+    pause: bool = Field(
+        default=True,
+        description="If False, the menu returns without 'Press Enter to continue'.",
+    )
+    style: Optional[str] = Field(
+        default=None,
+        description="Extra style classes for this item's row, e.g. 'danger'.",
+    )
 
     class Config:
         arbitrary_types_allowed = True
+
+    @classmethod
+    def trusted(cls, **data: Any) -> "MenuItem":
+        """
+        Creates a MenuItem from trusted data, skipping validation.
+
+        This is the fast path for `get_items` implementations that build many
+        items per refresh. The values are stored as given, so nested fields
+        such as `prompt_args` must already be `ArgumentSpec` instances.
+        When `DEBUG_VALIDATION` is enabled the data is validated as usual.
+        """
+        if DEBUG_VALIDATION:
+            return cls.model_validate(data)
+
+        values = dict(_field_defaults(cls))
+        values.update(data)
+        item = object.__new__(cls)
+        object.__setattr__(item, "__dict__", values)
+        object.__setattr__(item, "__pydantic_fields_set__", set(data))
+        object.__setattr__(item, "__pydantic_extra__", None)
+        object.__setattr__(item, "__pydantic_private__", None)
+        return item
+
+
+@lru_cache(maxsize=None)
+def _field_defaults(model: Type[BaseModel]) -> Dict[str, Any]:
+    """Returns the default value of every field of `model`, in field order."""
+    return {
+        name: (
+            None
+            if field.is_required()
+            else field.get_default(call_default_factory=True)
+        )
+        for name, field in model.model_fields.items()
+    }
+
+
+@lru_cache(maxsize=None)
+def _menu_item_list_adapter() -> TypeAdapter:
+    return TypeAdapter(List[MenuItem])
+
+
+def validate_menu_items(
+    data: Union[Iterable[Dict[str, Any]], str, bytes],
+) -> List[MenuItem]:
+    """
+    Validates a batch of untrusted menu item definitions in a single pass.
+
+    Args:
+        data: An iterable of dictionaries, or a JSON array as str/bytes.
+
+    Returns:
+        A list of validated MenuItem objects.
+
+    Raises:
+        pydantic.ValidationError: If any of the items is invalid. The error
+            lists every failing item, not just the first one.
+    """
+    adapter = _menu_item_list_adapter()
+    if isinstance(data, (str, bytes)):
+        return adapter.validate_json(data)
+    if not isinstance(data, list):
+        data = list(data)
+    return adapter.validate_python(data)
@@ -0,0 +1,311 @@
+# src/typerdantic/palette.py
+
+"""
+A command palette that searches the items of every registered menu.
+
+Press Ctrl-P in a running app and type a few letters of an item's
+description or of its menu's title. Enter runs the highlighted match as if
+it had been selected in its menu (opening it, for a sub-menu link); Tab only
+jumps to it. Esc closes the palette.
+
+The palette searches a CommandIndex of the items declared as class fields
+(including every config-defined menu). It is built from the menu classes,
+without instantiating them, and only menus whose registered class changed
+since the last search are indexed again. Items that a dynamic menu creates
+in `get_items()` are not part of the index.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.filters import Condition
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout.containers import (
+    ConditionalContainer,
+    HSplit,
+    VSplit,
+    Window,
+)
+from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
+from prompt_toolkit.widgets import Frame
+
+from .base import format_menu_ref, parse_menu_ref
+from .models import MenuItem
+
+if TYPE_CHECKING:
+    from .app import TyperdanticApp
+    from .base import TyperdanticMenu
+
+
+def menu_title(menu_class: type) -> str:
+    """The first line of a menu's docstring, as shown in its title bar."""
+    doc = (menu_class.__doc__ or "").strip()
+    return doc.splitlines()[0] if doc else menu_class.__name__
+
+
+def static_items(menu_class: Type["TyperdanticMenu"]) -> List[Tuple[str, MenuItem]]:
+    """The items a menu class declares as fields, read from the class."""
+    return [
+        (name, field_info.default)
+        for name, field_info in menu_class.model_fields.items()
+        if isinstance(field_info.default, MenuItem)
+    ]
+
+
+class PaletteEntry:
+    """One searchable item of the CommandIndex."""
+
+    __slots__ = ("menu_name", "item_name", "item", "menu_title", "search_text")
+
+    def __init__(self, menu_name: str, item_name: str, item: MenuItem, title: str):
+        self.menu_name = menu_name
+        self.item_name = item_name
+        self.item = item
+        self.menu_title = title
+        self.search_text = f"{item.description} {item_name} {title}".lower()
+
+    def __repr__(self) -> str:
+        return f"PaletteEntry({self.menu_name!r}, {self.item_name!r})"
+
+
+class CommandIndex:
+    """
+    A search index over the static items of the menus in `registry`.
+
+    The registry is read, not copied: menus registered (or replaced) later
+    are picked up by the next `search()`, which re-indexes only those.
+    """
+
+    def __init__(self, registry: Mapping[str, Type["TyperdanticMenu"]]):
+        self._registry = registry
+        # menu name -> (class the entries were built from, entries)
+        self._menus: Dict[str, Tuple[type, List[PaletteEntry]]] = {}
+        self._paths: Optional[Dict[str, Tuple[str, ...]]] = None
+
+    def sync(self) -> int:
+        """Indexes new and changed menus. Returns how many were indexed."""
+        indexed = 0
+        for name in list(self._menus):
+            if name not in self._registry:
+                del self._menus[name]
+                self._paths = None
+        for name, menu_class in self._registry.items():
+            known = self._menus.get(name)
+            if known is not None and known[0] is menu_class:
+                continue
+            title = menu_title(menu_class)
+            entries = [
+                PaletteEntry(name, item_name, item, title)
+                for item_name, item in static_items(menu_class)
+                # A template's items only exist once its parameters are bound.
+                if not item.is_quit and menu_class.template_params is None
+            ]
+            self._menus[name] = (menu_class, entries)
+            self._paths = None
+            indexed += 1
+        return indexed
+
+    def __iter__(self) -> Iterator[PaletteEntry]:
+        for _, entries in self._menus.values():
+            yield from entries
+
+    def __len__(self) -> int:
+        return sum(len(entries) for _, entries in self._menus.values())
+
+    def search(self, query: str, limit: int = 20) -> List[PaletteEntry]:
+        """
+        Returns up to `limit` entries containing every word of `query`,
+        best first: description prefix matches, then word-start matches,
+        then entries of shallower menus.
+        """
+        self.sync()
+        words = query.lower().split()
+        paths = self.paths()
+        scored = []
+        for entry in self:
+            if not all(word in entry.search_text for word in words):
+                continue
+            description = entry.item.description.lower()
+            if words and description.startswith(words[0]):
+                rank = 0
+            elif words and f" {words[0]}" in f" {description}":
+                rank = 1
+            else:
+                rank = 2
+            depth = len(paths.get(entry.menu_name, ()))
+            scored.append((rank, depth, len(description), entry))
+        scored.sort(key=lambda score: score[:3])
+        return [entry for *_, entry in scored[:limit]]
+
+    def paths(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        The shortest chain of `target_menu` links from "main" to each menu,
+        e.g. {"main": ("main",), "network": ("main", "settings", "network")}.
+        Links to template menus keep their parameters.
+        Menus not reachable from "main" are reached from it directly.
+        """
+        self.sync()
+        if self._paths is None:
+            paths: Dict[str, Tuple[str, ...]] = {"main": ("main",)}
+            queue = deque(["main"])
+            while queue:
+                name = queue.popleft()
+                menu_class, _ = self._menus[name]
+                # Read from the class, as a template's items aren't indexed.
+                for _, item in static_items(menu_class):
+                    target = item.target_menu
+                    if not target or "{" in target:
+                        continue
+                    try:
+                        target_name, params = parse_menu_ref(target)
+                    except ValueError:
+                        continue
+                    if target_name in self._menus and target_name not in paths:
+                        link = format_menu_ref(target_name, params)
+                        paths[target_name] = paths[name] + (link,)
+                        queue.append(target_name)
+            for name in self._menus:
+                paths.setdefault(name, ("main", name))
+            self._paths = paths
+        return self._paths
+
+    def path_to(self, menu_name: str) -> Tuple[str, ...]:
+        return self.paths().get(menu_name, ("main", menu_name))
+
+
+class CommandPalette:
+    """The palette's popup, bound to a TyperdanticApp (see the module docs)."""
+
+    def __init__(self, app: "TyperdanticApp", max_results: int = 10):
+        self.app = app
+        self.max_results = max_results
+        self.visible = False
+        self.results: List[PaletteEntry] = []
+        self.selected_index = 0
+        self.buffer = Buffer(multiline=False, on_text_changed=self._on_query_changed)
+        self.input_window = Window(BufferControl(self.buffer), height=1)
+        self.container = ConditionalContainer(
+            Frame(
+                HSplit(
+                    [
+                        VSplit(
+                            [
+                                Window(
+                                    FormattedTextControl("> "),
+                                    width=2,
+                                    style="class:palette.prompt",
+                                ),
+                                self.input_window,
+                            ]
+                        ),
+                        Window(
+                            FormattedTextControl(self._get_result_fragments),
+                            height=max_results,
+                        ),
+                    ]
+                ),
+                title="Go to item",
+                style="class:palette",
+            ),
+            filter=Condition(lambda: self.visible),
+        )
+
+    @property
+    def index(self) -> CommandIndex:
+        return self.app.command_index
+
+    def open(self):
+        self.visible = True
+        self.buffer.reset()
+        self._on_query_changed(self.buffer)
+        self.app.application.layout.focus(self.input_window)
+
+    def close(self):
+        self.visible = False
+        self.app.focus_menu()
+
+    def _on_query_changed(self, _buffer: Buffer):
+        self.results = self.index.search(self.buffer.text, limit=self.max_results)
+        self.selected_index = 0
+
+    def move(self, step: int):
+        if self.results:
+            self.selected_index = (self.selected_index + step) % len(self.results)
+
+    @property
+    def selected(self) -> Optional[PaletteEntry]:
+        if not self.results:
+            return None
+        return self.results[self.selected_index]
+
+    async def activate(self, run: bool):
+        """Jumps to the highlighted entry and, if `run`, selects it."""
+        entry = self.selected
+        self.close()
+        if entry is None:
+            return
+        self.app.jump_to(entry.menu_name, entry.item_name)
+        if run:
+            item = self.app.active_menu.get_selected_item()
+            if item is None or item.description != entry.item.description:
+                item = entry.item
+            await self.app.handle_selection(item)
+
+    def _get_result_fragments(self):
+        if not self.results:
+            return [("class:palette.empty", "No matching items.")]
+        fragments = []
+        for i, entry in enumerate(self.results):
+            selected = i == self.selected_index
+            style = "class:palette.selected" if selected else "class:palette.item"
+            fragments.append((style, f"{entry.item.description}"))
+            fragments.append(("class:palette.menu", f"  {entry.menu_title}\n"))
+        return fragments
+
+    def add_key_bindings(self, kb: KeyBindings):
+        """
+        Adds Ctrl-P and the bindings active while the palette is open to `kb`.
+        Returns the filter that tells whether it is open, so that the app
+        can disable its own bindings meanwhile.
+        """
+        is_open = Condition(lambda: self.visible)
+
+        @kb.add("c-p", filter=~is_open)
+        def _(event):
+            self.open()
+
+        @kb.add("up", filter=is_open)
+        def _(event):
+            self.move(-1)
+
+        @kb.add("down", filter=is_open)
+        def _(event):
+            self.move(1)
+
+        @kb.add("enter", filter=is_open)
+        async def _(event):
+            await self.activate(run=True)
+
+        @kb.add("tab", filter=is_open)
+        async def _(event):
+            await self.activate(run=False)
+
+        @kb.add("escape", filter=is_open, eager=True)
+        @kb.add("c-p", filter=is_open)
+        @kb.add("c-c", filter=is_open)
+        def _(event):
+            self.close()
+
+        return is_open
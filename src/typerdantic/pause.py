@@ -0,0 +1,107 @@
+# src/typerdantic/pause.py
+
+"""
+The pause after an action in a running app.
+
+Instead of leaving the full-screen application for a "Press Enter to
+continue..." prompt, the output the action printed is shown in a panel drawn
+over the menu by the same Application, where the next redraw can't wipe it.
+The panel scrolls to the end of long output. Enter (or Esc, Ctrl-C or `q`)
+closes it and returns to the menu.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Optional
+
+from prompt_toolkit.data_structures import Point
+from prompt_toolkit.filters import Condition, Filter
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout.containers import ConditionalContainer, HSplit, Window
+from prompt_toolkit.layout.controls import FormattedTextControl
+from prompt_toolkit.layout.dimension import Dimension
+from prompt_toolkit.widgets import Frame
+
+if TYPE_CHECKING:
+    from .app import TyperdanticApp
+
+CONTINUE_PROMPT = "Press Enter to continue..."
+
+
+class PausePanel:
+    """The output panel of a paused action, bound to a TyperdanticApp."""
+
+    def __init__(self, app: "TyperdanticApp"):
+        self.app = app
+        self.visible = False
+        self.title = ""
+        self.text = ""
+        self._result: Optional[asyncio.Future] = None
+        self.output_window = Window(
+            FormattedTextControl(
+                lambda: [("", self.text)],
+                focusable=True,
+                get_cursor_position=self._end_of_output,
+            ),
+            height=Dimension(max=20),
+            wrap_lines=True,
+        )
+        self.container = ConditionalContainer(
+            Frame(
+                HSplit(
+                    [
+                        self.output_window,
+                        Window(
+                            FormattedTextControl(CONTINUE_PROMPT),
+                            height=1,
+                            style="class:pause.prompt",
+                        ),
+                    ]
+                ),
+                title=lambda: self.title,
+                style="class:pause",
+            ),
+            filter=Condition(lambda: self.visible),
+        )
+
+    def _end_of_output(self) -> Point:
+        # The cursor sits on the last line, so the window scrolls to it.
+        return Point(x=0, y=max(0, self.text.count("\n") - 1))
+
+    async def wait(self, output: str, title: str = ""):
+        """Shows `output` and waits until the user continues."""
+        self.text = output.strip("\n") + "\n" if output.strip() else ""
+        self.title = title
+        self.visible = True
+        self._result = asyncio.get_running_loop().create_future()
+        self.app.application.layout.focus(self.output_window)
+        self.app.application.invalidate()
+        try:
+            await self._result
+        finally:
+            self.visible = False
+            self._result = None
+            self.text = ""
+            self.app.focus_menu()
+
+    def close(self):
+        if self._result is not None and not self._result.done():
+            self._result.set_result(None)
+
+    def add_key_bindings(self, kb: KeyBindings) -> Filter:
+        """
+        Adds the bindings active while the panel is shown to `kb`. Returns
+        the filter that tells whether it is shown, so that the app can
+        disable its own bindings meanwhile.
+        """
+        is_open = Condition(lambda: self.visible)
+
+        @kb.add("enter", filter=is_open)
+        @kb.add("escape", filter=is_open, eager=True)
+        @kb.add("c-c", filter=is_open)
+        @kb.add("q", filter=is_open)
+        def _(event):
+            self.close()
+
+        return is_open
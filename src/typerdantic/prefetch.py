@@ -0,0 +1,231 @@
+# src/typerdantic/prefetch.py
+
+"""
+Speculative prefetching of the menu behind the highlighted item.
+
+Navigating to a sub-menu builds it (`menu_class(app=app)`, which runs
+`get_items()`) only after Enter is pressed. With a MenuPrefetcher, the app
+starts building the target menu of the highlighted item once the cursor has
+rested on it for `dwell` seconds, so that Enter finds it ready:
+
+    app = TyperdanticApp(main_menu=MainMenu, prefetcher=MenuPrefetcher())
+
+Moving the cursor to another item cancels the pending prefetch (a menu that
+is already being built in a thread is finished, but thrown away).
+Prefetched menus are kept within a count and memory budget, and are thrown
+away instead of shown if an action invalidated their data in the meantime.
+Menus that are thrown away get their `on_close()` called, as if they had
+been shown and left.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import sys
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .app import TyperdanticApp
+    from .base import TyperdanticMenu
+    from .models import MenuItem
+
+
+def approximate_size(menu: "TyperdanticMenu") -> int:
+    """
+    A rough estimate of the memory held by a menu's items, in bytes.
+
+    Counts the item list, each (name, item) pair and the items' own fields,
+    but not objects shared with the rest of the app (actions, arguments).
+    """
+    items = menu._menu_items
+    size = sys.getsizeof(menu) + sys.getsizeof(items)
+    for name, item in items:
+        size += sys.getsizeof(name) + sys.getsizeof(item)
+        size += sys.getsizeof(item.__dict__) + sys.getsizeof(item.description)
+    return size
+
+
+class PrefetchStats:
+    """Counters describing how useful a MenuPrefetcher is."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.cancelled = 0
+        self.stale = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "cancelled": self.cancelled,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "errors": self.errors,
+        }
+
+
+class MenuPrefetcher:
+    """
+    Builds the highlighted item's target menu in the background.
+
+    Args:
+        dwell: Seconds the cursor must rest on an item before its target
+            menu is built. Scrolling past items does not build anything.
+        max_menus: How many prefetched menus are kept at most; the least
+            recently prefetched are dropped first.
+        max_bytes: Memory budget for prefetched menus, as estimated by
+            `size_of`. A menu larger than the whole budget is not kept.
+        threaded: Build menus in a worker thread, keeping the event loop
+            free. Set to False if a menu's `get_items()` must run on the
+            event loop thread; it is then built on the loop after the dwell.
+        size_of: Estimates the memory held by a menu, in bytes.
+    """
+
+    def __init__(
+        self,
+        dwell: float = 0.15,
+        max_menus: int = 4,
+        max_bytes: int = 4 * 1024 * 1024,
+        threaded: bool = True,
+        size_of: Callable[["TyperdanticMenu"], int] = approximate_size,
+    ):
+        self.dwell = dwell
+        self.max_menus = max_menus
+        self.max_bytes = max_bytes
+        self.threaded = threaded
+        self.size_of = size_of
+        self.stats = PrefetchStats()
+        self.app: Optional["TyperdanticApp"] = None
+        self._ready: "OrderedDict[str, Tuple[TyperdanticMenu, int]]" = OrderedDict()
+        self._bytes = 0
+        self._pending: Optional[asyncio.Task] = None
+        self._pending_name: Optional[str] = None
+
+    def bind(self, app: "TyperdanticApp"):
+        """Attaches the prefetcher to the app whose menus it builds."""
+        self.app = app
+
+    @property
+    def memory_used(self) -> int:
+        """Estimated bytes held by prefetched menus."""
+        return self._bytes
+
+    def __contains__(self, menu_name: str) -> bool:
+        return menu_name in self._ready
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    def schedule(self, item: Optional["MenuItem"]):
+        """
+        Called when the cursor lands on `item`: starts the dwell timer for
+        its target menu and cancels a prefetch of any other menu.
+        """
+        name = item.target_menu if item is not None else None
+        if name is not None and name == self._pending_name:
+            return
+        self.cancel()
+        if name is None or name in self._ready:
+            return
+        if self.app is None or not self.app.has_menu(name):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Not running (e.g. the generated CLI): nothing to prefetch for.
+            return
+        self._pending_name = name
+        self._pending = loop.create_task(self._prefetch(name))
+
+    def cancel(self):
+        """Cancels the pending prefetch, if any."""
+        if self._pending is not None and not self._pending.done():
+            self._pending.cancel()
+            self.stats.cancelled += 1
+        self._pending = None
+        self._pending_name = None
+
+    def take(self, menu_name: str) -> Optional["TyperdanticMenu"]:
+        """
+        Hands over the prefetched menu `menu_name`, or returns None if there
+        is none or its data changed since it was built.
+        """
+        entry = self._ready.pop(menu_name, None)
+        if entry is None:
+            if menu_name == self._pending_name:
+                # Still building: the caller builds it itself, so don't
+                # keep a second copy.
+                self.cancel()
+            self._record("miss")
+            return None
+        menu, size = entry
+        self._bytes -= size
+        if menu.needs_refresh():
+            menu.on_close()
+            self.stats.stale += 1
+            self._record("miss")
+            return None
+        self._record("hit")
+        return menu
+
+    def clear(self):
+        """Cancels the pending prefetch and drops every prefetched menu."""
+        self.cancel()
+        for menu, _ in self._ready.values():
+            menu.on_close()
+        self._ready.clear()
+        self._bytes = 0
+
+    async def _prefetch(self, name: str):
+        await asyncio.sleep(self.dwell)
+        build = functools.partial(self.app.build_menu, name)
+        try:
+            if self.threaded:
+                loop = asyncio.get_running_loop()
+                context = contextvars.copy_context()
+                menu = await loop.run_in_executor(None, context.run, build)
+            else:
+                menu = build()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Navigating to the menu will raise the error where it belongs.
+            self.stats.errors += 1
+            return
+        finally:
+            if self._pending is asyncio.current_task():
+                self._pending = None
+                self._pending_name = None
+        self._store(name, menu)
+
+    def _store(self, name: str, menu: "TyperdanticMenu"):
+        size = self.size_of(menu)
+        if size > self.max_bytes or self.max_menus <= 0:
+            menu.on_close()
+            self.stats.evictions += 1
+            return
+        old = self._ready.pop(name, None)
+        if old is not None:
+            old[0].on_close()
+            self._bytes -= old[1]
+        self._ready[name] = (menu, size)
+        self._bytes += size
+        while len(self._ready) > self.max_menus or self._bytes > self.max_bytes:
+            _, (evicted, evicted_size) = self._ready.popitem(last=False)
+            evicted.on_close()
+            self._bytes -= evicted_size
+            self.stats.evictions += 1
+
+    def _record(self, result: str):
+        if result == "hit":
+            self.stats.hits += 1
+        else:
+            self.stats.misses += 1
+        if self.app is not None and self.app.metrics:
+            self.app.metrics.inc("typerdantic_prefetch_total", result=result)
@@ -0,0 +1,178 @@
+# src/typerdantic/profiling.py
+
+"""
+Session profiling for TyperdanticApp.
+
+A Profiler keeps one cProfile.Profile per labelled section (for example
+"MainMenu.render" or "MainMenu.action.Deploy") and writes a pstats file per
+section plus a text summary when the session ends. Optionally, tracemalloc
+snapshots are taken to report the top allocation sites.
+"""
+
+import cProfile
+import contextvars
+import io
+import pstats
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+# The profiles of the sections the current task is in, outermost first.
+_section_stack: contextvars.ContextVar[Tuple[cProfile.Profile, ...]] = (
+    contextvars.ContextVar("typerdantic_profiler_sections", default=())
+)
+
+
+class Profiler:
+    """
+    Collects per-section CPU profiles for one application session.
+
+    Sections may nest (e.g. an action inside a selection). Only one profiler
+    can be active at a time, so entering a nested section pauses the outer
+    one: each section's report covers its own time, not its children's.
+
+    Each task keeps its own stack of sections. Because sections can span
+    `await`, the profile of an async section also includes whatever else
+    the event loop ran in the meantime; a section another task enters
+    meanwhile (e.g. a concurrent selection) is therefore not profiled
+    separately.
+
+    Args:
+        output_dir: Directory that receives one sub-directory per session.
+        trace_memory: If True, trace allocations with tracemalloc.
+        top_n: Number of entries to include in the text summaries.
+        sample_all_menus: Whether menus are profiled until toggled off.
+            If False, menus are only profiled after `toggle_menu`.
+    """
+
+    def __init__(
+        self,
+        output_dir: Union[str, Path],
+        trace_memory: bool = False,
+        top_n: int = 25,
+        sample_all_menus: bool = True,
+    ):
+        self.output_dir = Path(output_dir)
+        self.trace_memory = trace_memory
+        self.top_n = top_n
+        self.sample_all_menus = sample_all_menus
+        self.session_name = time.strftime("session-%Y%m%d-%H%M%S")
+        self.profiles: Dict[str, cProfile.Profile] = {}
+        self._menu_overrides: Dict[str, bool] = {}
+        # The profile that is collecting, if any.
+        self._active: Optional[cProfile.Profile] = None
+        self._start_snapshot: Optional[tracemalloc.Snapshot] = None
+
+    def start(self):
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(10)
+            self._start_snapshot = tracemalloc.take_snapshot()
+
+    def is_sampled(self, menu: str) -> bool:
+        return self._menu_overrides.get(menu, self.sample_all_menus)
+
+    def toggle_menu(self, menu: str) -> bool:
+        """Toggles sampling for `menu` and returns the new state."""
+        self._menu_overrides[menu] = not self.is_sampled(menu)
+        return self._menu_overrides[menu]
+
+    @contextmanager
+    def section(self, label: str, menu: Optional[str] = None) -> Iterator[None]:
+        """Profiles the `with` block into the profile named `label`."""
+        if menu is not None and not self.is_sampled(menu):
+            yield
+            return
+
+        stack = _section_stack.get()
+        if stack and stack[-1] is self._active:
+            outer: Optional[cProfile.Profile] = stack[-1]
+        elif self._active is None:
+            # Outermost section (of a task whose outer sections have ended).
+            outer, stack = None, ()
+        else:
+            # Another task's section is collecting, and includes this one.
+            yield
+            return
+
+        profile = self.profiles.get(label)
+        if profile is None:
+            profile = self.profiles[label] = cProfile.Profile()
+        if profile in stack:
+            # Re-entrant section (e.g. a nested render); already collecting.
+            yield
+            return
+
+        if outer is not None:
+            outer.disable()
+        token = _section_stack.set(stack + (profile,))
+        self._active = profile
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            _section_stack.reset(token)
+            self._active = outer
+            if outer is not None:
+                outer.enable()
+
+    def write_reports(self) -> List[Path]:
+        """
+        Writes `<label>.pstats` for every section, `summary.txt` with the top
+        functions per section, and `allocations.txt` if memory was traced.
+        Returns the paths written.
+        """
+        session_dir = self.output_dir / self.session_name
+        session_dir.mkdir(parents=True, exist_ok=True)
+        written: List[Path] = []
+
+        summary = io.StringIO()
+        for label, profile in sorted(self.profiles.items()):
+            stats_path = session_dir / f"{_safe_filename(label)}.pstats"
+            profile.dump_stats(stats_path)
+            written.append(stats_path)
+
+            summary.write(f"=== {label} ===\n")
+            try:
+                stats = pstats.Stats(profile, stream=summary)
+            except TypeError:
+                # The section never ran any Python code.
+                summary.write("(no samples)\n\n")
+                continue
+            stats.sort_stats("cumulative").print_stats(self.top_n)
+
+        summary_path = session_dir / "summary.txt"
+        summary_path.write_text(summary.getvalue(), encoding="utf-8")
+        written.append(summary_path)
+
+        if self.trace_memory and tracemalloc.is_tracing():
+            written.append(self._write_allocations(session_dir / "allocations.txt"))
+        return written
+
+    def _write_allocations(self, path: Path) -> Path:
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        if self._start_snapshot is not None:
+            stats = snapshot.compare_to(self._start_snapshot, "lineno")
+            header = f"Top {self.top_n} allocation sites (growth since start)"
+        else:
+            stats = snapshot.statistics("lineno")
+            header = f"Top {self.top_n} allocation sites"
+
+        lines = [header, ""]
+        lines.extend(str(stat) for stat in stats[: self.top_n])
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+    def stop(self):
+        if self.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+
+def _safe_filename(label: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", label).strip("_") or "section"
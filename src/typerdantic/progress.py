@@ -0,0 +1,182 @@
+# src/typerdantic/progress.py
+
+"""
+Progress reporting for running actions.
+
+Every action run by a TyperdanticApp finds a ProgressHandle in
+`context["progress"]`:
+
+    async def sync_repos(context: dict, args: dict):
+        progress = context["progress"]
+        progress.total = len(repos)
+        for repo in repos:
+            progress.message = repo.name
+            await repo.pull()
+            progress.advance()
+
+Reporting is cheap and thread-safe: `advance()` only updates counters under
+a lock. The app polls the handle and redraws its progress bar at a fixed
+rate, so an action can report millions of increments without flooding the
+event loop with redraws.
+"""
+
+import re
+import threading
+import time
+from typing import Callable, Optional, Pattern, Tuple, Union
+
+
+class ProgressHandle:
+    """
+    Thread-safe progress state of one running action.
+
+    Attributes:
+        completed: Units of work done so far.
+        total: Units of work expected, or None if unknown.
+        message: A short description of the current step.
+    """
+
+    def __init__(self, total: Optional[float] = None, message: str = ""):
+        self._lock = threading.Lock()
+        self._completed: float = 0
+        self._total = total
+        self._message = message
+        self._version = 0
+        self.started_at = time.monotonic()
+
+    @property
+    def completed(self) -> float:
+        return self._completed
+
+    @property
+    def total(self) -> Optional[float]:
+        return self._total
+
+    @total.setter
+    def total(self, value: Optional[float]):
+        with self._lock:
+            self._total = value
+            self._version += 1
+
+    @property
+    def message(self) -> str:
+        return self._message
+
+    @message.setter
+    def message(self, value: str):
+        with self._lock:
+            self._message = value
+            self._version += 1
+
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever the progress changes."""
+        return self._version
+
+    def advance(self, n: float = 1):
+        """Marks `n` more units of work as done."""
+        with self._lock:
+            self._completed += n
+            self._version += 1
+
+    def update(
+        self,
+        completed: Optional[float] = None,
+        total: Optional[float] = None,
+        message: Optional[str] = None,
+    ):
+        """Sets any of `completed`, `total` and `message` at once."""
+        with self._lock:
+            if completed is not None:
+                self._completed = completed
+            if total is not None:
+                self._total = total
+            if message is not None:
+                self._message = message
+            self._version += 1
+
+    def snapshot(self) -> Tuple[float, Optional[float], str]:
+        """Returns a consistent (completed, total, message) triple."""
+        with self._lock:
+            return self._completed, self._total, self._message
+
+    @property
+    def fraction(self) -> Optional[float]:
+        """The completed fraction between 0 and 1, or None if unknown."""
+        completed, total, _ = self.snapshot()
+        if not total:
+            return None
+        return max(0.0, min(1.0, completed / total))
+
+    def rate(self) -> float:
+        """Average units per second since the handle was created."""
+        elapsed = time.monotonic() - self.started_at
+        return self._completed / elapsed if elapsed > 0 else 0.0
+
+
+def render_progress(handle: ProgressHandle, width: int = 30) -> str:
+    """Formats `handle` as a one-line text progress bar."""
+    completed, total, message = handle.snapshot()
+    fraction = handle.fraction
+    if fraction is None:
+        # Unknown total: show a bouncing marker instead of a fill.
+        position = int(completed) % (2 * width - 2) if width > 1 else 0
+        if position >= width:
+            position = 2 * width - 2 - position
+        bar = " " * position + "#" + " " * (width - position - 1)
+        counts = _format_count(completed)
+    else:
+        filled = int(fraction * width)
+        bar = "#" * filled + "-" * (width - filled)
+        done, expected = _format_count(completed), _format_count(total)
+        counts = f"{fraction:4.0%} {done}/{expected}"
+    line = f"[{bar}] {counts} ({handle.rate():.1f}/s)"
+    return f"{line} {message}" if message else line
+
+
+def _format_count(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else f"{value:.1f}"
+
+
+def progress_line_parser(
+    pattern: Union[str, Pattern[str]], handle: ProgressHandle
+) -> Callable[[str], None]:
+    """
+    Returns a callback that updates `handle` from lines of command output.
+
+    The pattern is searched in every line. Named groups `completed`, `total`,
+    `percent` and `message` are used if present; otherwise the first group is
+    the completed count and the second, if any, the total. For example:
+
+        r"(?P<percent>\\d+)%"
+        r"\\[(\\d+)/(\\d+)\\]"
+    """
+    regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+
+    def on_line(line: str):
+        match = regex.search(line)
+        if not match:
+            return
+        groups = match.groupdict()
+        if "percent" in groups and groups["percent"] is not None:
+            handle.update(completed=float(groups["percent"]), total=100)
+        elif groups:
+            handle.update(
+                completed=_number(groups.get("completed")),
+                total=_number(groups.get("total")),
+                message=groups.get("message"),
+            )
+        elif regex.groups:
+            total = match.group(2) if regex.groups > 1 else None
+            handle.update(completed=_number(match.group(1)), total=_number(total))
+
+    return on_line
+
+
+def _number(text: Optional[str]) -> Optional[float]:
+    if text is None:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        return None
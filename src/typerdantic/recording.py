@@ -0,0 +1,342 @@
+# src/typerdantic/recording.py
+
+"""
+Records operator sessions as timestamped JSON lines and replays them
+headlessly against a TyperdanticApp for performance regression testing.
+
+A recording holds the raw key input, plus menu transitions, selections and
+the values entered at runtime prompts:
+
+    {"type": "header", "version": 1, "main_menu": "MainMenu", ...}
+    {"t": 0.84, "type": "key", "data": "\\u001b[B"}
+    {"t": 1.02, "type": "selection", "menu": "MainMenu", "item": "Deploy"}
+    {"t": 1.02, "type": "navigate", "menu": "deploy"}
+    {"t": 3.51, "type": "prompt", "item": "Deploy", "values": {"version": "1.2"}}
+    {"t": 9.10, "type": "end", "nav_stack": ["main"], "selected_index": 2}
+"""
+
+import asyncio
+import json
+import statistics
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, TextIO, Union
+
+from prompt_toolkit.application import create_app_session, get_app_session
+from prompt_toolkit.input import Input, create_pipe_input
+from prompt_toolkit.keys import Keys
+from prompt_toolkit.output import DummyOutput, Output
+from pydantic import BaseModel
+
+from .app import TyperdanticApp
+from .models import MenuItem
+
+FORMAT_VERSION = 1
+
+
+def _nav_state(app: TyperdanticApp) -> Dict[str, Any]:
+    return {
+        "nav_stack": [
+            app.menu_name_of(menu) or type(menu).__name__ for menu in app.nav_stack
+        ],
+        "selected_index": app.active_menu._selected_index,
+    }
+
+
+class SessionRecorder:
+    """
+    Records a running app's session to a JSON-lines file.
+
+    Example:
+        recorder = SessionRecorder(app, "session.jsonl")
+        recorder.start()
+        try:
+            await app.application.run_async()
+        finally:
+            recorder.stop()
+
+    `TyperdanticApp.run(record_path=...)` does this for you.
+    """
+
+    def __init__(self, app: TyperdanticApp, path: Union[str, Path]):
+        self.app = app
+        self.path = Path(path)
+        self._file: Optional[TextIO] = None
+        self._started_at = 0.0
+        self._input: Optional[Input] = None
+        self._prompting = False
+
+        app.on("navigate", self._on_navigate)
+        app.on("back", self._on_back)
+        app.on("selection", self._on_selection)
+        app.on("prompt", self._on_prompt)
+        app.on("selection_done", self._on_selection_done)
+
+    @property
+    def recording(self) -> bool:
+        return self._file is not None
+
+    def start(self):
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._started_at = time.perf_counter()
+        self._write(
+            {
+                "type": "header",
+                "version": FORMAT_VERSION,
+                "main_menu": type(self.app.nav_stack[0]).__name__,
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            },
+            timestamp=False,
+        )
+
+        # Wrap the input's read_keys on the instance to see every key press,
+        # including those read by nested prompts sharing the same input.
+        self._input = self.app.application.input
+        read_keys = self._input.read_keys
+
+        def recording_read_keys():
+            key_presses = read_keys()
+            for key_press in key_presses:
+                if key_press.key != Keys.CPRResponse and self.recording:
+                    event = {"type": "key", "data": key_press.data}
+                    if self._prompting:
+                        event["during_prompt"] = True
+                    self._write(event)
+            return key_presses
+
+        self._input.read_keys = recording_read_keys
+
+    def stop(self):
+        if not self.recording:
+            return
+        self._write({"type": "end", **_nav_state(self.app)})
+        if self._input is not None and "read_keys" in vars(self._input):
+            del self._input.read_keys
+        self._file.close()
+        self._file = None
+
+    def _write(self, event: Dict[str, Any], timestamp: bool = True):
+        if timestamp:
+            event = {"t": round(time.perf_counter() - self._started_at, 6), **event}
+        self._file.write(json.dumps(event) + "\n")
+
+    def _on_navigate(self, app: TyperdanticApp, menu_name: str):
+        if self.recording:
+            self._write({"type": "navigate", "menu": menu_name})
+
+    def _on_back(self, app: TyperdanticApp):
+        if self.recording:
+            self._write({"type": "back"})
+
+    def _on_selection(self, app: TyperdanticApp, item: MenuItem):
+        if self.recording:
+            self._prompting = bool(
+                item.action and item.prompt_args and item.batch is None
+            )
+            self._write(
+                {
+                    "type": "selection",
+                    "menu": type(app.active_menu).__name__,
+                    "item": item.description,
+                    "index": app.active_menu._selected_index,
+                }
+            )
+
+    def _on_prompt(self, app: TyperdanticApp, item: MenuItem, values: Dict[str, Any]):
+        if self.recording:
+            self._prompting = False
+            self._write(
+                {
+                    "type": "prompt",
+                    "item": item.description,
+                    "values": {name: str(value) for name, value in values.items()},
+                }
+            )
+
+    def _on_selection_done(self, app: TyperdanticApp, item: MenuItem):
+        # A cancelled form ends the prompt without a "prompt" event.
+        self._prompting = False
+
+
+def load_session(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Reads a recorded session, one event per line."""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class ReplayStep(BaseModel):
+    """Timing of one replayed key press."""
+
+    index: int
+    key: str
+    recorded_at: float
+    latency: float
+
+
+class ReplayReport(BaseModel):
+    """The outcome of replaying a recorded session."""
+
+    steps: List[ReplayStep]
+    duration: float
+    final_nav_stack: List[str]
+    final_selected_index: int
+    expected_nav_stack: Optional[List[str]] = None
+    expected_selected_index: Optional[int] = None
+
+    @property
+    def matches_recording(self) -> bool:
+        """Whether the replay ended where the recorded session ended."""
+        return (
+            self.final_nav_stack == self.expected_nav_stack
+            and self.final_selected_index == self.expected_selected_index
+        )
+
+    def latency_percentile(self, q: float) -> float:
+        latencies = sorted(step.latency for step in self.steps)
+        if len(latencies) < 2:
+            return latencies[0] if latencies else 0.0
+        return statistics.quantiles(latencies, n=100, method="inclusive")[
+            int(q * 100) - 1
+        ]
+
+
+async def replay_session(
+    app_factory: Callable[[Input, Output], TyperdanticApp],
+    path: Union[str, Path],
+    speed: Optional[float] = None,
+    stub_actions: bool = False,
+    step_timeout: float = 10.0,
+) -> ReplayReport:
+    """
+    Replays a recorded session against a headless app.
+
+    Args:
+        app_factory: Builds the app (with its menus registered) for the given
+            input and output, e.g. `lambda i, o: make_app(input=i, output=o)`.
+        path: The recording to replay.
+        speed: None replays as fast as possible; 1.0 replays at the recorded
+            pace, 2.0 twice as fast, and so on.
+        stub_actions: If True, item actions are not run.
+        step_timeout: Maximum seconds to wait for a step to settle.
+
+    Returns:
+        A ReplayReport with per-step latency and the final navigation state.
+    """
+    events = load_session(path)
+    key_events = [
+        e for e in events if e["type"] == "key" and not e.get("during_prompt")
+    ]
+    recorded_prompts = deque(e["values"] for e in events if e["type"] == "prompt")
+    end = next((e for e in events if e["type"] == "end"), {})
+
+    with create_pipe_input() as pipe_input:
+        output = DummyOutput()
+        # Nested prompts (e.g. "Press Enter to continue...") use the app
+        # session's input, so route that through the pipe as well.
+        with create_app_session(input=pipe_input, output=output):
+            app = app_factory(pipe_input, output)
+
+            async def replay_prompt(item: MenuItem) -> Dict[str, Any]:
+                if recorded_prompts:
+                    return dict(recorded_prompts.popleft())
+                return {spec.name: str(spec.default or "") for spec in item.prompt_args}
+
+            async def skip_action(item: MenuItem, context: dict, args: dict):
+                return None
+
+            app._prompt_for_args = replay_prompt
+            if stub_actions:
+                app._run_action = skip_action
+
+            steps = await _drive(app, pipe_input, key_events, speed, step_timeout)
+            state = _nav_state(app)
+
+    return ReplayReport(
+        steps=steps,
+        duration=sum(step.latency for step in steps),
+        final_nav_stack=state["nav_stack"],
+        final_selected_index=state["selected_index"],
+        expected_nav_stack=end.get("nav_stack"),
+        expected_selected_index=end.get("selected_index"),
+    )
+
+
+async def _drive(
+    app: TyperdanticApp,
+    pipe_input,
+    key_events: List[Dict[str, Any]],
+    speed: Optional[float],
+    step_timeout: float,
+) -> List[ReplayStep]:
+    application = app.application
+    renders = 0
+    busy = 0
+
+    def on_render(_sender):
+        nonlocal renders
+        renders += 1
+
+    def on_selection(_app, item):
+        nonlocal busy
+        busy += 1
+
+    def on_selection_done(_app, item):
+        nonlocal busy
+        busy -= 1
+
+    application.after_render += on_render
+    app.on("selection", on_selection)
+    app.on("selection_done", on_selection_done)
+
+    def settled(renders_before: int) -> bool:
+        if busy:
+            # A selection is still running. It has settled once it waits for
+            # input in the pause panel, or in a nested prompt that has drawn
+            # itself.
+            if app.pause_panel.visible:
+                return True
+            nested = get_app_session().app
+            return (
+                nested is not None and nested is not application and nested.is_running
+            )
+        return renders > renders_before
+
+    steps: List[ReplayStep] = []
+    run_task = asyncio.ensure_future(app.run())
+    loop = asyncio.get_running_loop()
+    try:
+        while renders == 0 and not run_task.done():
+            await asyncio.sleep(0.001)
+
+        started = loop.time()
+        for index, event in enumerate(key_events):
+            if run_task.done():
+                break
+            if speed:
+                delay = started + event["t"] / speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+            renders_before = renders
+            sent = time.perf_counter()
+            pipe_input.send_text(event["data"])
+            deadline = loop.time() + step_timeout
+            while not run_task.done() and not settled(renders_before):
+                if loop.time() > deadline:
+                    break
+                await asyncio.sleep(0.0005)
+            steps.append(
+                ReplayStep(
+                    index=index,
+                    key=event["data"],
+                    recorded_at=event["t"],
+                    latency=time.perf_counter() - sent,
+                )
+            )
+    finally:
+        if not run_task.done():
+            application.exit()
+        await run_task
+        application.after_render -= on_render
+    return steps
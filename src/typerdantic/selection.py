@@ -0,0 +1,110 @@
+# src/typerdantic/selection.py
+
+"""
+The filter bar of a running app.
+
+Press `/` and type to show only the items of the active menu whose
+description contains every typed word. Enter keeps the filter and returns
+to the menu; Esc clears it. While a filter is set, it is shown below the
+menu. Together with marking (Space, Shift-Up/Down and `*`), this selects
+the items to run at once with `x` (see `typerdantic.bulk`).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from prompt_toolkit.buffer import Buffer
+from prompt_toolkit.filters import Condition, Filter
+from prompt_toolkit.key_binding import KeyBindings
+from prompt_toolkit.layout.containers import (
+    ConditionalContainer,
+    HSplit,
+    VSplit,
+    Window,
+)
+from prompt_toolkit.layout.controls import BufferControl, FormattedTextControl
+
+if TYPE_CHECKING:
+    from .app import TyperdanticApp
+
+
+class FilterBar:
+    """The filter input below the menu, bound to a TyperdanticApp."""
+
+    def __init__(self, app: "TyperdanticApp"):
+        self.app = app
+        self.editing = False
+        self.buffer = Buffer(multiline=False, on_text_changed=self._on_text_changed)
+        self.input_window = Window(BufferControl(self.buffer), height=1)
+        label = Window(FormattedTextControl("/"), width=2, style="class:filter")
+        self.container = HSplit(
+            [
+                ConditionalContainer(
+                    VSplit([label, self.input_window]),
+                    filter=Condition(lambda: self.editing),
+                ),
+                ConditionalContainer(
+                    Window(
+                        FormattedTextControl(self._get_filter_fragments),
+                        height=1,
+                        style="class:filter",
+                    ),
+                    filter=Condition(
+                        lambda: not self.editing and bool(app.active_menu.filter_query)
+                    ),
+                ),
+            ]
+        )
+
+    def open(self):
+        self.editing = True
+        # Edit the filter of the menu shown now.
+        self.buffer.text = self.app.active_menu.filter_query
+        self.buffer.cursor_position = len(self.buffer.text)
+        self.app.application.layout.focus(self.input_window)
+
+    def close(self, clear: bool = False):
+        if clear:
+            self.buffer.text = ""
+        self.editing = False
+        self.app.focus_menu()
+        self.app._on_cursor_moved()
+
+    def _on_text_changed(self, _buffer: Buffer):
+        if self.editing:
+            self.app.active_menu.set_filter(self.buffer.text)
+
+    def _get_filter_fragments(self):
+        return [
+            ("", f"/{self.app.active_menu.filter_query}  (/ to edit, Esc to clear)")
+        ]
+
+    def add_key_bindings(self, kb: KeyBindings, enabled: Filter) -> Filter:
+        """
+        Adds `/` (active under `enabled`) and the bindings active while the
+        filter is edited to `kb`. Returns the filter that tells whether it
+        is being edited.
+        """
+        is_editing = Condition(lambda: self.editing)
+        has_filter = Condition(lambda: bool(self.app.active_menu.filter_query))
+
+        @kb.add("/", filter=enabled & ~is_editing)
+        def _(event):
+            self.open()
+
+        @kb.add("enter", filter=is_editing)
+        @kb.add("down", filter=is_editing)
+        def _(event):
+            self.close()
+
+        @kb.add("escape", filter=is_editing, eager=True)
+        @kb.add("c-c", filter=is_editing)
+        def _(event):
+            self.close(clear=True)
+
+        @kb.add("escape", filter=enabled & ~is_editing & has_filter, eager=True)
+        def _(event):
+            self.app.active_menu.set_filter("")
+
+        return is_editing
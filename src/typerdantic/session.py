@@ -0,0 +1,180 @@
+# src/typerdantic/session.py
+
+"""
+Saves where the user was in an app, to resume there on the next start.
+
+    session = SessionStore("~/.mytool/session.json")
+    app = TyperdanticApp(main_menu=MainMenu, session=session)
+
+The state covers the navigation stack (by registered menu name), the
+highlighted item, scroll offset and filter of each menu on it, and the last
+values entered for each item's `prompt_args`, which become the defaults of
+the next prompts. It is written as compact JSON, atomically, when the app
+exits and every `save_interval` seconds while it runs (only if it changed),
+so a dropped SSH connection loses at most a few seconds.
+
+On the next `run()`, only the menu that was on top is built right away.
+The menus below it are built when the user goes back to them.
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    from .app import TyperdanticApp
+
+# Bumped when the saved format changes; other versions are ignored.
+SESSION_FORMAT = 1
+
+
+class MenuState(BaseModel):
+    """A menu on the navigation stack, and what it showed."""
+
+    name: str
+    selected: Optional[str] = None
+    scroll: int = 0
+    filter: str = ""
+
+
+class SessionState(BaseModel):
+    """Everything a SessionStore saves."""
+
+    format: int = SESSION_FORMAT
+    main: str
+    stack: List[MenuState] = []
+    prompt_values: Dict[str, Dict[str, Any]] = {}
+    saved_at: float = 0.0
+
+
+class SessionStore:
+    """
+    Loads and saves the session of a TyperdanticApp (see the module docs).
+
+    Args:
+        path: The JSON file to keep the session in.
+        save_interval: Seconds between saves while the app runs.
+    """
+
+    def __init__(self, path: Union[str, Path], save_interval: float = 2.0):
+        self.path = Path(path).expanduser()
+        self.save_interval = save_interval
+        self.prompt_values: Dict[str, Dict[str, Any]] = {}
+        # What was saved last, without its timestamp.
+        self._saved: Optional[bytes] = None
+
+    def load(self) -> Optional[SessionState]:
+        """The saved session, or None if there is no usable one."""
+        try:
+            data = self.path.read_bytes()
+            state = SessionState.model_validate_json(data)
+        except (OSError, ValidationError):
+            return None
+        if state.format != SESSION_FORMAT:
+            return None
+        self._saved = _encode(state.model_dump(exclude={"saved_at"}))
+        self.prompt_values = dict(state.prompt_values)
+        return state
+
+    def save(self, state: SessionState) -> bool:
+        """
+        Writes `state` unless it equals what was saved last. Returns whether
+        the file was written.
+        """
+        body = state.model_dump(exclude={"saved_at"})
+        # Compare without the timestamp, so an unchanged session isn't written.
+        unchanged = _encode(body)
+        if unchanged == self._saved:
+            return False
+        data = _encode({**body, "saved_at": time.time()})
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}."
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            _unlink_quietly(temp_path)
+            raise
+        self._saved = unchanged
+        return True
+
+    def clear(self):
+        """Deletes the saved session, so the next start is a fresh one."""
+        _unlink_quietly(self.path)
+        self._saved = None
+        self.prompt_values = {}
+
+    # --- Prompt values ---
+
+    def prompt_defaults(self, key: str) -> Dict[str, Any]:
+        return self.prompt_values.get(key, {})
+
+    def remember_prompt(self, key: str, values: Dict[str, Any]):
+        self.prompt_values[key] = {**self.prompt_values.get(key, {}), **values}
+
+    # --- Capturing and restoring an app ---
+
+    def capture(self, app: "TyperdanticApp") -> SessionState:
+        """The current session of `app`."""
+        main = app.nav_stack[0]
+        stack = [MenuState(name="main", **main.view_state())]
+        stack += app._deferred_menus
+        for menu in app.nav_stack[1:]:
+            name = app.menu_name_of(menu)
+            if name is None:
+                # A menu built by code (e.g. a results view) can't be rebuilt.
+                break
+            stack.append(MenuState(name=name, **menu.view_state()))
+        return SessionState(
+            main=type(main).__name__,
+            stack=stack,
+            prompt_values=self.prompt_values,
+        )
+
+    def restore(self, app: "TyperdanticApp", state: Optional[SessionState]) -> bool:
+        """
+        Brings `app` back to `state`: the main menu's view and the top menu
+        are restored now, the menus in between when they are shown again.
+        Returns False if `state` is missing or belongs to another app.
+        """
+        if state is None or state.main != type(app.nav_stack[0]).__name__:
+            return False
+        if not state.stack or state.stack[0].name != "main":
+            return False
+        levels = []
+        for menu_state in state.stack[1:]:
+            if not app.has_menu(menu_state.name):
+                break
+            levels.append(menu_state)
+        main_state = state.stack[0]
+        app.nav_stack[0].restore_view(
+            main_state.selected, main_state.scroll, main_state.filter
+        )
+        for menu in app.nav_stack[1:]:
+            menu.on_close()
+        del app.nav_stack[1:]
+        app._deferred_menus = []
+        app.active_menu = app.nav_stack[0]
+        if levels:
+            app._deferred_menus = levels[:-1]
+            app._show_restored(levels[-1])
+        return True
+
+
+def _encode(body: Dict[str, Any]) -> bytes:
+    return json.dumps(body, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def _unlink_quietly(path: Union[str, Path]):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
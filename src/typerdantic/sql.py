@@ -0,0 +1,414 @@
+# src/typerdantic/sql.py
+
+"""
+The `sql` action type: parameterized queries against a database.
+
+    [items.find_host.action]
+    type = "sql"
+    value = "SELECT name, ip, role FROM hosts WHERE name LIKE :pattern"
+    database = "inventory.db"
+    prompt_args = [{ name = "pattern", prompt = "Host pattern", default = "%" }]
+
+The query's named parameters (`:pattern`) are bound from the item's `args`
+and `prompt_args`, never formatted into the SQL text. Connections come from
+a small pool per database, so repeated queries skip connecting and reuse
+the statements the driver has already prepared.
+
+In a running app, the rows of a query are shown in a SqlResultsMenu: they
+are fetched `page_size` at a time with `fetchmany` as the user asks for
+more, and selecting a row shows all of its columns. The connection goes
+back to the pool when the menu is closed; if the query fails, the menu shows
+the error instead. Elsewhere (for example from the
+generated CLI, or in watch mode), the rows are printed as they are fetched. Writes are
+committed before their connection goes back to the pool; for statements
+that return no rows, the number of changed rows is reported.
+
+`database` is a path to an SQLite file (or `sqlite:///path`). Other DB-API
+drivers are added with `register_driver`:
+
+    register_driver("postgresql", lambda url: psycopg.connect(url))
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .base import TyperdanticMenu
+from .models import MenuItem
+
+if TYPE_CHECKING:
+    from .app import TyperdanticApp
+
+# Opens a DB-API connection for a database URL.
+Connect = Callable[[str], Any]
+
+
+def _connect_sqlite(database: str) -> sqlite3.Connection:
+    path = database[len("sqlite:///") :] if database.startswith("sqlite:") else database
+    # Connections move between worker threads, but only one uses each at a time.
+    return sqlite3.connect(path, check_same_thread=False)
+
+
+_drivers: Dict[str, Connect] = {"sqlite": _connect_sqlite}
+
+
+def register_driver(scheme: str, connect: Connect):
+    """
+    Makes databases whose URL starts with `<scheme>:` open with `connect`,
+    which is called with the URL and returns a DB-API connection.
+    """
+    _drivers[scheme] = connect
+
+
+def _driver_for(database: str) -> Connect:
+    scheme, separator, _ = database.partition(":")
+    if separator and scheme in _drivers and len(scheme) > 1:
+        return _drivers[scheme]
+    # Anything else (including Windows drive letters) is an SQLite path.
+    return _connect_sqlite
+
+
+class ConnectionPool:
+    """
+    Keeps up to `max_size` open connections to one database. Callers wait
+    for a free one when all are in use.
+    """
+
+    def __init__(self, database: str, max_size: int = 4):
+        self.database = database
+        self.max_size = max_size
+        self._connect = _driver_for(database)
+        self._idle: "queue.LifoQueue[Any]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._closed = False
+
+    def acquire(self) -> Any:
+        """Takes a connection, opening one if none is idle. Blocks if full."""
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return self._connect(self.database)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection: Any):
+        """Returns a connection taken with `acquire`."""
+        if self._closed:
+            connection.close()
+        else:
+            self._idle.put(connection)
+        self._slots.release()
+
+    def discard(self, connection: Any):
+        """Closes a connection taken with `acquire` that can't be reused."""
+        try:
+            connection.close()
+        except Exception:
+            pass
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Closes the idle connections, and the others when they come back."""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(database: str) -> ConnectionPool:
+    """The shared connection pool of `database`."""
+    with _pools_lock:
+        pool = _pools.get(database)
+        if pool is None:
+            pool = _pools[database] = ConnectionPool(database)
+        return pool
+
+
+def close_pools():
+    """Closes the connections of every shared pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _end_transaction(connection: Any):
+    """Commits what the connection's open transaction did, if it has one."""
+    # Drivers without `in_transaction` may have begun one even for a read.
+    if getattr(connection, "in_transaction", True):
+        connection.commit()
+
+
+class QueryResult:
+    """
+    The rows of an executed query, fetched a page at a time. Holds its
+    connection until the rows are exhausted or `close()` is called, which
+    commits the transaction before the connection goes back to the pool.
+
+    Args:
+        rows: The rows, if they were already read (see `run_query`).
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        connection: Any,
+        cursor: Any,
+        rows: Optional[List[Any]] = None,
+    ):
+        self._pool = pool
+        self._connection: Optional[Any] = connection
+        self._cursor = cursor
+        self._buffer = rows
+        self.columns: List[str] = [column[0] for column in cursor.description or ()]
+        self.rowcount: int = cursor.rowcount
+        self.exhausted = not self.columns
+
+    async def fetch(self, size: int) -> List[Tuple[Any, ...]]:
+        """The next `size` rows (fewer at the end)."""
+        if self.exhausted:
+            return []
+        if self._buffer is not None:
+            rows, self._buffer = self._buffer[:size], self._buffer[size:]
+        else:
+            loop = asyncio.get_running_loop()
+            rows = await loop.run_in_executor(None, self._cursor.fetchmany, size)
+        if len(rows) < size:
+            self.close()
+        return [tuple(row) for row in rows]
+
+    def close(self):
+        """
+        Releases the cursor, commits, and gives the connection back to the
+        pool. A connection that fails to commit is closed instead.
+        """
+        self.exhausted = True
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            try:
+                self._cursor.close()
+                _end_transaction(connection)
+            except BaseException:
+                self._pool.discard(connection)
+                raise
+            self._pool.release(connection)
+
+
+async def run_query(
+    database: str, query: str, params: Optional[Dict[str, Any]] = None
+) -> QueryResult:
+    """
+    Executes `query` with its named parameters bound from `params`.
+    Statements that return no rows are committed at once, and so are
+    writes that return rows (`INSERT ... RETURNING`) on drivers that tell
+    whether a transaction is open: their rows are read first, so that the
+    write doesn't stay uncommitted while the rows are paged through.
+    """
+    pool = get_pool(database)
+
+    def execute() -> QueryResult:
+        connection = pool.acquire()
+        try:
+            cursor = connection.cursor()
+            cursor.execute(query, params or {})
+            if cursor.description is None:
+                connection.commit()
+            elif getattr(connection, "in_transaction", False):
+                rows = cursor.fetchall()
+                connection.commit()
+                return QueryResult(pool, connection, cursor, rows=rows)
+            return QueryResult(pool, connection, cursor)
+        except BaseException:
+            try:
+                connection.rollback()
+            except BaseException:
+                pool.discard(connection)
+                raise
+            pool.release(connection)
+            raise
+
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(None, execute)
+    if result.exhausted:
+        result.close()
+    return result
+
+
+def _cell(value: Any) -> str:
+    return "NULL" if value is None else str(value)
+
+
+def format_row(row: Sequence[Any]) -> str:
+    return " | ".join(_cell(value) for value in row)
+
+
+def _show_record(
+    columns: List[str], row: Sequence[Any]
+) -> Callable[[dict, dict], None]:
+    def show(context: dict, args: dict):
+        width = max((len(column) for column in columns), default=0)
+        print()
+        for column, value in zip(columns, row):
+            print(f"{column.ljust(width)}  {_cell(value)}")
+
+    return show
+
+
+class SqlResultsMenu(TyperdanticMenu):
+    """Query results"""
+
+    record_history = False
+
+    query_title: str = "Query"
+    page_size: int = 50
+    # Why the query couldn't run, shown instead of rows.
+    error: Optional[str] = None
+
+    # The open result, and the rows fetched from it so far.
+    _result: Optional[QueryResult] = None
+    _rows: List[Tuple[Any, ...]] = []
+
+    async def show(self, result: QueryResult):
+        """Shows `result`, starting with its first page."""
+        self._result = result
+        self._rows = []
+        await self.load_more()
+
+    async def load_more(self, context: Optional[dict] = None, args: Any = None):
+        """Fetches the next page of rows."""
+        if self._result is None:
+            return
+        self._rows = self._rows + await self._result.fetch(self.page_size)
+        self.refresh_items()
+
+    @property
+    def columns(self) -> List[str]:
+        return self._result.columns if self._result else []
+
+    @property
+    def has_more(self) -> bool:
+        return self._result is not None and not self._result.exhausted
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        columns = self.columns
+        items = [
+            (
+                f"row_{i}",
+                MenuItem.trusted(
+                    description=format_row(row),
+                    action=_show_record(columns, row),
+                    invalidates=[],
+                ),
+            )
+            for i, row in enumerate(self._rows)
+        ]
+        if self.has_more:
+            items.append(
+                (
+                    "more",
+                    MenuItem(
+                        description=f"More rows (next {self.page_size})",
+                        action=self.load_more,
+                        invalidates=[],
+                        pause=False,
+                    ),
+                )
+            )
+        items.append(("back", MenuItem(description="Back", is_quit=True)))
+        return items
+
+    def summary(self) -> str:
+        if self.error is not None:
+            return f"Error: {self.error}"
+        if self._result is not None and not self.columns:
+            return f"{self.query_title}: {self._result.rowcount} rows changed"
+        more = "+" if self.has_more else ""
+        return f"{self.query_title}: {len(self._rows)}{more} rows"
+
+    def get_display_fragments(self):
+        fragments = super().get_display_fragments()
+        header = [("class:title", f"--- {self.summary()} ---\n")]
+        if self.columns:
+            header.append(("class:title", f"  {' | '.join(self.columns)}\n"))
+        return header + fragments[1:]
+
+    def on_close(self):
+        if self._result is not None:
+            self._result.close()
+
+
+async def execute_sql(
+    query: str,
+    database: Optional[str],
+    context: Optional[Dict[str, Any]] = None,
+    args: Optional[Dict[str, Any]] = None,
+    page_size: int = 50,
+) -> Optional[int]:
+    """
+    Runs an `sql` action (see the module docs). Returns 0, or 1 if the
+    query failed.
+    """
+    context = context or {}
+    app: Optional["TyperdanticApp"] = context.get("app")
+    in_menu = app is not None and app.is_running and not context.get("watching")
+    query_title = query.split()[0].upper() if query.strip() else "Query"
+
+    error = None
+    if not database:
+        error = "An 'sql' action needs a 'database'."
+    else:
+        try:
+            result = await run_query(database, query, args)
+        except Exception as exc:
+            error = f"Query failed: {exc}"
+    if error is not None:
+        if in_menu:
+            # Printed text would be wiped by the next redraw.
+            app.show_menu(SqlResultsMenu(app=app, query_title=query_title, error=error))
+        else:
+            print(f"\nError: {error}")
+        return 1
+
+    if in_menu:
+        menu = SqlResultsMenu(app=app, query_title=query_title, page_size=page_size)
+        await menu.show(result)
+        app.show_menu(menu)
+        return 0
+
+    try:
+        if not result.columns:
+            print(f"{result.rowcount} rows changed")
+            return 0
+        print(" | ".join(result.columns))
+        count = 0
+        while not result.exhausted:
+            for row in await result.fetch(page_size):
+                print(format_row(row))
+                count += 1
+        print(f"({count} rows)")
+        return 0
+    finally:
+        result.close()
@@ -1,8 +1,9 @@
 # src/typerdantic/styles.py
 
+import os
 import tomllib
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
 from prompt_toolkit.styles import Style
 
@@ -11,17 +12,68 @@ DEFAULT_STYLE_DICT: Dict[str, str] = {
     "title": "bold underline",
     "selected": "bg:#0055aa fg:#ffffff bold",
     "menu-item": "",  # Default style for non-selected items
+    "marked": "#00aaaa bold",  # Items marked to run together
+    "filter": "#aaaa00",  # Filter bar (/)
+    "debug-overlay": "bg:#222222 #aaaaaa",  # Metrics overlay (F12)
+    "progress": "#00aa00",  # Progress bar of a running action
+    "palette": "bg:#1c1c1c #dddddd",  # Command palette (Ctrl-P)
+    "palette.selected": "bg:#0055aa #ffffff bold",
+    "palette.menu": "#888888",
+    "form": "bg:#1c1c1c #dddddd",  # Argument form of prompt_args
+    "form.label": "bold",
+    "pause": "bg:#1c1c1c #dddddd",  # Output of an action, until Enter
+    "pause.prompt": "bold",
+    "watch": "",  # Output of a watched action
+    "watch.changed": "bold",  # Its lines that changed in the last run
 }
 
 # Create the default Style object
 DEFAULT_STYLE = Style.from_dict(DEFAULT_STYLE_DICT)
 
+# Identifies the version of a file: its modification time and size.
+FileStamp = Tuple[int, int]
+
+# Parsed `[style]` tables by file, valid while the file's stamp is the same.
+_parsed_files: Dict[Path, Tuple[FileStamp, Dict[str, str]]] = {}
+# Compiled styles (and the layers that failed) by base rules and layer stamps.
+_compiled_styles: Dict[Tuple, Tuple[Style, Dict[Path, str]]] = {}
+_MAX_COMPILED_STYLES = 32
+
+
+def _stamp(path: Path) -> Optional[FileStamp]:
+    """The stamp of `path`, or None if it is not a readable file."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    if not path.is_file():
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _read_rules(path: Path, stamp: FileStamp) -> Dict[str, str]:
+    """
+    The `[style]` table of a TOML file, parsed once per version of the file.
+
+    Raises tomllib.TOMLDecodeError or OSError if it cannot be read.
+    """
+    cached = _parsed_files.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    with open(path, "rb") as f:
+        data = tomllib.load(f)
+    table = data.get("style")
+    rules = dict(table) if isinstance(table, dict) else {}
+    _parsed_files[path] = (stamp, rules)
+    return rules
+
 
 def load_style_from_file(path: Path) -> Style:
     """
     Loads a custom style configuration from a TOML file.
 
     If the file cannot be found or parsed, it returns the default style.
+    The file is parsed and compiled once for each version of it.
 
     Args:
         path: The path to the TOML style file.
@@ -29,22 +81,152 @@ def load_style_from_file(path: Path) -> Style:
     Returns:
         A prompt_toolkit Style object.
     """
-    if not path.is_file():
-        # Silently fall back to default if no style file is found
+    theme = ThemeManager(site=path)
+    if theme.layer_errors:
         return DEFAULT_STYLE
+    return theme.style
 
-    try:
-        with open(path, "rb") as f:
-            custom_style_data = tomllib.load(f)
-
-        # Merge custom styles with defaults, allowing overrides
-        merged_styles = DEFAULT_STYLE_DICT.copy()
-        if "style" in custom_style_data and isinstance(
-            custom_style_data["style"], dict
-        ):
-            merged_styles.update(custom_style_data["style"])
-
-        return Style.from_dict(merged_styles)
-    except (tomllib.TOMLDecodeError, OSError) as e:
-        print(f"Warning: Could not load or parse style file '{path}': {e}")
-        return DEFAULT_STYLE
+
+def default_theme_paths(app_name: str) -> Tuple[Path, Path]:
+    """
+    The site-wide and per-user theme files of an application:
+    `/etc/<app_name>/theme.toml` and `$XDG_CONFIG_HOME/<app_name>/theme.toml`
+    (`~/.config/<app_name>/theme.toml` by default).
+    """
+    config_home = os.environ.get("XDG_CONFIG_HOME") or "~/.config"
+    return (
+        Path("/etc") / app_name / "theme.toml",
+        Path(config_home).expanduser() / app_name / "theme.toml",
+    )
+
+
+class ThemeManager:
+    """
+    Compiles layered themes into one prompt_toolkit Style, and switches
+    between named themes while the app runs.
+
+    The layers are merged in this order, later ones winning:
+    DEFAULT_STYLE_DICT, the `site` file, the selected theme from `themes`,
+    then the `user` file. Each is a TOML file with a `[style]` table; a
+    missing file is skipped, and one that cannot be parsed is skipped with
+    a warning. Compiled styles are cached by the version (modification time
+    and size) of every layer, so switching back to a theme, or loading an
+    unchanged file again, costs nothing.
+
+    Pass it as the `style` of a TyperdanticApp, then use
+    `app.switch_theme(name)` or `app.reload_theme()`.
+
+    Args:
+        site: The site-wide theme file.
+        user: The per-user theme file.
+        themes: Theme files by name, selectable with `switch`.
+        theme: The name of the theme to start with.
+        base: The rules the layers are merged onto.
+    """
+
+    def __init__(
+        self,
+        site: Optional[Union[str, Path]] = None,
+        user: Optional[Union[str, Path]] = None,
+        themes: Optional[Mapping[str, Union[str, Path]]] = None,
+        theme: Optional[str] = None,
+        base: Optional[Mapping[str, str]] = None,
+    ):
+        self.site = _as_path(site)
+        self.user = _as_path(user)
+        self.themes: Dict[str, Path] = {
+            name: Path(path).expanduser() for name, path in (themes or {}).items()
+        }
+        self.base = dict(DEFAULT_STYLE_DICT if base is None else base)
+        self.theme: Optional[str] = None
+        # Layers that could not be parsed in the last compile, with the error.
+        self.layer_errors: Dict[Path, str] = {}
+        self._base_key = tuple(sorted(self.base.items()))
+        self._key: Optional[Tuple] = None
+        self._style: Style = DEFAULT_STYLE
+        self.switch(theme)
+
+    @classmethod
+    def for_app(
+        cls,
+        app_name: str,
+        themes: Optional[Mapping[str, Union[str, Path]]] = None,
+        theme: Optional[str] = None,
+    ) -> "ThemeManager":
+        """A ThemeManager with the `default_theme_paths` of `app_name`."""
+        site, user = default_theme_paths(app_name)
+        return cls(site=site, user=user, themes=themes, theme=theme)
+
+    @property
+    def style(self) -> Style:
+        """The compiled style of the current layers. Cheap to read per render."""
+        return self._style
+
+    def __call__(self) -> Style:
+        return self._style
+
+    def layers(self) -> List[Path]:
+        """The files of the current theme, in merge order."""
+        paths = [self.site]
+        if self.theme is not None:
+            paths.append(self.themes[self.theme])
+        paths.append(self.user)
+        return [path for path in paths if path is not None]
+
+    def switch(self, theme: Optional[str]) -> Style:
+        """
+        Makes `theme` (a name in `themes`, or None for none) the current
+        theme and returns its style.
+
+        Raises:
+            KeyError: If there is no theme of that name.
+        """
+        if theme is not None and theme not in self.themes:
+            raise KeyError(f"Unknown theme: '{theme}'")
+        self.theme = theme
+        self._key = None
+        self.reload()
+        return self._style
+
+    def reload(self) -> bool:
+        """
+        Picks up changes to the layer files. Only the files' stamps are read
+        unless one changed. Returns whether the style changed.
+        """
+        stamped = [(path, _stamp(path)) for path in self.layers()]
+        key = (self._base_key, tuple(stamped))
+        if key == self._key:
+            return False
+        compiled = _compiled_styles.get(key)
+        if compiled is None:
+            compiled = self._compile(stamped)
+            if len(_compiled_styles) >= _MAX_COMPILED_STYLES:
+                # Drop the oldest, e.g. versions of a file being edited.
+                del _compiled_styles[next(iter(_compiled_styles))]
+            _compiled_styles[key] = compiled
+        style, self.layer_errors = compiled
+        changed = style is not self._style
+        self._key = key
+        self._style = style
+        return changed
+
+    def _compile(
+        self, stamped: List[Tuple[Path, Optional[FileStamp]]]
+    ) -> Tuple[Style, Dict[Path, str]]:
+        rules = dict(self.base)
+        errors: Dict[Path, str] = {}
+        for path, stamp in stamped:
+            if stamp is None:
+                continue
+            try:
+                rules.update(_read_rules(path, stamp))
+            except (tomllib.TOMLDecodeError, OSError) as e:
+                print(f"Warning: Could not load or parse style file '{path}': {e}")
+                errors[path] = str(e)
+        if rules == DEFAULT_STYLE_DICT:
+            return DEFAULT_STYLE, errors
+        return Style.from_dict(rules), errors
+
+
+def _as_path(path: Optional[Union[str, Path]]) -> Optional[Path]:
+    return None if path is None else Path(path).expanduser()
@@ -0,0 +1,294 @@
+# src/typerdantic/watch.py
+
+"""
+Watch mode: an action that runs again and again into a live output pane.
+
+Give an item a WatchSpec (or its config action a `watch` table) and
+selecting it opens a WatchMenu instead of running the action once:
+
+    [items.disk.action]
+    type = "command"
+    value = "df -h"
+    watch = { interval = 5 }
+
+The action runs every `interval` seconds and/or whenever one of `paths`
+changes. A `command` or `script` action is run with `run_command` and its
+standard output and error are shown; any other action's printed output is
+captured instead. Its context has `"watching"` set, so that actions which
+would open a view of their results (such as `sql`) print them instead. Each
+new output is diffed line by line against the last one: unchanged lines are
+kept as they were and changed lines are highlighted (class:watch.changed)
+until the next run. When a run takes longer than the interval, the runs
+that would overlap it are skipped and counted. Leaving the menu stops the
+watch.
+"""
+
+import asyncio
+import difflib
+import os
+import time
+from typing import Awaitable, Callable, List, Optional, Set, Tuple
+
+from .base import TyperdanticMenu
+from .capture import capture_output, routed_stdout
+from .executors import call_action, command_of, run_command
+from .models import MenuItem, WatchSpec
+
+# What a run returns: the exit code (None if the action has none) and output.
+RunResult = Tuple[Optional[int], str]
+
+
+class WatchOutput:
+    """The lines of the latest output, updated from a line diff."""
+
+    def __init__(self, max_lines: int = 500):
+        self.max_lines = max_lines
+        self.lines: List[str] = []
+        # Indices of the lines that changed in the last update.
+        self.changed: Set[int] = set()
+
+    def update(self, text: str) -> Set[int]:
+        """
+        Replaces the output with `text`, keeping its last `max_lines` lines.
+        Returns the indices of the lines that are new or changed.
+        """
+        new_lines = text.splitlines()[-self.max_lines :]
+        matcher = difflib.SequenceMatcher(None, self.lines, new_lines, autojunk=False)
+        lines: List[str] = []
+        changed: Set[int] = set()
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                # Reuse the previous line objects for unchanged lines.
+                lines.extend(self.lines[i1:i2])
+            else:
+                changed.update(range(len(lines), len(lines) + j2 - j1))
+                lines.extend(new_lines[j1:j2])
+        self.lines = lines
+        self.changed = changed
+        return changed
+
+    def fragments(self) -> List[Tuple[str, str]]:
+        changed = self.changed
+        return [
+            ("class:watch.changed" if i in changed else "class:watch", f"{line}\n")
+            for i, line in enumerate(self.lines)
+        ]
+
+
+def _path_stamps(paths: List[str]) -> Tuple[Optional[Tuple[int, int]], ...]:
+    stamps = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stamps.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+class Watcher:
+    """
+    Runs `run` on the schedule of `spec`, never twice at once, and keeps the
+    latest output in `output`.
+
+    Args:
+        run: Runs the action once and returns its exit code and output.
+        spec: The interval, the paths to watch and the lines to keep.
+        on_update: Called after each run, e.g. to redraw the screen.
+        poll_interval: Seconds between checks of `spec.paths` for changes.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[], Awaitable[RunResult]],
+        spec: WatchSpec,
+        on_update: Optional[Callable[[], None]] = None,
+        poll_interval: float = 0.5,
+    ):
+        self.run = run
+        self.spec = spec
+        self.on_update = on_update
+        self.poll_interval = poll_interval
+        self.output = WatchOutput(spec.max_lines)
+        self.runs = 0
+        self.skipped = 0
+        self.exit_code: Optional[int] = None
+        self.error: Optional[str] = None
+        self.last_run_at: Optional[float] = None
+        self._loop_task: Optional["asyncio.Task[None]"] = None
+        self._run_task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def running(self) -> bool:
+        return self._run_task is not None and not self._run_task.done()
+
+    def start(self):
+        if self._loop_task is None:
+            self._loop_task = asyncio.ensure_future(self._schedule())
+
+    def stop(self):
+        for task in (self._loop_task, self._run_task):
+            if task is not None:
+                task.cancel()
+        self._loop_task = self._run_task = None
+
+    def trigger(self) -> bool:
+        """
+        Starts a run now, unless one is running (then it counts as skipped).
+        Returns whether a run was started.
+        """
+        if self.running:
+            self.skipped += 1
+            return False
+        self._run_task = asyncio.ensure_future(self._run_once())
+        return True
+
+    async def _run_once(self):
+        try:
+            self.exit_code, text = await self.run()
+            self.error = None
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self.exit_code = None
+            self.error = f"{type(exc).__name__}: {exc}"
+            text = self.error
+        self.output.update(text)
+        self.runs += 1
+        self.last_run_at = time.time()
+        if self.on_update is not None:
+            self.on_update()
+
+    async def _schedule(self):
+        loop = asyncio.get_running_loop()
+        interval = self.spec.interval
+        paths = self.spec.paths or []
+        stamps = _path_stamps(paths)
+        self.trigger()
+        next_run = loop.time() + (interval or 0.0)
+        while True:
+            delay = self.poll_interval if paths else None
+            if interval is not None:
+                until_next = max(0.0, next_run - loop.time())
+                delay = until_next if delay is None else min(delay, until_next)
+            await asyncio.sleep(delay)
+            now = loop.time()
+            if interval is not None and now >= next_run:
+                self.trigger()
+                next_run += interval
+                if next_run <= now:
+                    # The loop fell behind; don't run to catch up.
+                    next_run = now + interval
+            if paths:
+                current = _path_stamps(paths)
+                if current != stamps:
+                    stamps = current
+                    self.trigger()
+
+
+def action_runner(
+    item: MenuItem, context: dict, args: dict
+) -> Callable[[], Awaitable[RunResult]]:
+    """
+    Runs `item`'s action once per call: the command of a command or script
+    action directly, any other action with its printed output captured.
+    """
+    command = command_of(item.action, args)
+    if command is not None:
+        command_line, policy = command
+
+        async def run_shell() -> RunResult:
+            exit_code, stdout, stderr = await run_command(command_line, policy=policy)
+            return exit_code, stdout + stderr
+
+        return run_shell
+
+    # Actions that would open a view of their results (such as `sql`)
+    # print them instead, so that each run doesn't open another menu.
+    context = {**context, "watching": True}
+
+    async def run_action() -> RunResult:
+        with routed_stdout(), capture_output() as output:
+            result = await call_action(
+                item.action, context=context, args=args, in_thread=item.run_in_thread
+            )
+        exit_code = None
+        if isinstance(result, int) and not isinstance(result, bool):
+            exit_code = result
+        return exit_code, output.getvalue()
+
+    return run_action
+
+
+class WatchMenu(TyperdanticMenu):
+    """Watch"""
+
+    record_history = False
+
+    description: str = ""
+    # Set by `watch`.
+    _watcher: Optional[Watcher] = None
+
+    def watch(self, watcher: Watcher):
+        self._watcher = watcher
+        watcher.start()
+
+    @property
+    def watcher(self) -> Optional[Watcher]:
+        return self._watcher
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        return [
+            (
+                "run_now",
+                MenuItem(
+                    description="Run now",
+                    action=self._run_now,
+                    invalidates=[],
+                    pause=False,
+                ),
+            ),
+            ("stop", MenuItem(description="Stop watching", is_quit=True)),
+        ]
+
+    def _run_now(self, context: dict, args: dict):
+        if self._watcher is not None:
+            self._watcher.trigger()
+
+    def status(self) -> str:
+        watcher = self._watcher
+        parts = [self.description]
+        if watcher is None:
+            return parts[0]
+        spec = watcher.spec
+        if spec.interval is not None:
+            parts.append(f"every {spec.interval:g}s")
+        if spec.paths:
+            parts.append("on changes to " + ", ".join(spec.paths))
+        if watcher.last_run_at is not None:
+            parts.append(
+                f"run {watcher.runs} at "
+                + time.strftime("%H:%M:%S", time.localtime(watcher.last_run_at))
+            )
+        if watcher.exit_code not in (None, 0):
+            parts.append(f"exit code {watcher.exit_code}")
+        if watcher.skipped:
+            parts.append(f"{watcher.skipped} skipped")
+        return " | ".join(parts)
+
+    def get_display_fragments(self):
+        fragments = super().get_display_fragments()
+        output = self._watcher.output.fragments() if self._watcher else []
+        if self._watcher is not None and self._watcher.runs == 0:
+            output = [("class:watch", "Running...\n")]
+        # The items come first, so they stay on screen under long output.
+        return (
+            [("class:title", f"--- {self.status()} ---\n")]
+            + fragments[1:]
+            + [("", "\n\n")]
+            + output
+        )
+
+    def on_close(self):
+        if self._watcher is not None:
+            self._watcher.stop()
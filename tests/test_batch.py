@@ -0,0 +1,267 @@
+# file: tests/test_batch.py
+
+import asyncio
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from click.testing import CliRunner
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.batch import (
+    batch_rows,
+    command_rows,
+    file_rows,
+    format_summary,
+    row_args,
+    run_batch,
+)
+from typerdantic.cli import build_cli
+from typerdantic.config_models import MenuConfig
+from typerdantic.loaders import create_menu_from_config
+from typerdantic.models import BatchSpec, MenuItem
+
+
+def restart_config(batch=None) -> MenuConfig:
+    action = {
+        "type": "command",
+        "value": "systemctl restart {unit}",
+        "args": {"unit": "{name}.service"},
+        "prompt_args": [{"name": "name", "prompt": "Service"}],
+    }
+    if batch:
+        action["batch"] = batch
+    return MenuConfig.model_validate(
+        {
+            "doc": "Services",
+            "items": {"restart": {"description": "Restart", "action": action}},
+        }
+    )
+
+
+class TestRows(unittest.TestCase):
+    def test_row_args_format_defaults_with_the_row(self):
+        args = row_args(
+            {"unit": "{name}.service", "mode": "{mode}", "retries": 3},
+            {"name": "nginx"},
+            overrides={"host": "web1"},
+        )
+        self.assertEqual(
+            args,
+            {
+                "unit": "nginx.service",
+                "mode": "{mode}",
+                "retries": 3,
+                "name": "nginx",
+                "host": "web1",
+            },
+        )
+
+    def test_file_and_command_sources(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "rows.csv"
+            csv_path.write_text("name,port\nweb,80\ndb,5432\n")
+            jsonl_path = Path(tmp) / "rows.jsonl"
+            jsonl_path.write_text('{"name": "web"}\n\n{"name": "db"}\n')
+            self.assertEqual(
+                list(file_rows(csv_path)),
+                [{"name": "web", "port": "80"}, {"name": "db", "port": "5432"}],
+            )
+            self.assertEqual(
+                list(file_rows(jsonl_path)), [{"name": "web"}, {"name": "db"}]
+            )
+
+        async def collect():
+            return [row async for row in command_rows("printf 'a\\nb\\n'")]
+
+        self.assertEqual(asyncio.run(collect()), [{"line": "a"}, {"line": "b"}])
+        with self.assertRaises(ValueError):
+            BatchSpec(source="rows.csv", command="ls")
+
+
+class TestRunBatch(unittest.TestCase):
+    def test_rows_stream_with_bounded_concurrency_and_retries(self):
+        read = []
+        running = 0
+        peak = 0
+        attempts = {}
+        read_ahead = 0
+
+        def rows():
+            for i in range(200):
+                read.append(i)
+                yield {"n": str(i)}
+
+        async def action(context: dict, args: dict):
+            nonlocal running, peak, read_ahead
+            n = int(args["n"])
+            attempts[n] = attempts.get(n, 0) + 1
+            if attempts[n] == 1:
+                read_ahead = max(read_ahead, len(read) - n)
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            if n == 7 and attempts[n] == 1:
+                raise RuntimeError("flaky")
+            if n == 9:
+                return 2
+            return 0
+
+        item = MenuItem(description="Do", action=action)
+        results = []
+        summary = asyncio.run(
+            run_batch(
+                item,
+                rows(),
+                concurrency=3,
+                retries=1,
+                retry_delay=0,
+                on_result=results.append,
+            )
+        )
+
+        self.assertEqual(peak, 3)
+        # Rows are read only as workers become free.
+        self.assertLessEqual(read_ahead, 3 + 2)
+        self.assertEqual(
+            (summary.total, summary.succeeded, summary.failed), (200, 199, 1)
+        )
+        self.assertEqual(summary.retries, 2)
+        self.assertEqual(len(results), 200)
+        self.assertEqual(summary.failures[0].index, 9)
+        self.assertEqual(summary.failures[0].error, "exit code 2")
+        self.assertIn("1 failed", format_summary(summary))
+
+    def test_unreadable_rows_stop_the_batch(self):
+        async def noop(context: dict, args: dict):
+            return None
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rows.jsonl"
+            path.write_text('{"a": 1}\nnot json\n{"a": 2}\n')
+            summary = asyncio.run(
+                run_batch(
+                    MenuItem(description="Do", action=noop),
+                    batch_rows(BatchSpec(source=str(path))),
+                )
+            )
+        self.assertEqual(summary.total, 1)
+        self.assertIn("Line 2", summary.source_error)
+        self.assertFalse(summary.ok)
+
+        # A file that isn't UTF-8 is reported the same way.
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "rows.csv"
+            path.write_bytes("name\ncaf\u00e9\n".encode("latin-1"))
+            summary = asyncio.run(
+                run_batch(
+                    MenuItem(description="Do", action=noop),
+                    batch_rows(BatchSpec(source=str(path))),
+                )
+            )
+        self.assertIn("utf-8", summary.source_error)
+        self.assertFalse(summary.ok)
+
+
+class TestBatchEntryPoints(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.rows = Path(self.tmp.name) / "services.csv"
+        self.rows.write_text("name\nnginx\nredis\n")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    @patch("typerdantic.executors.run_command", new_callable=AsyncMock)
+    def test_cli_runs_an_item_over_a_file(self, mock_run_command: AsyncMock):
+        mock_run_command.return_value = (0, "", "")
+        app = TyperdanticApp(main_menu=create_menu_from_config("S", restart_config()))
+        cli = build_cli(app)
+
+        result = CliRunner().invoke(
+            cli, ["restart", "--batch", str(self.rows), "--concurrency", "1"]
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        commands = [call.args[0] for call in mock_run_command.await_args_list]
+        self.assertEqual(
+            commands,
+            ["systemctl restart nginx.service", "systemctl restart redis.service"],
+        )
+        self.assertIn("2 succeeded", result.output)
+
+        mock_run_command.return_value = (1, "", "")
+        result = CliRunner().invoke(cli, ["restart", "--batch", str(self.rows)])
+        self.assertEqual(result.exit_code, 1)
+
+    @patch("typerdantic.executors.run_command", new_callable=AsyncMock)
+    def test_option_defaults_do_not_override_rows(self, mock_run_command):
+        mock_run_command.return_value = (0, "", "")
+        self.rows.write_text("version\n2.0\n3.0\n")
+        config = MenuConfig.model_validate(
+            {
+                "items": {
+                    "deploy": {
+                        "description": "Deploy",
+                        "action": {
+                            "type": "command",
+                            "value": "deploy {version} {env}",
+                            "args": {"env": "staging"},
+                            "prompt_args": [
+                                {
+                                    "name": "version",
+                                    "prompt": "Version",
+                                    "default": "1.0",
+                                }
+                            ],
+                        },
+                    }
+                }
+            }
+        )
+        cli = build_cli(TyperdanticApp(main_menu=create_menu_from_config("D", config)))
+
+        result = CliRunner().invoke(
+            cli, ["deploy", "--batch", str(self.rows), "--concurrency", "1"]
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        commands = [call.args[0] for call in mock_run_command.await_args_list]
+        self.assertEqual(commands, ["deploy 2.0 staging", "deploy 3.0 staging"])
+
+        # A value given on the command line wins, even if it is the default.
+        mock_run_command.reset_mock()
+        result = CliRunner().invoke(
+            cli, ["deploy", "--batch", str(self.rows), "--version", "1.0"]
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        commands = sorted(call.args[0] for call in mock_run_command.await_args_list)
+        self.assertEqual(commands, ["deploy 1.0 staging", "deploy 1.0 staging"])
+
+    @patch("typerdantic.app.PromptSession")
+    @patch("typerdantic.executors.run_command", new_callable=AsyncMock)
+    def test_configured_batch_runs_from_the_menu(
+        self, mock_run_command, MockPromptSession
+    ):
+        MockPromptSession.return_value.prompt_async = AsyncMock()
+        mock_run_command.return_value = (0, "", "")
+        config = restart_config(batch={"source": str(self.rows), "retries": 1})
+        app = TyperdanticApp(main_menu=create_menu_from_config("S", config))
+        item = app.active_menu.get_selected_item()
+        self.assertEqual(item.batch.retries, 1)
+
+        with patch.object(app, "_prompt_for_args", new_callable=AsyncMock) as prompt:
+            asyncio.run(app.handle_selection(item))
+
+        prompt.assert_not_awaited()
+        self.assertEqual(mock_run_command.await_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,152 @@
+# file: tests/test_bulk.py
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import patch
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.bulk import BulkResultsMenu
+from typerdantic.models import MenuItem
+
+running = 0
+peak = 0
+
+
+async def check_host(context: dict, args: dict):
+    global running, peak
+    running += 1
+    peak = max(peak, running)
+    await asyncio.sleep(0.01)
+    running -= 1
+    print(f"checked {args['host']}")
+    return 2 if args["host"] == "db3" else 0
+
+
+class HostMenu(TyperdanticMenu):
+    """Hosts"""
+
+    hosts: List[str] = [f"web{i}" for i in range(12)] + ["db1", "db2", "db3"]
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        items = [
+            (
+                host,
+                MenuItem(
+                    description=f"Check {host}",
+                    action=check_host,
+                    args={"host": host},
+                    invalidates=[],
+                ),
+            )
+            for host in self.hosts
+        ]
+        items.append(("quit", MenuItem(description="Quit", is_quit=True)))
+        return items
+
+
+class TestMarking(unittest.TestCase):
+    def setUp(self):
+        self.app = TyperdanticApp(main_menu=HostMenu)
+        self.menu = self.app.active_menu
+
+    def test_filter_narrows_navigation_and_mark_all(self):
+        menu = self.menu
+        menu.set_filter("db")
+        self.assertEqual(menu.get_selected_item().description, "Check db1")
+        menu.go_up()
+        self.assertEqual(menu.get_selected_item().description, "Check db3")
+        self.assertEqual(menu.mark_all(), 3)
+        # Marking all again unmarks the shown items.
+        self.assertEqual(menu.mark_all(), 0)
+        self.assertEqual(menu.marked_items(), [])
+
+        menu.mark_all()
+        menu.set_filter("")
+        self.assertEqual(
+            [name for name, _ in menu.marked_items()], ["db1", "db2", "db3"]
+        )
+        text = "".join(text for _, text in menu.get_display_fragments())
+        self.assertIn("3 marked", text)
+
+    def test_toggle_range_and_refresh(self):
+        menu = self.menu
+        self.assertTrue(menu.toggle_mark())
+        menu.extend_marks(1)
+        menu.extend_marks(1)
+        self.assertEqual(
+            [name for name, _ in menu.marked_items()], ["web0", "web1", "web2"]
+        )
+        self.assertEqual(menu.mark_range("web2", "web5"), 3)
+        # Quit items can't be marked.
+        self.assertFalse(menu.toggle_mark("quit"))
+
+        menu.hosts = [host for host in menu.hosts if host != "web1"]
+        menu.refresh_items()
+        self.assertEqual(len(menu.marked_items()), 5)
+
+
+class TestBulkRun(unittest.TestCase):
+    def setUp(self):
+        global running, peak
+        running = peak = 0
+
+    @patch("typerdantic.app.PromptSession")
+    def test_marked_items_run_concurrently_with_one_result_view(
+        self, MockPromptSession
+    ):
+        app = TyperdanticApp(main_menu=HostMenu)
+        app.bulk_concurrency = 4
+        menu = app.active_menu
+        menu.mark_all()
+
+        asyncio.run(app.run_marked())
+
+        self.assertEqual(peak, 4)
+        MockPromptSession.assert_not_called()
+        self.assertEqual(menu.marked_items(), [])
+        results_menu = app.active_menu
+        self.assertIsInstance(results_menu, BulkResultsMenu)
+        self.assertEqual(results_menu.summary(), "15 items: 14 succeeded, 1 failed")
+        first = results_menu.get_selected_item()
+        self.assertIn("Check db3: FAILED (exit code 2)", first.description)
+        outputs = {result.name: result.output for result in results_menu.results}
+        self.assertEqual(outputs["web7"], "checked web7\n")
+
+    def test_filter_mark_and_run_from_the_keyboard(self):
+        async def drive():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = TyperdanticApp(
+                        main_menu=HostMenu, input=pipe_input, output=DummyOutput()
+                    )
+                    task = asyncio.ensure_future(app.run())
+                    await asyncio.sleep(0.1)
+                    pipe_input.send_text("/db\r")
+                    await asyncio.sleep(0.05)
+                    self.assertEqual(app.active_menu.filter_query, "db")
+                    pipe_input.send_text("*x")
+                    await asyncio.sleep(0.3)
+                    results = app.active_menu
+                    pipe_input.send_text("qq")
+                    await asyncio.wait_for(task, 5)
+                    return results
+
+        results = asyncio.run(drive())
+        self.assertIsInstance(results, BulkResultsMenu)
+        self.assertEqual([r.name for r in results.results], ["db1", "db2", "db3"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
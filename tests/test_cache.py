@@ -0,0 +1,185 @@
+# file: tests/test_cache.py
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import AsyncMock, patch
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.cache import AppCache, cached
+from typerdantic.models import MenuItem
+
+fetches = []
+
+
+@cached(ttl=60, tags=["hosts"])
+def load_hosts(app, environment: str = "prod") -> List[str]:
+    fetches.append(environment)
+    return [f"{environment}-web", f"{environment}-db"]
+
+
+@cached(tags=["hosts"])
+async def load_hosts_async(app) -> List[str]:
+    fetches.append("async")
+    await asyncio.sleep(0.01)
+    return ["web"]
+
+
+def add_host(context: dict, args: dict):
+    context["cache"].invalidate(tag="hosts")
+
+
+class HostMenu(TyperdanticMenu):
+    """Hosts"""
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        items = [(h, MenuItem(description=h)) for h in load_hosts(self.app)]
+        items.append(
+            ("add", MenuItem(description="Add host", action=add_host, invalidates=[]))
+        )
+        return items
+
+
+class OtherHostMenu(HostMenu):
+    """Other Hosts"""
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAppCache(unittest.TestCase):
+    def test_ttl_and_lru_eviction(self):
+        clock = FakeClock()
+        cache = AppCache(max_entries=2, default_ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "a" is now most recent
+        cache.set("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertEqual(cache.stats.evictions, 1)
+
+        clock.now = 10
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual((cache.stats.hits, cache.stats.misses), (1, 1))
+
+    def test_tags_and_explicit_invalidation(self):
+        cache = AppCache()
+        cache.set("hosts", [1], tags=["hosts"])
+        cache.set("projects", [2], tags=["projects"])
+        self.assertEqual(cache.invalidate(tag="hosts"), 1)
+        self.assertNotIn("hosts", cache)
+        self.assertEqual(cache.invalidate("projects"), 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_concurrent_loads_are_coalesced(self):
+        cache = AppCache()
+        calls = []
+        release = threading.Event()
+
+        def slow_loader():
+            calls.append(1)
+            release.wait(5)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_load("k", slow_loader))
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        while cache.stats.coalesced < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, ["value"] * 5)
+
+    def test_load_invalidated_midway_is_not_stored(self):
+        cache = AppCache()
+
+        def loader():
+            cache.invalidate(tag="hosts")
+            return "stale"
+
+        self.assertEqual(cache.get_or_load("k", loader, tags=["hosts"]), "stale")
+        self.assertNotIn("k", cache)
+
+    def test_async_loads_are_coalesced(self):
+        fetches.clear()
+        app = TyperdanticApp(main_menu=HostMenu)
+        fetches.clear()
+
+        async def load_concurrently():
+            return await asyncio.gather(*(load_hosts_async(app) for _ in range(3)))
+
+        self.assertEqual(asyncio.run(load_concurrently()), [["web"]] * 3)
+        self.assertEqual(fetches, ["async"])
+
+
+@patch("typerdantic.app.PromptSession")
+class TestCachedMenus(unittest.TestCase):
+    def setUp(self):
+        fetches.clear()
+
+    def test_menus_share_cached_data(self, MockPromptSession):
+        app = TyperdanticApp(main_menu=HostMenu)
+        OtherHostMenu(app=app)
+        self.assertEqual(fetches, ["prod"])
+        self.assertEqual(load_hosts(app, "staging"), ["staging-web", "staging-db"])
+        self.assertEqual(fetches, ["prod", "staging"])
+
+        # A different app has its own cache.
+        TyperdanticApp(main_menu=HostMenu)
+        self.assertEqual(fetches, ["prod", "staging", "prod"])
+
+    def test_actions_invalidate_through_context(self, MockPromptSession):
+        MockPromptSession.return_value.prompt_async = AsyncMock()
+        app = TyperdanticApp(main_menu=HostMenu)
+        app.active_menu._selected_index = 2
+        asyncio.run(app.handle_selection(app.active_menu.get_selected_item()))
+        OtherHostMenu(app=app)
+        self.assertEqual(fetches, ["prod", "prod"])
+
+        # Invalidating the data key drops the tagged entries too.
+        app.invalidate_data(["hosts"])
+        OtherHostMenu(app=app)
+        self.assertEqual(fetches, ["prod", "prod", "prod"])
+        self.assertEqual(app.cache.stats.to_dict()["misses"], 3)
+
+    def test_actions_without_invalidates_clear_the_cache(self, MockPromptSession):
+        MockPromptSession.return_value.prompt_async = AsyncMock()
+        app = TyperdanticApp(main_menu=HostMenu)
+        item = MenuItem(description="Sync hosts", action=lambda context, args: None)
+        self.assertIsNone(item.invalidates)
+        asyncio.run(app.handle_selection(item))
+        self.assertEqual(fetches, ["prod", "prod"])
+        OtherHostMenu(app=app)
+        self.assertEqual(fetches, ["prod", "prod"])
+
+    def test_cached_helpers_need_an_app_or_menu(self, MockPromptSession):
+        with self.assertRaises(TypeError):
+            load_hosts(object())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
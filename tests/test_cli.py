@@ -0,0 +1,145 @@
+# file: tests/test_cli.py
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from click.testing import CliRunner
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.cli import build_cli
+from typerdantic.config_models import MenuConfig
+from typerdantic.loaders import create_menu_from_config
+
+
+def build_test_app() -> TyperdanticApp:
+    main = MenuConfig.model_validate(
+        {
+            "doc": "My Tool",
+            "items": {
+                "deploy": {"description": "Deploy menu", "target_menu": "deploy"},
+                "quit": {"description": "Quit", "is_quit": True},
+            },
+        }
+    )
+    deploy = MenuConfig.model_validate(
+        {
+            "doc": "Deploy",
+            "items": {
+                "staging": {
+                    "description": "Deploy to staging",
+                    "action": {
+                        "type": "command",
+                        "value": "deploy --env {env} --version {version}",
+                        "args": {"env": "staging"},
+                        "prompt_args": [
+                            {"name": "version", "prompt": "Version to deploy"}
+                        ],
+                    },
+                },
+                "main_menu": {"description": "Back to main", "target_menu": "main"},
+            },
+        }
+    )
+    app = TyperdanticApp(main_menu=create_menu_from_config("Main", main))
+    app.register_menu("deploy", create_menu_from_config("Deploy", deploy))
+    return app
+
+
+class TestBuildCli(unittest.TestCase):
+    @patch("typerdantic.executors.run_command", new_callable=AsyncMock)
+    def test_runs_nested_command_with_options(self, mock_run_command: AsyncMock):
+        mock_run_command.return_value = (0, "", "")
+        cli = build_cli(build_test_app(), name="mytool")
+
+        result = CliRunner().invoke(cli, ["deploy", "staging", "--version", "1.2"])
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        mock_run_command.assert_awaited_once_with("deploy --env staging --version 1.2")
+
+    @patch("typerdantic.executors.run_command", new_callable=AsyncMock)
+    def test_args_are_overridable_defaults(self, mock_run_command: AsyncMock):
+        mock_run_command.return_value = (3, "", "boom")
+        cli = build_cli(build_test_app())
+
+        result = CliRunner().invoke(
+            cli, ["deploy", "staging", "--env", "prod", "--version", "2"]
+        )
+
+        mock_run_command.assert_awaited_once_with("deploy --env prod --version 2")
+        # A failing command propagates its exit code.
+        self.assertEqual(result.exit_code, 3)
+
+    def test_missing_prompt_arg_is_an_error(self):
+        result = CliRunner().invoke(build_cli(build_test_app()), ["deploy", "staging"])
+        self.assertNotEqual(result.exit_code, 0)
+        self.assertIn("--version", result.output)
+
+    def test_help_lists_items_and_handles_cycles(self):
+        cli = build_cli(build_test_app())
+        result = CliRunner().invoke(cli, ["deploy", "main-menu", "deploy", "--help"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("staging", result.output)
+        self.assertNotIn("quit", CliRunner().invoke(cli, ["--help"]).output)
+
+    def test_callable_actions_receive_context_and_args(self):
+        app = build_test_app()
+        action = MagicMock(return_value=None)
+        menu_class = app.menu_registry["deploy"]
+        menu_class.model_fields["staging"].default.action = action
+
+        result = CliRunner().invoke(
+            build_cli(app), ["deploy", "staging", "--version", "9"]
+        )
+
+        self.assertEqual(result.exit_code, 0, result.output)
+        kwargs = action.call_args.kwargs
+        self.assertIs(kwargs["context"]["app"], app)
+        self.assertEqual(kwargs["args"], {"env": "staging", "version": "9"})
+
+    def test_args_keep_their_types(self):
+        action = MagicMock(return_value=None)
+        config = MenuConfig.model_validate(
+            {"items": {"report": {"description": "Report", "action": "internal::x"}}}
+        )
+        menu_class = create_menu_from_config("Main", config)
+        item = menu_class.model_fields["report"].default
+        item.action = action
+        item.args = {"count": 3, "verbose": False, "note": None}
+        cli = build_cli(TyperdanticApp(main_menu=menu_class))
+
+        # Options that aren't given pass the configured values unchanged, and
+        # None-valued arguments are not required.
+        result = CliRunner().invoke(cli, ["report"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            action.call_args.kwargs["args"],
+            {"count": 3, "verbose": False, "note": None},
+        )
+
+        result = CliRunner().invoke(
+            cli, ["report", "--count", "5", "--verbose", "true", "--note", "hi"]
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertEqual(
+            action.call_args.kwargs["args"],
+            {"count": 5, "verbose": True, "note": "hi"},
+        )
+        result = CliRunner().invoke(cli, ["report", "--count", "many"])
+        self.assertNotEqual(result.exit_code, 0)
+
+    def test_no_subcommand_runs_the_app(self):
+        app = build_test_app()
+        with patch.object(app, "run", new_callable=AsyncMock) as mock_run:
+            result = CliRunner().invoke(build_cli(app), [])
+        self.assertEqual(result.exit_code, 0, result.output)
+        mock_run.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,185 @@
+# file: tests/test_completion.py
+
+import asyncio
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.completion import CompleteEvent
+from prompt_toolkit.document import Document
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.cache import AppCache
+from typerdantic.completion import ArgumentCompleter, CandidateIndex
+from typerdantic.config_models import MenuConfig
+from typerdantic.loaders import create_menu_from_config
+from typerdantic.models import ArgumentSpec, CompletionSpec, MenuItem
+
+calls = []
+
+
+def connect(context: dict, args: dict):
+    calls.append(args)
+
+
+class HostMenu(TyperdanticMenu):
+    """Hosts"""
+
+    connect: MenuItem = Field(
+        default=MenuItem(
+            description="Connect",
+            action=connect,
+            prompt_args=[
+                ArgumentSpec(
+                    name="host",
+                    prompt="Host",
+                    completions=CompletionSpec(
+                        choices=["web-01", "web-02", "db-01", "cache-01"]
+                    ),
+                )
+            ],
+        )
+    )
+
+
+def complete(completer: ArgumentCompleter, text: str):
+    async def collect():
+        document = Document(text)
+        return [
+            c.text
+            async for c in completer.get_completions_async(document, CompleteEvent())
+        ]
+
+    return asyncio.run(collect())
+
+
+class TestCompletion(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+
+    def test_index_narrows_incrementally(self):
+        hosts = [f"host-{i:05d}.dc{i % 7}.example.com" for i in range(50_000)]
+        index = CandidateIndex(hosts + ["HOST-00001.dc1.example.com"])
+        self.assertEqual(len(index), 50_001)
+
+        started = time.perf_counter()
+        for query in ("h", "ho", "hos", "host", "host-", "host-4", "host-42"):
+            matches = index.search(query, limit=50)
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(matches[0], "host-42000.dc0.example.com")
+        self.assertEqual(len(index.search("host-42123")), 1)
+
+        # Prefix matches come first, and matching ignores case.
+        self.assertEqual(
+            index.search("dc1.example.com", limit=1), ["host-00001.dc1.example.com"]
+        )
+        self.assertEqual(
+            CandidateIndex(["a-web", "web-a", "Web-b"]).search("web"),
+            ["web-a", "Web-b", "a-web"],
+        )
+
+    def test_sources_load_once_per_ttl(self):
+        loads = []
+
+        async def branches():
+            loads.append(1)
+            await asyncio.sleep(0.05)
+            return ["main", "release/1.0", "feature/menu"]
+
+        now = [0.0]
+        cache = AppCache(clock=lambda: now[0])
+        spec = CompletionSpec(source=branches, ttl=30)
+
+        async def concurrently():
+            first = ArgumentCompleter(spec, cache)
+            second = ArgumentCompleter(spec, cache)
+            return await asyncio.gather(first.load(), second.load())
+
+        one, two = asyncio.run(concurrently())
+        self.assertIs(one, two)
+        self.assertEqual(len(loads), 1)
+        self.assertEqual(
+            complete(ArgumentCompleter(spec, cache), "rel"), ["release/1.0"]
+        )
+        self.assertEqual(len(loads), 1)
+
+        now[0] = 31.0
+        self.assertIsNone(ArgumentCompleter(spec, cache).index)
+        complete(ArgumentCompleter(spec, cache), "m")
+        self.assertEqual(len(loads), 2)
+
+        command = CompletionSpec(command="printf 'alpha\\nbeta\\n'")
+        self.assertEqual(
+            complete(ArgumentCompleter(command, cache), ""), ["alpha", "beta"]
+        )
+        pattern = str(project_root / "tests" / "test_comp*.py")
+        self.assertEqual(
+            complete(ArgumentCompleter(CompletionSpec(glob=pattern), cache), ""),
+            [str(project_root / "tests" / "test_completion.py")],
+        )
+
+    def test_form_offers_completions(self):
+        async def run():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = TyperdanticApp(
+                        main_menu=HostMenu, input=pipe_input, output=DummyOutput()
+                    )
+                    task = asyncio.ensure_future(app.run())
+                    for keys in ("\r", "01", "\x1b[B", "\r", "\r", "q"):
+                        await asyncio.sleep(0.15)
+                        pipe_input.send_text(keys)
+                    await asyncio.wait_for(task, 5)
+
+        asyncio.run(run())
+        # "01" matched web-01, db-01 and cache-01; Down picked the first.
+        self.assertEqual(calls, [{"host": "web-01"}])
+
+    @patch("typerdantic.app.PromptSession")
+    def test_configured_completions_reach_the_prompt(self, MockPromptSession):
+        prompt_async = MockPromptSession.return_value.prompt_async = AsyncMock(
+            return_value="web-01"
+        )
+        config = MenuConfig(
+            items={
+                "connect": {
+                    "description": "Connect",
+                    "action": {
+                        "type": "command",
+                        "value": "true",
+                        "prompt_args": [
+                            {
+                                "name": "host",
+                                "prompt": "Host",
+                                "completions": {"command": "cat hosts.txt"},
+                            }
+                        ],
+                    },
+                }
+            }
+        )
+        Menu = create_menu_from_config("ConfigMenu", config)
+        app = TyperdanticApp(main_menu=Menu)
+        item = app.active_menu.get_selected_item()
+        self.assertEqual(item.prompt_args[0].completions.command, "cat hosts.txt")
+
+        values = asyncio.run(app._prompt_for(item.prompt_args))
+        self.assertEqual(values, {"host": "web-01"})
+        completer = prompt_async.await_args.kwargs["completer"]
+        self.assertIsInstance(completer, ArgumentCompleter)
+        self.assertEqual(completer.spec.command, "cat hosts.txt")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,242 @@
+# file: tests/test_daemon.py
+
+import asyncio
+import json
+import os
+import pty
+import socket
+import stat
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.attach import attach
+from typerdantic.base import TyperdanticMenu
+from typerdantic.daemon import TyperdanticDaemon
+from typerdantic.models import MenuItem
+
+factory_calls = []
+
+
+def greet(context: dict, args: dict):
+    print("Hello from the daemon")
+
+
+class DaemonMainMenu(TyperdanticMenu):
+    """Daemon Main Menu"""
+
+    greet: MenuItem = Field(default=MenuItem(description="Greet", action=greet))
+    quit: MenuItem = Field(default=MenuItem(description="Quit", is_quit=True))
+
+
+def make_app(input, output) -> TyperdanticApp:
+    factory_calls.append(output)
+    return TyperdanticApp(main_menu=DaemonMainMenu, input=input, output=output)
+
+
+class Client:
+    """Speaks the attach protocol without a terminal."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.received = b""
+
+    @classmethod
+    async def connect(cls, path: str) -> "Client":
+        reader, writer = await asyncio.open_unix_connection(path)
+        client = cls(reader, writer)
+        client.send({"type": "hello", "rows": 24, "columns": 80, "term": "xterm"})
+        return client
+
+    def receive(self, chunk: bytes):
+        self.received += chunk
+        # Answer cursor position requests like a terminal would.
+        for _ in range(chunk.count(b"\x1b[6n")):
+            self.send({"type": "input", "data": "\x1b[1;1R"})
+
+    def send(self, message: dict):
+        self.writer.write(json.dumps(message).encode() + b"\n")
+
+    async def read_until(self, text: bytes, timeout: float = 5.0):
+        async def read():
+            while text not in self.received:
+                chunk = await self.reader.read(65536)
+                if not chunk:
+                    raise EOFError(self.received[-500:])
+                self.receive(chunk)
+
+        await asyncio.wait_for(read(), timeout)
+
+    async def read_to_eof(self, timeout: float = 5.0):
+        async def read():
+            while chunk := await self.reader.read(65536):
+                self.receive(chunk)
+
+        await asyncio.wait_for(read(), timeout)
+
+
+class TestDaemon(unittest.TestCase):
+    def setUp(self):
+        factory_calls.clear()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.tmpdir.name, "daemon.sock")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def run_with_daemon(self, scenario):
+        async def main():
+            daemon = TyperdanticDaemon(make_app, self.socket_path)
+            await daemon.start()
+            try:
+                await scenario(daemon)
+            finally:
+                await daemon.close()
+
+        asyncio.run(main())
+
+    def test_client_gets_its_own_session(self):
+        async def scenario(daemon):
+            # Warming up builds one app before any client attaches.
+            self.assertEqual(len(factory_calls), 1)
+            self.assertEqual(os.stat(self.socket_path).st_mode & 0o777, 0o600)
+
+            client = await Client.connect(self.socket_path)
+            await client.read_until(b"Daemon Main Menu")
+            self.assertEqual(len(factory_calls), 2)
+
+            client.send({"type": "input", "data": "\r"})
+            await client.read_until(b"Hello from the daemon")
+            await client.read_until(b"Press Enter to continue")
+            client.send({"type": "input", "data": "\r"})
+            await asyncio.sleep(0.3)
+            client.send({"type": "input", "data": "q"})
+            await client.read_to_eof()
+            self.assertEqual(daemon.connections, set())
+
+        self.run_with_daemon(scenario)
+
+    def test_concurrent_clients_and_disconnect(self):
+        async def scenario(daemon):
+            first = await Client.connect(self.socket_path)
+            second = await Client.connect(self.socket_path)
+            await first.read_until(b"Daemon Main Menu")
+            await second.read_until(b"Daemon Main Menu")
+            self.assertEqual(len(daemon.connections), 2)
+
+            # Moving the cursor in one session does not affect the other.
+            first.send({"type": "resize", "rows": 30, "columns": 100})
+            first.send({"type": "input", "data": "\x1b[B\r"})
+            await first.read_to_eof()
+            self.assertNotIn(b"Hello from the daemon", first.received)
+
+            # A client that disconnects ends its session.
+            second.writer.close()
+            for _ in range(100):
+                if not daemon.connections:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(daemon.connections, set())
+            self.assertIs(sys.stdout, daemon._router)
+
+        self.run_with_daemon(scenario)
+        self.assertFalse(os.path.exists(self.socket_path))
+
+    def test_refuses_to_replace_a_live_socket(self):
+        async def scenario(daemon):
+            with self.assertRaises(RuntimeError):
+                await TyperdanticDaemon(make_app, self.socket_path).start()
+
+        self.run_with_daemon(scenario)
+
+    def test_refuses_to_replace_a_file_that_is_not_a_socket(self):
+        with open(self.socket_path, "w") as f:
+            f.write("notes")
+        with self.assertRaises(RuntimeError):
+            asyncio.run(TyperdanticDaemon(make_app, self.socket_path).start())
+        with open(self.socket_path) as f:
+            self.assertEqual(f.read(), "notes")
+
+        # A socket nobody listens on is stale and gets replaced.
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        os.unlink(self.socket_path)
+        stale.bind(self.socket_path)
+        stale.close()
+
+        async def scenario(daemon):
+            self.assertTrue(stat.S_ISSOCK(os.stat(self.socket_path).st_mode))
+
+        self.run_with_daemon(scenario)
+
+    def test_socket_is_created_owner_only(self):
+        modes = []
+
+        def record_mode(path, mode):
+            # The mode the socket had before it was chmod-ed.
+            modes.append(os.stat(path).st_mode & 0o777)
+
+        async def scenario(daemon):
+            self.assertEqual(os.umask(0o022), 0o022)
+
+        previous = os.umask(0o022)
+        try:
+            with patch("typerdantic.daemon.os.chmod", side_effect=record_mode):
+                self.run_with_daemon(scenario)
+        finally:
+            os.umask(previous)
+        self.assertEqual(modes, [0o600])
+
+    def test_attach_client_drives_a_session_from_a_terminal(self):
+        loop = asyncio.new_event_loop()
+        daemon = TyperdanticDaemon(make_app, self.socket_path)
+        loop.run_until_complete(daemon.start())
+        server = threading.Thread(target=loop.run_forever, daemon=True)
+        server.start()
+
+        master, slave = pty.openpty()
+        terminal = os.fdopen(slave, "w")
+        received = b""
+
+        def type_keys():
+            nonlocal received
+            while b"Daemon Main Menu" not in received:
+                received += os.read(master, 65536)
+            os.write(master, b"q")
+            # Drain the output so the client never blocks on the terminal.
+            try:
+                while chunk := os.read(master, 65536):
+                    received += chunk
+            except OSError:
+                pass
+
+        typist = threading.Thread(target=type_keys, daemon=True)
+        typist.start()
+        try:
+            started = time.perf_counter()
+            self.assertEqual(attach(self.socket_path, terminal, terminal), 0)
+            self.assertLess(time.perf_counter() - started, 5.0)
+        finally:
+            terminal.close()
+            os.close(master)
+            typist.join(timeout=5)
+            asyncio.run_coroutine_threadsafe(daemon.close(), loop).result(5)
+            loop.call_soon_threadsafe(loop.stop)
+            server.join(timeout=5)
+            loop.close()
+        self.assertIn(b"Daemon Main Menu", received)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,146 @@
+# file: tests/test_forms.py
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.models import ArgumentSpec, MenuItem
+
+calls = []
+
+
+def deploy(context: dict, args: dict):
+    calls.append(args)
+
+
+def status(context: dict, args: dict):
+    calls.append(args)
+    print("all services up")
+
+
+class DeployMenu(TyperdanticMenu):
+    """Deploy"""
+
+    deploy: MenuItem = Field(
+        default=MenuItem(
+            description="Deploy",
+            action=deploy,
+            args={"region": "eu"},
+            prompt_args=[
+                ArgumentSpec(name="env", prompt="Environment"),
+                ArgumentSpec(name="version", prompt="Version", default="1.0"),
+            ],
+        )
+    )
+    status: MenuItem = Field(default=MenuItem(description="Status", action=status))
+
+
+async def drive(app: TyperdanticApp, pipe_input, *steps: str, settle: float = 0.15):
+    """Runs `app`, sending each step of keys after the screen settles."""
+    task = asyncio.ensure_future(app.run())
+    for keys in steps:
+        await asyncio.sleep(settle)
+        pipe_input.send_text(keys)
+    await asyncio.sleep(settle)
+    pipe_input.send_text("q")
+    await asyncio.wait_for(task, 5)
+
+
+class TestArgumentForm(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+
+    @patch("typerdantic.app.PromptSession")
+    def test_form_asks_inside_the_running_app(self, MockPromptSession):
+        async def run():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = TyperdanticApp(
+                        main_menu=DeployMenu, input=pipe_input, output=DummyOutput()
+                    )
+                    seen = []
+                    app.on("prompt", lambda app, item, values: seen.append(app.form))
+                    await drive(
+                        app,
+                        pipe_input,
+                        "\r",  # Open the form
+                        "prod\t",  # Environment, then Tab to Version
+                        "\x7f\x7f\x7f2.0\r",  # Replace 1.0 and submit
+                        "\r",  # Open it again
+                        "\x1b[A\t\r",  # Up: the last environment, then submit
+                    )
+                    return app, seen
+
+        app, seen = asyncio.run(run())
+        self.assertEqual(
+            calls,
+            [
+                {"region": "eu", "env": "prod", "version": "2.0"},
+                {"region": "eu", "env": "prod", "version": "1.0"},
+            ],
+        )
+        self.assertFalse(app.form.visible)
+        self.assertEqual(len(seen), 2)
+        # The arguments didn't need a separate prompt session.
+        MockPromptSession.assert_not_called()
+
+    @patch("typerdantic.app.PromptSession")
+    def test_pause_is_shown_inside_the_running_app(self, MockPromptSession):
+        async def run():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = TyperdanticApp(
+                        main_menu=DeployMenu, input=pipe_input, output=DummyOutput()
+                    )
+                    task = asyncio.ensure_future(app.run())
+                    await asyncio.sleep(0.15)
+                    pipe_input.send_text("\x1b[B\r")  # Down to Status, Enter
+                    await asyncio.sleep(0.15)
+                    shown = (app.pause_panel.visible, app.pause_panel.text)
+                    # "q" closes the panel, not the app.
+                    pipe_input.send_text("q")
+                    await asyncio.sleep(0.15)
+                    after = (app.pause_panel.visible, app.is_running)
+                    pipe_input.send_text("q")
+                    await asyncio.wait_for(task, 5)
+                    return shown, after
+
+        shown, after = asyncio.run(run())
+        self.assertEqual(calls, [{}])
+        self.assertEqual(shown, (True, "all services up\n"))
+        self.assertEqual(after, (False, True))
+        MockPromptSession.assert_not_called()
+
+    def test_cancelled_form_runs_nothing(self):
+        async def run():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = TyperdanticApp(
+                        main_menu=DeployMenu, input=pipe_input, output=DummyOutput()
+                    )
+                    # A lone Esc is only recognized after the escape timeout.
+                    await drive(app, pipe_input, "\r", "staging\x1b", settle=0.7)
+                    return app
+
+        app = asyncio.run(run())
+        self.assertEqual(calls, [])
+        self.assertFalse(app.form.visible)
+        # "q" reached the menu again and closed the app.
+        self.assertFalse(app.application.is_running)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,156 @@
+# file: tests/test_governor.py
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.config_models import MenuConfig
+from typerdantic.executors import run_command
+from typerdantic.governor import (
+    ResourcePolicy,
+    SubprocessGovernor,
+    get_governor,
+    set_governor,
+)
+from typerdantic.loaders import create_menu_from_config
+
+PYTHON = f'"{sys.executable}" -c'
+
+
+def is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestResourcePolicy(unittest.TestCase):
+    def test_sizes_and_merging(self):
+        policy = ResourcePolicy(max_memory="512M", timeout=10)
+        self.assertEqual(policy.max_memory, 512 * 1024**2)
+
+        default = ResourcePolicy(nice=5, timeout=60)
+        merged = policy.merged_over(default)
+        self.assertEqual((merged.nice, merged.timeout), (5, 10))
+
+        governor = SubprocessGovernor(default_policy=default)
+        self.assertIs(governor.policy_for(None), default)
+        with self.assertRaises(ValueError):
+            ResourcePolicy(nice=40)
+
+    def test_config_actions_carry_their_policy(self):
+        config = MenuConfig.model_validate(
+            {
+                "items": {
+                    "backup": {
+                        "description": "Backup",
+                        "action": {
+                            "type": "command",
+                            "value": "./backup.sh",
+                            "resources": {"nice": 10, "max_memory": "2G"},
+                        },
+                    }
+                }
+            }
+        )
+        menu_class = create_menu_from_config("Backups", config)
+        action = menu_class.model_fields["backup"].default.action
+        self.assertEqual(action.keywords["policy"].nice, 10)
+        self.assertEqual(action.keywords["policy"].max_memory, 2 * 1024**3)
+
+
+@unittest.skipUnless(os.name == "posix", "resource limits use POSIX facilities")
+class TestGovernedCommands(unittest.TestCase):
+    def tearDown(self):
+        set_governor(None)
+
+    def test_timeout_kills_the_whole_process_group(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            pid_file = Path(tmp) / "child.pid"
+            command = f"sleep 30 & echo $! > {pid_file}; wait"
+            policy = ResourcePolicy(timeout=0.5, kill_grace=0.5)
+
+            started = time.perf_counter()
+            code, _, stderr = asyncio.run(run_command(command, policy=policy))
+
+            self.assertLess(time.perf_counter() - started, 5)
+            self.assertLess(code, 0)
+            self.assertIn("timing out", stderr)
+            child = int(pid_file.read_text())
+            deadline = time.monotonic() + 2
+            while is_alive(child) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            self.assertFalse(is_alive(child))
+
+    def test_priority_and_limits_apply_to_the_command(self):
+        script = (
+            "import os, resource;"
+            "print(os.nice(0), resource.getrlimit(resource.RLIMIT_CPU)[0],"
+            " resource.getrlimit(resource.RLIMIT_AS)[0])"
+        )
+        policy = ResourcePolicy(nice=7, max_cpu_seconds=30, max_memory="4G")
+        before = os.nice(0)
+        code, stdout, _ = asyncio.run(
+            run_command(f"{PYTHON} '{script}'", policy=policy)
+        )
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout.split(), [str(before + 7), "30", str(4 * 1024**3)])
+
+    def test_limits_apply_without_the_tools(self):
+        script = (
+            "import os, resource;"
+            "print(os.nice(0), resource.getrlimit(resource.RLIMIT_CPU)[0])"
+        )
+        policy = ResourcePolicy(nice=4, max_cpu_seconds=20)
+        before = os.nice(0)
+        with patch("typerdantic.governor.shutil.which", return_value=None):
+            prefix = policy.command_prefix()
+            code, stdout, _ = asyncio.run(
+                run_command(f"{PYTHON} '{script}'", policy=policy)
+            )
+        self.assertEqual(prefix[0], sys.executable)
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout.split(), [str(before + 4), "20"])
+
+    def test_policies_are_applied_without_preexec_fn(self):
+        policy = ResourcePolicy(nice=2, max_memory="1G", timeout=5)
+        with patch(
+            "asyncio.create_subprocess_exec", wraps=asyncio.create_subprocess_exec
+        ) as spawn:
+            code, _, _ = asyncio.run(run_command("true", policy=policy))
+        self.assertEqual(code, 0)
+        self.assertNotIn("preexec_fn", spawn.call_args.kwargs)
+        self.assertTrue(spawn.call_args.kwargs["start_new_session"])
+
+    def test_default_policy_and_concurrency_cap(self):
+        set_governor(
+            SubprocessGovernor(max_concurrent=1, default_policy=ResourcePolicy(nice=3))
+        )
+        self.assertEqual(get_governor().max_concurrent, 1)
+        script = "import os, time; print(os.nice(0)); time.sleep(0.2)"
+
+        async def run_three():
+            return await asyncio.gather(
+                *(run_command(f"{PYTHON} '{script}'") for _ in range(3))
+            )
+
+        before = os.nice(0)
+        started = time.perf_counter()
+        results = asyncio.run(run_three())
+        # The commands were queued and ran one after the other.
+        self.assertGreaterEqual(time.perf_counter() - started, 0.6)
+        self.assertEqual([r[1].strip() for r in results], [str(before + 3)] * 3)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
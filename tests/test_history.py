@@ -0,0 +1,189 @@
+# file: tests/test_history.py
+
+import asyncio
+import contextlib
+import io
+import sys
+import tempfile
+import time
+import unittest
+from functools import partial
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from click.testing import CliRunner
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.cli import build_cli
+from typerdantic.executors import execute_action_string
+from typerdantic.history import HistoryMenu, RunHistory, RunRecord
+from typerdantic.models import MenuItem
+
+
+async def deploy(context: dict, args: dict):
+    print(f"deploying {args['env']}")
+    return 3 if args["env"] == "prod" else 0
+
+
+def broken(context: dict, args: dict):
+    raise RuntimeError("no route to host")
+
+
+class OpsMenu(TyperdanticMenu):
+    """Ops"""
+
+    deploy: MenuItem = Field(
+        default=MenuItem(description="Deploy", action=deploy, args={"env": "staging"})
+    )
+    ping: MenuItem = Field(default=MenuItem(description="Ping", action=broken))
+    history: MenuItem = Field(
+        default=MenuItem(description="History", target_menu="history")
+    )
+
+
+def run_record(i: int, **fields) -> RunRecord:
+    values = dict(
+        started_at=1_700_000_000 + i,
+        duration=0.5,
+        menu="main",
+        item=f"Check host{i % 50}",
+        action="command::check",
+        status="failed" if i % 1000 == 0 else "ok",
+    )
+    values.update(fields)
+    return RunRecord(**values)
+
+
+class TestRunHistory(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = RunHistory(Path(self.tmp.name) / "runs.db")
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp.cleanup()
+
+    @patch("typerdantic.app.PromptSession")
+    def test_actions_run_from_the_menu_are_recorded(self, MockPromptSession):
+        MockPromptSession.return_value.prompt_async = AsyncMock()
+        app = TyperdanticApp(main_menu=OpsMenu, history=self.history)
+        menu = app.active_menu
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            asyncio.run(app.handle_selection(menu.deploy))
+            asyncio.run(
+                app.handle_selection(
+                    menu.deploy.model_copy(update={"args": {"env": "prod"}})
+                )
+            )
+            with self.assertRaises(RuntimeError):
+                asyncio.run(app.handle_selection(menu.ping))
+        self.assertTrue(self.history.flush(5))
+
+        # Output is recorded and still printed.
+        self.assertIn("deploying staging", stdout.getvalue())
+        runs = self.history.query()
+        self.assertEqual(
+            [(r.item, r.status, r.exit_code) for r in runs],
+            [("Ping", "error", None), ("Deploy", "failed", 3), ("Deploy", "ok", 0)],
+        )
+        self.assertEqual(runs[2].output, "deploying staging\n")
+        self.assertEqual(runs[2].args, {"env": "staging"})
+        self.assertEqual(runs[2].menu, "main")
+        self.assertIn("no route to host", runs[0].error)
+        self.assertEqual(self.history.count(failed=True), 2)
+
+    def test_paged_queries_use_the_indexes(self):
+        for i in range(20_000):
+            self.history.record(run_record(i))
+        self.assertTrue(self.history.flush(30))
+        self.assertEqual(self.history.count(), 20_000)
+
+        started = time.perf_counter()
+        page = self.history.query(item="Check host0", failed=True, limit=5)
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(len(page), 5)
+        self.assertEqual(page[0].started_at, 1_700_000_000 + 19_000)
+
+        following = self.history.query(
+            item="Check host0", failed=True, after=page[-1].cursor, limit=5
+        )
+        self.assertEqual(
+            [r.started_at for r in following],
+            [1_700_000_000 + i for i in (14_000, 13_000, 12_000, 11_000, 10_000)],
+        )
+        plan = self.history._execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM runs WHERE item = ?"
+            " ORDER BY started_at DESC, id DESC LIMIT 5",
+            ["Check host0"],
+        )
+        self.assertIn("runs_item", " ".join(str(row) for row in plan))
+
+
+class TestHistoryViews(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.history = RunHistory(Path(self.tmp.name) / "runs.db")
+
+    def tearDown(self):
+        self.history.close()
+        self.tmp.cleanup()
+
+    def test_history_menu_pages_and_filters(self):
+        for i in range(45):
+            self.history.record(run_record(i, status="failed" if i < 3 else "ok"))
+        self.history.flush(5)
+        app = TyperdanticApp(main_menu=OpsMenu, history=self.history)
+        app.navigate_to("history")
+        menu = app.active_menu
+        self.assertIsInstance(menu, HistoryMenu)
+
+        def names():
+            return [name for name, _ in menu._menu_items]
+
+        self.assertEqual(len([n for n in names() if n.startswith("run_")]), 20)
+        items = dict(menu._menu_items)
+        asyncio.run(app.handle_selection(items["older"]))
+        asyncio.run(app.handle_selection(dict(menu._menu_items)["older"]))
+        runs = [n for n in names() if n.startswith("run_")]
+        self.assertEqual(len(runs), 5)
+        self.assertNotIn("older", names())
+        asyncio.run(app.handle_selection(dict(menu._menu_items)["newer"]))
+        self.assertEqual(len([n for n in names() if n.startswith("run_")]), 20)
+
+        asyncio.run(app.handle_selection(dict(menu._menu_items)["failures"]))
+        self.assertEqual(len([n for n in names() if n.startswith("run_")]), 3)
+        # Paging actions don't end up in the history themselves.
+        self.history.flush(5)
+        self.assertEqual(self.history.count(), 45)
+
+    @patch("typerdantic.executors.run_command", new_callable=AsyncMock)
+    def test_cli_runs_are_recorded(self, mock_run_command: AsyncMock):
+        mock_run_command.return_value = (0, "done", "")
+
+        class CliMenu(TyperdanticMenu):
+            """CLI"""
+
+            backup: MenuItem = Field(
+                default=MenuItem(
+                    description="Backup",
+                    action=partial(execute_action_string, "command::./backup.sh"),
+                )
+            )
+
+        app = TyperdanticApp(main_menu=CliMenu, history=self.history)
+        result = CliRunner().invoke(build_cli(app), ["backup"])
+        self.assertEqual(result.exit_code, 0, result.output)
+        (run,) = self.history.query()
+        self.assertEqual((run.item, run.action), ("Backup", "command::./backup.sh"))
+        self.assertIn("done", run.output)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,56 @@
+# file: tests/test_lazy_imports.py
+
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+
+def loaded_modules_after(statement: str) -> set:
+    """Runs `statement` in a fresh interpreter and returns sys.modules keys."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(project_root / "src")
+    result = subprocess.run(
+        [sys.executable, "-c", f"{statement}; import sys; print(*sys.modules)"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_package_import_is_light(self):
+        modules = loaded_modules_after("import typerdantic")
+        self.assertNotIn("pydantic", modules)
+        self.assertNotIn("prompt_toolkit", modules)
+
+    def test_config_loading_does_not_import_tui(self):
+        modules = loaded_modules_after(
+            "from typerdantic.config_models import MenuConfig; "
+            "from typerdantic.loaders import create_menu_from_config; "
+            "create_menu_from_config('M', MenuConfig(items={'a': {'description': 'A'}}))"
+        )
+        self.assertIn("typerdantic.loaders", modules)
+        self.assertNotIn("typerdantic.app", modules)
+        self.assertNotIn("prompt_toolkit", modules)
+
+    def test_public_names_resolve_lazily(self):
+        import typerdantic
+        from typerdantic.app import TyperdanticApp
+
+        self.assertIs(typerdantic.TyperdanticApp, TyperdanticApp)
+        for name in typerdantic.__all__:
+            self.assertTrue(hasattr(typerdantic, name), name)
+        with self.assertRaises(AttributeError):
+            typerdantic.does_not_exist
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
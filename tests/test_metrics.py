@@ -0,0 +1,99 @@
+# file: tests/test_metrics.py
+
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.metrics import Metrics
+from typerdantic.models import MenuItem
+
+
+def noop_action(context: dict, args: dict):
+    pass
+
+
+class MetricsTestMenu(TyperdanticMenu):
+    """Metrics Test Menu"""
+
+    first: MenuItem = Field(default=MenuItem(description="First", action=noop_action))
+    second: MenuItem = Field(default=MenuItem(description="Second"))
+
+
+class TestMetrics(unittest.TestCase):
+    def test_histograms_and_counters(self):
+        metrics = Metrics()
+        for value in (0.002, 0.004, 0.2):
+            metrics.observe("typerdantic_render_seconds", value, menu="main")
+        metrics.inc("typerdantic_actions_total", status="ok")
+        metrics.inc("typerdantic_actions_total", status="ok")
+
+        histogram = metrics.histograms["typerdantic_render_seconds"][
+            (("menu", "main"),)
+        ]
+        self.assertEqual(histogram.count, 3)
+        self.assertAlmostEqual(histogram.sum, 0.206)
+        self.assertEqual(histogram.quantile(0.5), 0.005)
+
+        text = metrics.to_openmetrics()
+        self.assertIn('typerdantic_actions_total{status="ok"} 2', text)
+        self.assertIn(
+            'typerdantic_render_seconds_bucket{menu="main",le="+Inf"} 3', text
+        )
+        self.assertTrue(text.endswith("# EOF\n"))
+
+    def test_export_format_follows_suffix(self):
+        metrics = Metrics()
+        metrics.observe("typerdantic_loop_lag_seconds", 0.01)
+        with tempfile.TemporaryDirectory() as tmp:
+            data = json.loads(metrics.export(Path(tmp) / "m.json").read_text())
+            self.assertEqual(
+                data["histograms"]["typerdantic_loop_lag_seconds"][0]["count"], 1
+            )
+            prom = metrics.export(Path(tmp) / "m.prom").read_text()
+            self.assertIn("# TYPE typerdantic_loop_lag_seconds histogram", prom)
+
+    def test_app_records_render_and_action_metrics(self):
+        metrics = Metrics()
+
+        async def drive():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = TyperdanticApp(main_menu=MetricsTestMenu, metrics=metrics)
+                    pipe_input.send_text("\r")
+                    loop = asyncio.get_running_loop()
+                    # Enter closes the pause panel, then "q" the app.
+                    loop.call_later(0.3, lambda: pipe_input.send_text("\r"))
+                    loop.call_later(0.5, lambda: pipe_input.send_text("q"))
+                    await app.run()
+
+        asyncio.run(drive())
+
+        self.assertIn("typerdantic_render_seconds", metrics.histograms)
+        self.assertIn("typerdantic_navigate_seconds", metrics.histograms)
+        self.assertIn("typerdantic_refresh_seconds", metrics.histograms)
+        self.assertIn("typerdantic_keypress_to_frame_seconds", metrics.histograms)
+        counters = metrics.counters["typerdantic_actions_total"]
+        self.assertEqual(
+            counters[
+                (("item", "First"), ("menu", "MetricsTestMenu"), ("status", "ok"))
+            ],
+            1,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
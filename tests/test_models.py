@@ -0,0 +1,81 @@
+# file: tests/test_models.py
+
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic import models
+from typerdantic.models import ArgumentSpec, MenuItem, validate_menu_items
+
+
+def noop_action(context: dict, args: dict):
+    pass
+
+
+class TestTrustedMenuItem(unittest.TestCase):
+    def test_trusted_matches_validated_item(self):
+        """A trusted item holds the same data as a validated one."""
+        spec = ArgumentSpec(name="host", prompt="Enter host")
+        trusted = MenuItem.trusted(
+            description="Deploy", action=noop_action, prompt_args=[spec]
+        )
+        validated = MenuItem(
+            description="Deploy", action=noop_action, prompt_args=[spec]
+        )
+
+        self.assertEqual(trusted, validated)
+        self.assertIsNone(trusted.target_menu)
+        self.assertFalse(trusted.is_quit)
+        self.assertEqual(
+            trusted.model_fields_set, {"description", "action", "prompt_args"}
+        )
+
+    def test_trusted_skips_validation(self):
+        """The fast path stores values as given, without checking them."""
+        item = MenuItem.trusted(description="Not callable", action="internal::x")
+        self.assertEqual(item.action, "internal::x")
+
+    def test_trusted_validates_in_debug_mode(self):
+        """With DEBUG_VALIDATION enabled, bad data is rejected."""
+        with patch.object(models, "DEBUG_VALIDATION", True):
+            with self.assertRaises(ValidationError):
+                MenuItem.trusted(description="Not callable", action="internal::x")
+
+
+class TestValidateMenuItems(unittest.TestCase):
+    def test_validates_list_of_dicts(self):
+        items = validate_menu_items(
+            [
+                {"description": "One", "action": noop_action},
+                {
+                    "description": "Two",
+                    "prompt_args": [{"name": "n", "prompt": "Name"}],
+                },
+            ]
+        )
+        self.assertEqual([item.description for item in items], ["One", "Two"])
+        self.assertIsInstance(items[1].prompt_args[0], ArgumentSpec)
+
+    def test_validates_generator_and_json(self):
+        items = validate_menu_items({"description": str(i)} for i in range(3))
+        self.assertEqual(len(items), 3)
+
+        items = validate_menu_items(b'[{"description": "From JSON", "is_quit": true}]')
+        self.assertTrue(items[0].is_quit)
+
+    def test_reports_every_invalid_item(self):
+        with self.assertRaises(ValidationError) as ctx:
+            validate_menu_items([{"description": "ok"}, {}, {"description": 1}])
+        locations = {error["loc"][0] for error in ctx.exception.errors()}
+        self.assertEqual(locations, {1, 2})
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
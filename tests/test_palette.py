@@ -0,0 +1,169 @@
+# file: tests/test_palette.py
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.config_models import MenuConfig
+from typerdantic.loaders import create_menu_from_config
+from typerdantic.models import MenuItem
+from typerdantic.registry import register_action
+
+built = []
+ran = []
+
+
+class MainMenu(TyperdanticMenu):
+    """Main Menu"""
+
+    def __init__(self, **data):
+        built.append("main")
+        super().__init__(**data)
+
+    settings: MenuItem = Field(
+        default=MenuItem(description="Settings", target_menu="settings")
+    )
+    quit: MenuItem = Field(default=MenuItem(description="Quit", is_quit=True))
+
+
+class SettingsMenu(TyperdanticMenu):
+    """Settings"""
+
+    def __init__(self, **data):
+        built.append("settings")
+        super().__init__(**data)
+
+    network: MenuItem = Field(
+        default=MenuItem(description="Network settings", target_menu="network")
+    )
+    theme: MenuItem = Field(default=MenuItem(description="Theme"))
+
+
+NETWORK_CONFIG = MenuConfig.model_validate(
+    {
+        "doc": "Network",
+        "items": {
+            "restart_dns": {"description": "Restart DNS", "action": "internal::dns"},
+            "set_proxy": {"description": "Set proxy"},
+        },
+    }
+)
+
+
+def restart_dns(context: dict, args: dict):
+    ran.append(type(context["menu"]).__name__)
+
+
+def make_app(**kwargs) -> TyperdanticApp:
+    app = TyperdanticApp(main_menu=MainMenu, **kwargs)
+    app.register_menu("settings", SettingsMenu)
+    app.register_menu("network", create_menu_from_config("Network", NETWORK_CONFIG))
+    return app
+
+
+class TestCommandIndex(unittest.TestCase):
+    def setUp(self):
+        built.clear()
+
+    def test_index_is_built_without_instantiating_menus(self):
+        app = make_app()
+        results = app.command_index.search("dns")
+        self.assertEqual(
+            [(e.menu_name, e.item_name) for e in results], [("network", "restart_dns")]
+        )
+        self.assertEqual(built, ["main"])
+        self.assertEqual(len(app.command_index), 5)
+        self.assertEqual(
+            app.command_index.path_to("network"), ("main", "settings", "network")
+        )
+
+    def test_search_ranks_prefix_matches_first(self):
+        app = make_app()
+        descriptions = [e.item.description for e in app.command_index.search("set")]
+        self.assertEqual(descriptions[:2], ["Settings", "Set proxy"])
+        # Every word must match, in the description or the menu title.
+        self.assertEqual(len(app.command_index.search("network proxy")), 1)
+
+    def test_index_updates_incrementally(self):
+        app = make_app()
+        index = app.command_index
+        self.assertEqual(index.sync(), 3)
+        self.assertEqual(index.sync(), 0)
+
+        class ReloadedSettings(SettingsMenu):
+            """Settings"""
+
+            backup: MenuItem = Field(default=MenuItem(description="Backup"))
+
+        app.register_menu("settings", ReloadedSettings, replace=True)
+        self.assertEqual(index.sync(), 1)
+        self.assertEqual(len(index.search("backup")), 1)
+        with self.assertRaises(ValueError):
+            app.register_menu("settings", SettingsMenu)
+
+
+class TestJumping(unittest.TestCase):
+    def setUp(self):
+        built.clear()
+        ran.clear()
+
+    def test_jump_builds_the_navigation_path(self):
+        app = make_app()
+        app.jump_to("network", "set_proxy")
+        names = [app.menu_name_of(menu) for menu in app.nav_stack]
+        self.assertEqual(names, ["main", "settings", "network"])
+        self.assertEqual(app.active_menu.get_selected_item().description, "Set proxy")
+
+        # Jumping elsewhere keeps the shared part of the stack.
+        settings = app.nav_stack[1]
+        app.jump_to("settings", "theme")
+        self.assertEqual(app.nav_stack[1:], [settings])
+        self.assertEqual(app.active_menu._selected_index, 1)
+
+    def test_palette_runs_the_match_from_the_keyboard(self):
+        register_action("dns")(restart_dns)
+
+        async def drive():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = make_app(input=pipe_input, output=DummyOutput())
+                    task = asyncio.ensure_future(app.run())
+                    await asyncio.sleep(0.1)
+                    pipe_input.send_text("\x10")  # Ctrl-P
+                    await asyncio.sleep(0.05)
+                    self.assertTrue(app.palette.visible)
+                    # "q" goes to the query instead of closing the app.
+                    pipe_input.send_text("q")
+                    await asyncio.sleep(0.05)
+                    self.assertEqual(app.palette.buffer.text, "q")
+                    pipe_input.send_text("\x7fdns")
+                    await asyncio.sleep(0.05)
+                    pipe_input.send_text("\r")
+                    await asyncio.sleep(0.1)
+                    pipe_input.send_text("\r")  # Press Enter to continue
+                    await asyncio.sleep(0.3)
+                    self.assertFalse(app.palette.visible)
+                    names = [app.menu_name_of(menu) for menu in app.nav_stack]
+                    pipe_input.send_text("qqq")
+                    await asyncio.wait_for(task, 5)
+                    return names
+
+        names = asyncio.run(drive())
+        self.assertEqual(names, ["main", "settings", "network"])
+        self.assertEqual(ran, ["Network"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
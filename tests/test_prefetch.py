@@ -0,0 +1,175 @@
+# file: tests/test_prefetch.py
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from typing import List, Tuple
+
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.models import MenuItem
+from typerdantic.prefetch import MenuPrefetcher
+
+builds = []
+closed = []
+
+
+class ProjectsMenu(TyperdanticMenu):
+    """Projects"""
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        builds.append("projects")
+        return [(f"p{i}", MenuItem(description=f"Project {i}")) for i in range(50)]
+
+    def on_close(self):
+        closed.append("projects")
+
+
+class HostsMenu(TyperdanticMenu):
+    """Hosts"""
+
+    depends_on = {"hosts"}
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        builds.append("hosts")
+        return [("web", MenuItem(description="web"))]
+
+    def on_close(self):
+        closed.append("hosts")
+
+
+class MainMenu(TyperdanticMenu):
+    """Main"""
+
+    projects: MenuItem = Field(
+        default=MenuItem(description="Projects", target_menu="projects")
+    )
+    hosts: MenuItem = Field(default=MenuItem(description="Hosts", target_menu="hosts"))
+    about: MenuItem = Field(default=MenuItem(description="About"))
+
+
+def make_app(prefetcher: MenuPrefetcher) -> TyperdanticApp:
+    app = TyperdanticApp(main_menu=MainMenu, prefetcher=prefetcher)
+    app.register_menu("projects", ProjectsMenu)
+    app.register_menu("hosts", HostsMenu)
+    return app
+
+
+class TestMenuPrefetcher(unittest.TestCase):
+    def setUp(self):
+        builds.clear()
+        closed.clear()
+
+    def test_hovered_target_menu_is_reused_on_navigation(self):
+        prefetcher = MenuPrefetcher(dwell=0.01)
+        app = make_app(prefetcher)
+
+        async def hover_then_select():
+            app._on_cursor_moved()
+            await asyncio.sleep(0.2)
+            self.assertIn("projects", prefetcher)
+            prefetched = prefetcher._ready["projects"][0]
+            app.navigate_to("projects")
+            return prefetched
+
+        prefetched = asyncio.run(hover_then_select())
+        self.assertIs(app.active_menu, prefetched)
+        self.assertEqual(builds, ["projects"])
+        self.assertEqual(prefetcher.stats.hits, 1)
+        self.assertEqual(prefetcher.memory_used, 0)
+
+    def test_moving_the_cursor_cancels_the_prefetch(self):
+        prefetcher = MenuPrefetcher(dwell=0.05)
+        app = make_app(prefetcher)
+
+        async def scroll_past():
+            app._on_cursor_moved()
+            app.active_menu.go_down()
+            app._on_cursor_moved()
+            app.active_menu.go_down()
+            app._on_cursor_moved()
+            await asyncio.sleep(0.2)
+
+        asyncio.run(scroll_past())
+        self.assertEqual(builds, [])
+        self.assertEqual(len(prefetcher), 0)
+        self.assertEqual(prefetcher.stats.cancelled, 2)
+
+    def test_menus_with_invalidated_data_are_rebuilt(self):
+        prefetcher = MenuPrefetcher(dwell=0.0, threaded=False)
+        app = make_app(prefetcher)
+        app.active_menu._selected_index = 1
+
+        async def hover_invalidate_select():
+            app._on_cursor_moved()
+            await asyncio.sleep(0.05)
+            app.invalidate_data(["hosts"])
+            app.navigate_to("hosts")
+
+        asyncio.run(hover_invalidate_select())
+        self.assertEqual(builds, ["hosts", "hosts"])
+        self.assertEqual(prefetcher.stats.stale, 1)
+
+    def test_budget_limits_prefetched_menus(self):
+        prefetcher = MenuPrefetcher(dwell=0.0, max_menus=1, threaded=False)
+        app = make_app(prefetcher)
+
+        async def hover_both():
+            app._on_cursor_moved()
+            await asyncio.sleep(0.05)
+            app.active_menu.go_down()
+            app._on_cursor_moved()
+            await asyncio.sleep(0.05)
+
+        asyncio.run(hover_both())
+        self.assertNotIn("projects", prefetcher)
+        self.assertIn("hosts", prefetcher)
+        self.assertEqual(prefetcher.stats.evictions, 1)
+
+        # A menu larger than the whole memory budget is not kept.
+        small = MenuPrefetcher(dwell=0.0, max_bytes=100, threaded=False)
+        app = make_app(small)
+
+        async def hover():
+            app._on_cursor_moved()
+            await asyncio.sleep(0.05)
+
+        asyncio.run(hover())
+        self.assertEqual(len(small), 0)
+        self.assertEqual(small.memory_used, 0)
+
+    def test_dropped_menus_are_closed(self):
+        prefetcher = MenuPrefetcher(dwell=0.0, max_menus=1, threaded=False)
+        app = make_app(prefetcher)
+
+        async def hover(index: int):
+            app.active_menu._selected_index = index
+            app._on_cursor_moved()
+            await asyncio.sleep(0.05)
+
+        async def scenario():
+            await hover(0)
+            await hover(1)
+            # Projects was evicted to make room for hosts.
+            self.assertEqual(closed, ["projects"])
+            app.invalidate_data(["hosts"])
+            app.navigate_to("hosts")
+            # The stale copy was dropped; the one shown is still open.
+            self.assertEqual(closed, ["projects", "hosts"])
+            app.go_back()
+            await hover(0)
+            prefetcher.clear()
+
+        asyncio.run(scenario())
+        self.assertEqual(closed, ["projects", "hosts", "hosts", "projects"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,135 @@
+# file: tests/test_profiling.py
+
+import asyncio
+import cProfile
+import pstats
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.models import MenuItem
+from typerdantic.profiling import Profiler
+
+
+def busy_action(context: dict, args: dict):
+    sum(i * i for i in range(10_000))
+
+
+class ProfiledMenu(TyperdanticMenu):
+    """Profiled Menu"""
+
+    busy: MenuItem = Field(default=MenuItem(description="Busy", action=busy_action))
+
+
+def functions_in(stats_path: Path) -> set:
+    return {func[2] for func in pstats.Stats(str(stats_path)).stats}
+
+
+class TestProfiler(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.tmp_path = Path(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_nested_sections_are_attributed_separately(self):
+        profiler = Profiler(self.tmp_path)
+
+        def outer_work():
+            return sorted(range(1000))
+
+        def inner_work():
+            return list(reversed(range(1000)))
+
+        with profiler.section("outer"):
+            outer_work()
+            with profiler.section("inner"):
+                inner_work()
+
+        paths = {path.name: path for path in profiler.write_reports()}
+        self.assertIn("outer_work", functions_in(paths["outer.pstats"]))
+        self.assertNotIn("inner_work", functions_in(paths["outer.pstats"]))
+        self.assertIn("inner_work", functions_in(paths["inner.pstats"]))
+        self.assertIn("summary.txt", paths)
+
+    def test_interleaved_async_sections_keep_their_own_stack(self):
+        profiler = Profiler(self.tmp_path)
+
+        def first_work():
+            return sorted(range(1000))
+
+        async def first():
+            with profiler.section("first"):
+                await asyncio.sleep(0.01)
+                with profiler.section("first.inner"):
+                    await asyncio.sleep(0.02)
+                first_work()
+
+        async def second():
+            await asyncio.sleep(0.005)
+            # Starts while "first" is collecting and ends after it.
+            with profiler.section("second"):
+                await asyncio.sleep(0.05)
+
+        async def both():
+            await asyncio.gather(first(), second())
+
+        asyncio.run(both())
+        self.assertIn("first.inner", profiler.profiles)
+        self.assertNotIn("second", profiler.profiles)
+        self.assertIsNone(profiler._active)
+        # Nothing was left collecting.
+        probe = cProfile.Profile()
+        probe.enable()
+        probe.disable()
+
+        paths = {path.name: path for path in profiler.write_reports()}
+        self.assertIn("first_work", functions_in(paths["first.pstats"]))
+
+    def test_menu_sampling_can_be_toggled(self):
+        profiler = Profiler(self.tmp_path)
+        self.assertFalse(profiler.toggle_menu("MainMenu"))
+        with profiler.section("MainMenu.render", menu="MainMenu"):
+            pass
+        self.assertNotIn("MainMenu.render", profiler.profiles)
+        self.assertTrue(profiler.toggle_menu("MainMenu"))
+
+    def test_memory_tracing_writes_allocation_summary(self):
+        profiler = Profiler(self.tmp_path, trace_memory=True, top_n=5)
+        profiler.start()
+        with profiler.section("alloc"):
+            data = [str(i) for i in range(10_000)]
+        names = [path.name for path in profiler.write_reports()]
+        profiler.stop()
+        self.assertIn("allocations.txt", names)
+        self.assertTrue(data)
+
+    @patch("typerdantic.app.PromptSession")
+    def test_app_profiles_selection_and_action(self, MockPromptSession):
+        MockPromptSession.return_value.prompt_async = AsyncMock()
+        app = TyperdanticApp(main_menu=ProfiledMenu)
+        app.profiler = Profiler(self.tmp_path)
+
+        asyncio.run(app.handle_selection(app.active_menu.get_selected_item()))
+
+        self.assertIn("ProfiledMenu.selection", app.profiler.profiles)
+        self.assertIn("ProfiledMenu.action.Busy", app.profiler.profiles)
+        paths = {path.name: path for path in app.profiler.write_reports()}
+        self.assertIn(
+            "busy_action", functions_in(paths["ProfiledMenu.action.Busy.pstats"])
+        )
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
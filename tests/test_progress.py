@@ -0,0 +1,193 @@
+# file: tests/test_progress.py
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.executors import execute_action_string, run_command
+from typerdantic.models import MenuItem
+from typerdantic.progress import (
+    ProgressHandle,
+    progress_line_parser,
+    render_progress,
+)
+
+seen = {}
+
+
+async def chatty_action(context: dict, args: dict):
+    """Reports a million increments while yielding to the loop."""
+    progress = context["progress"]
+    progress.total = 1_000_000
+    for _ in range(100):
+        for _ in range(10_000):
+            progress.advance()
+        await asyncio.sleep(0.002)
+    seen["bar"] = context["app"]._get_progress_fragments()
+
+
+def threaded_action(context: dict, args: dict):
+    seen["thread"] = threading.current_thread()
+    for _ in range(5):
+        context["progress"].advance()
+        time.sleep(0.02)
+
+
+class ProgressMenu(TyperdanticMenu):
+    """Progress Menu"""
+
+    chatty: MenuItem = Field(
+        default=MenuItem(description="Chatty", action=chatty_action)
+    )
+    threaded: MenuItem = Field(
+        default=MenuItem(
+            description="Threaded", action=threaded_action, run_in_thread=True
+        )
+    )
+
+
+class TestProgressHandle(unittest.TestCase):
+    def test_advance_is_thread_safe(self):
+        progress = ProgressHandle(total=400_000)
+
+        def work():
+            for _ in range(100_000):
+                progress.advance()
+
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(progress.completed, 400_000)
+        self.assertEqual(progress.fraction, 1.0)
+
+    def test_render(self):
+        progress = ProgressHandle(total=10, message="copying")
+        progress.advance(5)
+        line = render_progress(progress, width=10)
+        self.assertTrue(line.startswith("[#####-----]  50% 5/10"))
+        self.assertTrue(line.endswith("copying"))
+
+        unknown = ProgressHandle()
+        unknown.advance(3)
+        self.assertIn("[   #      ] 3", render_progress(unknown, width=10))
+
+    def test_line_parser_patterns(self):
+        progress = ProgressHandle()
+        progress_line_parser(r"(?P<percent>\d+)%", progress)("downloading 42%")
+        self.assertEqual(progress.snapshot(), (42.0, 100, ""))
+
+        progress_line_parser(r"\[(\d+)/(\d+)\]", progress)("[3/8] building")
+        self.assertEqual(progress.snapshot(), (3.0, 8.0, ""))
+
+        parse = progress_line_parser(
+            r"(?P<completed>\d+) of (?P<total>\d+): (?P<message>.*)", progress
+        )
+        parse("unrelated output")
+        parse("5 of 9: tests/test_app.py")
+        self.assertEqual(progress.snapshot(), (5.0, 9.0, "tests/test_app.py"))
+
+
+class TestCommandProgress(unittest.TestCase):
+    def test_run_command_streams_lines_split_on_carriage_returns(self):
+        lines = []
+        script = "import sys; [sys.stdout.write(f'{i}%\\r') for i in (10, 50, 100)]"
+        return_code, stdout, _ = asyncio.run(
+            run_command(f'"{sys.executable}" -c "{script}"', on_line=lines.append)
+        )
+        self.assertEqual(return_code, 0)
+        self.assertEqual(lines, ["10%", "50%", "100%"])
+        self.assertEqual(stdout, "10%\r50%\r100%\r")
+
+    def test_command_action_reports_progress_by_pattern(self):
+        progress = ProgressHandle()
+        script = "print('[1/4]'); print('[4/4] done')"
+        asyncio.run(
+            execute_action_string(
+                f'command::"{sys.executable}" -c "{script}"',
+                context={"progress": progress},
+                progress_pattern=r"\[(\d+)/(\d+)\]",
+            )
+        )
+        self.assertEqual(progress.snapshot()[:2], (4.0, 4.0))
+
+
+class TestAppProgress(unittest.TestCase):
+    def setUp(self):
+        seen.clear()
+
+    def test_progress_bar_redraws_are_throttled(self):
+        async def scenario():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = TyperdanticApp(
+                        main_menu=ProgressMenu,
+                        input=pipe_input,
+                        output=DummyOutput(),
+                    )
+                    renders = []
+                    app.application.after_render += lambda _: renders.append(1)
+                    run_task = asyncio.ensure_future(app.run())
+                    await asyncio.sleep(0.05)
+                    before = len(renders)
+                    pipe_input.send_text("\r")
+                    while "bar" not in seen:
+                        await asyncio.sleep(0.01)
+                    during = len(renders) - before
+                    app.application.exit()
+                    await run_task
+                    return app, during
+
+        with patch("prompt_toolkit.shortcuts.PromptSession.prompt_async", AsyncMock()):
+            app, during = asyncio.run(scenario())
+
+        # A million increments over ~0.3s cause a handful of redraws.
+        self.assertLess(during, 20)
+        self.assertIn("100% 1000000/1000000", seen["bar"][0][1])
+        self.assertIsNone(app.progress)
+
+    @patch("typerdantic.app.PromptSession")
+    def test_sync_actions_can_run_in_a_thread(self, MockPromptSession):
+        MockPromptSession.return_value.prompt_async = AsyncMock()
+        app = TyperdanticApp(main_menu=ProgressMenu)
+        app.active_menu.go_down()
+
+        async def select_and_tick():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            ticking = asyncio.ensure_future(ticker())
+            await app.handle_selection(app.active_menu.get_selected_item())
+            ticking.cancel()
+            return ticks
+
+        ticks = asyncio.run(select_and_tick())
+        self.assertIsNot(seen["thread"], threading.main_thread())
+        # The event loop kept running while the action worked.
+        self.assertGreater(ticks, 3)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,148 @@
+# file: tests/test_recording.py
+
+import asyncio
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.models import ArgumentSpec, MenuItem
+from typerdantic.recording import load_session, replay_session
+
+DOWN, UP, ENTER = "\x1b[B", "\x1b[A", "\r"
+
+calls = []
+
+
+def deploy(context: dict, args: dict):
+    calls.append(dict(args))
+
+
+class RecordedMainMenu(TyperdanticMenu):
+    """Recorded Main Menu"""
+
+    open_deploy: MenuItem = Field(
+        default=MenuItem(description="Deploy...", target_menu="deploy")
+    )
+    quit: MenuItem = Field(default=MenuItem(description="Quit", is_quit=True))
+
+
+class RecordedDeployMenu(TyperdanticMenu):
+    """Recorded Deploy Menu"""
+
+    deploy: MenuItem = Field(
+        default=MenuItem(
+            description="Deploy",
+            action=deploy,
+            prompt_args=[ArgumentSpec(name="version", prompt="Version")],
+        )
+    )
+    back: MenuItem = Field(default=MenuItem(description="Back", is_quit=True))
+
+
+def make_app(input=None, output=None) -> TyperdanticApp:
+    app = TyperdanticApp(main_menu=RecordedMainMenu, input=input, output=output)
+    app.register_menu("deploy", RecordedDeployMenu)
+    return app
+
+
+async def record(path: Path, keys, prompt_values):
+    """Drives a headless app through `keys` while recording to `path`."""
+    with create_pipe_input() as pipe_input:
+        with create_app_session(input=pipe_input, output=DummyOutput()):
+            app = make_app(input=pipe_input, output=DummyOutput())
+            answers = list(prompt_values)
+
+            async def fake_prompt(item):
+                return {spec.name: answers.pop(0) for spec in item.prompt_args}
+
+            app._prompt_for_args = fake_prompt
+            run_task = asyncio.ensure_future(app.run(record_path=path))
+            await asyncio.sleep(0.05)
+            for key in keys:
+                pipe_input.send_text(key)
+                await asyncio.sleep(0.02)
+            await asyncio.sleep(0.05)
+            if not run_task.done():
+                app.application.exit()
+            await run_task
+
+
+class TestSessionRecording(unittest.TestCase):
+    def setUp(self):
+        calls.clear()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name) / "session.jsonl"
+        # Open the deploy menu, run Deploy (prompting for a version),
+        # then move the cursor down to "Back".
+        asyncio.run(record(self.path, [ENTER, ENTER, DOWN], ["1.2"]))
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_recording_captures_keys_transitions_and_prompts(self):
+        events = load_session(self.path)
+        types = [event["type"] for event in events]
+
+        self.assertEqual(types[0], "header")
+        self.assertEqual(events[0]["main_menu"], "RecordedMainMenu")
+        self.assertEqual(types.count("key"), 3)
+        self.assertIn(
+            {"type": "navigate", "menu": "deploy"},
+            [{k: v for k, v in e.items() if k != "t"} for e in events],
+        )
+        prompt = next(e for e in events if e["type"] == "prompt")
+        self.assertEqual(prompt["values"], {"version": "1.2"})
+        self.assertEqual(events[-1]["type"], "end")
+        self.assertEqual(events[-1]["nav_stack"], ["main", "deploy"])
+        self.assertEqual(events[-1]["selected_index"], 1)
+        # Timestamps are relative and increasing.
+        stamps = [e["t"] for e in events[1:]]
+        self.assertEqual(stamps, sorted(stamps))
+        self.assertEqual(calls, [{"version": "1.2"}])
+
+    def test_replay_reaches_recorded_state(self):
+        calls.clear()
+        report = asyncio.run(replay_session(make_app, self.path))
+
+        self.assertEqual(len(report.steps), 3)
+        self.assertTrue(report.matches_recording)
+        self.assertEqual(report.final_nav_stack, ["main", "deploy"])
+        # Real actions run with the recorded prompt values.
+        self.assertEqual(calls, [{"version": "1.2"}])
+        self.assertGreaterEqual(report.latency_percentile(0.99), 0.0)
+
+    def test_replay_with_stubbed_actions(self):
+        calls.clear()
+        report = asyncio.run(replay_session(make_app, self.path, stub_actions=True))
+
+        self.assertTrue(report.matches_recording)
+        self.assertEqual(calls, [])
+
+    def test_replay_at_recorded_speed(self):
+        report = asyncio.run(
+            replay_session(make_app, self.path, speed=4.0, stub_actions=True)
+        )
+        recorded_span = json.loads(self.path.read_text().splitlines()[-1])["t"]
+        self.assertTrue(report.matches_recording)
+        self.assertEqual(
+            [step.recorded_at for step in report.steps],
+            sorted(step.recorded_at for step in report.steps),
+        )
+        self.assertLessEqual(report.steps[-1].recorded_at, recorded_span)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
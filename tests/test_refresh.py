@@ -0,0 +1,200 @@
+# file: tests/test_refresh.py
+
+import asyncio
+import sys
+import unittest
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import AsyncMock, patch
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.config_models import MenuConfig
+from typerdantic.loaders import create_menu_from_config
+from typerdantic.models import MenuItem
+
+get_items_calls = {"tasks": 0, "anything": 0}
+
+
+def noop(context: dict, args: dict):
+    pass
+
+
+def item(description: str, **kwargs) -> MenuItem:
+    return MenuItem(description=description, action=noop, **kwargs)
+
+
+class TaskMenu(TyperdanticMenu):
+    """Tasks"""
+
+    depends_on = {"tasks"}
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        get_items_calls["tasks"] += 1
+        return [
+            ("add", item("Add task", invalidates=["tasks"])),
+            ("rename_user", item("Rename user", invalidates=["users"])),
+            ("show", item("Show tasks", invalidates=[])),
+            ("legacy", item("Undeclared action")),
+            ("open", MenuItem(description="Open child", target_menu="child")),
+        ]
+
+
+class ChildMenu(TyperdanticMenu):
+    """Child"""
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        get_items_calls["anything"] += 1
+        return [
+            ("add", item("Add task", invalidates=["tasks"])),
+            ("rename_user", item("Rename user", invalidates=["users"])),
+            ("back", MenuItem(description="Back", is_quit=True)),
+        ]
+
+
+@patch("typerdantic.app.PromptSession")
+class TestDependencyAwareRefresh(unittest.TestCase):
+    def setUp(self):
+        get_items_calls.update(tasks=0, anything=0)
+
+    def make_app(self, MockPromptSession) -> TyperdanticApp:
+        MockPromptSession.return_value.prompt_async = AsyncMock()
+        app = TyperdanticApp(main_menu=TaskMenu)
+        app.register_menu("child", ChildMenu)
+        return app
+
+    def select(self, app: TyperdanticApp, index: int):
+        app.active_menu._selected_index = index
+        asyncio.run(app.handle_selection(app.active_menu.get_selected_item()))
+
+    def test_only_dependent_menus_refresh(self, MockPromptSession):
+        app = self.make_app(MockPromptSession)
+        self.assertEqual(get_items_calls["tasks"], 1)
+
+        self.select(app, 2)  # read-only
+        self.select(app, 1)  # invalidates "users"
+        self.assertEqual(get_items_calls["tasks"], 1)
+
+        self.select(app, 0)  # invalidates "tasks"
+        self.assertEqual(get_items_calls["tasks"], 2)
+
+        # Actions that declare nothing still refresh, as before.
+        self.select(app, 3)
+        self.assertEqual(get_items_calls["tasks"], 3)
+
+    def test_menus_down_the_stack_refresh_on_return(self, MockPromptSession):
+        app = self.make_app(MockPromptSession)
+        self.select(app, 4)
+        self.assertIsInstance(app.active_menu, ChildMenu)
+
+        # The child depends on everything, the parent only on "tasks".
+        self.select(app, 1)
+        self.assertEqual(get_items_calls["anything"], 2)
+        app.go_back()
+        self.assertEqual(get_items_calls["tasks"], 1)
+
+        self.select(app, 4)
+        self.select(app, 0)
+        app.go_back()
+        self.assertEqual(get_items_calls["tasks"], 2)
+
+        # Nothing changed since, so returning again costs nothing.
+        self.select(app, 4)
+        app.go_back()
+        self.assertEqual(get_items_calls["tasks"], 2)
+
+    def test_actions_can_invalidate_explicitly(self, MockPromptSession):
+        app = self.make_app(MockPromptSession)
+        self.assertFalse(app.active_menu.needs_refresh())
+        app.invalidate_data(["users"])
+        self.assertFalse(app.active_menu.needs_refresh())
+        app.invalidate_data(["tasks"])
+        self.assertTrue(app.active_menu.needs_refresh())
+        app.active_menu.refresh_items()
+        app.invalidate_data()
+        self.assertTrue(app.active_menu.needs_refresh())
+
+    def test_config_declares_dependencies(self, MockPromptSession):
+        config = MenuConfig(
+            doc="Config Tasks",
+            depends_on=["tasks"],
+            items={
+                "add": {
+                    "description": "Add",
+                    "action": "internal::noop",
+                    "invalidates": ["tasks"],
+                }
+            },
+        )
+        menu_class = create_menu_from_config("ConfigTasks", config)
+        self.assertEqual(menu_class.depends_on, frozenset({"tasks"}))
+        self.assertEqual(menu_class.model_fields["add"].default.invalidates, ["tasks"])
+
+
+class ListMenu(TyperdanticMenu):
+    """Hosts"""
+
+    names: List[str] = []
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        return [(name, MenuItem(description=name.upper())) for name in self.names]
+
+
+class TestKeyedRefresh(unittest.TestCase):
+    def make_menu(self, names: List[str]) -> ListMenu:
+        app = TyperdanticApp(main_menu=TaskMenu)
+        return ListMenu(app=app, names=names)
+
+    def test_cursor_follows_the_selected_item(self):
+        menu = self.make_menu([f"h{i}" for i in range(30)])
+        for _ in range(15):
+            menu.go_down()
+        self.assertEqual((menu._selected_index, menu._scroll_offset), (15, 6))
+
+        menu.names = ["new1", "new2"] + menu.names
+        changes = menu.refresh_items()
+        self.assertEqual(changes.added, ["new1", "new2"])
+        self.assertEqual(menu.get_selected_item().description, "H15")
+        # The item stays on the same row of the screen.
+        self.assertEqual((menu._selected_index, menu._scroll_offset), (17, 8))
+
+        menu.names = [n for n in menu.names if n not in ("h15", "h16")]
+        changes = menu.refresh_items()
+        self.assertEqual(changes.removed, ["h15", "h16"])
+        self.assertEqual(menu._selected_index, 17)
+        self.assertEqual(menu.get_selected_item().description, "H17")
+
+    def test_only_changed_rows_are_rendered_again(self):
+        menu = self.make_menu(["a", "b", "c"])
+        menu.get_display_fragments()
+        rows = dict(menu._row_cache)
+
+        menu.names = ["a", "b", "c", "d"]
+        changes = menu.refresh_items()
+        self.assertEqual(changes.changed, [])
+        # Equal items keep their instance, so their rendered rows stay valid.
+        for name in "abc":
+            self.assertIs(menu._menu_items["abc".index(name)][1], rows[name][0])
+
+        self.assertEqual(changes.added, ["d"])
+        self.assertEqual(set(menu._row_cache), {"a", "b", "c"})
+
+    def test_changed_items_are_reported(self):
+        menu = self.make_menu(["a", "b"])
+        menu.get_display_fragments()
+        menu.get_items = lambda: [
+            ("a", MenuItem(description="A")),
+            ("b", MenuItem(description="Bee")),
+        ]
+        changes = menu.refresh_items()
+        self.assertEqual(changes.changed, ["b"])
+        self.assertNotIn("b", menu._row_cache)
+        self.assertIn("Bee", "".join(text for _, text in menu.get_display_fragments()))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,188 @@
+# file: tests/test_session.py
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import List, Tuple
+from unittest.mock import AsyncMock, patch
+
+from prompt_toolkit.application import create_app_session
+from prompt_toolkit.input import create_pipe_input
+from prompt_toolkit.output import DummyOutput
+from pydantic import Field
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import TyperdanticMenu
+from typerdantic.models import ArgumentSpec, MenuItem
+from typerdantic.session import SessionStore
+
+built = []
+
+
+def noop(context: dict, args: dict):
+    pass
+
+
+class MainMenu(TyperdanticMenu):
+    """Main"""
+
+    def __init__(self, **data):
+        built.append("main")
+        super().__init__(**data)
+
+    status: MenuItem = Field(default=MenuItem(description="Status", action=noop))
+    hosts: MenuItem = Field(default=MenuItem(description="Hosts", target_menu="hosts"))
+    greet: MenuItem = Field(
+        default=MenuItem(
+            description="Greet",
+            action=noop,
+            prompt_args=[ArgumentSpec(name="name", prompt="Name", default="world")],
+        )
+    )
+
+
+class HostsMenu(TyperdanticMenu):
+    """Hosts"""
+
+    def __init__(self, **data):
+        built.append("hosts")
+        super().__init__(**data)
+
+    def get_items(self) -> List[Tuple[str, MenuItem]]:
+        items = [
+            (f"host{i}", MenuItem(description=f"Host {i}", target_menu="host"))
+            for i in range(40)
+        ]
+        return items + [("back", MenuItem(description="Back", is_quit=True))]
+
+
+class HostMenu(TyperdanticMenu):
+    """Host"""
+
+    def __init__(self, **data):
+        built.append("host")
+        super().__init__(**data)
+
+    restart: MenuItem = Field(default=MenuItem(description="Restart", action=noop))
+    logs: MenuItem = Field(default=MenuItem(description="Logs", action=noop))
+
+
+def make_app(path: Path, **kwargs) -> TyperdanticApp:
+    app = TyperdanticApp(main_menu=MainMenu, session=SessionStore(path), **kwargs)
+    app.register_menu("hosts", HostsMenu)
+    app.register_menu("host", HostMenu)
+    return app
+
+
+def stack_names(app: TyperdanticApp) -> List[str]:
+    return [state.name for state in app.session.capture(app).stack]
+
+
+class TestSession(unittest.TestCase):
+    def setUp(self):
+        built.clear()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "session.json"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_resume_builds_only_the_top_menu(self):
+        app = make_app(self.path)
+        app.active_menu.select_item("hosts")
+        app.navigate_to("hosts")
+        app.active_menu.set_filter("3")
+        app.active_menu.select_item("host23")
+        app.navigate_to("host")
+        app.active_menu.select_item("logs")
+        self.assertTrue(app.save_session())
+        self.assertFalse(app.save_session())
+
+        built.clear()
+        started = time.perf_counter()
+        resumed = make_app(self.path)
+        self.assertTrue(resumed.restore_session())
+        self.assertLess(time.perf_counter() - started, 0.5)
+
+        self.assertEqual(built, ["main", "host"])
+        self.assertEqual(stack_names(resumed), ["main", "hosts", "host"])
+        self.assertEqual(resumed.active_menu.get_selected_item().description, "Logs")
+
+        resumed.go_back()
+        self.assertEqual(built, ["main", "host", "hosts"])
+        hosts = resumed.active_menu
+        self.assertEqual(hosts.filter_query, "3")
+        self.assertEqual(hosts.get_selected_item().description, "Host 23")
+        resumed.go_back()
+        self.assertEqual(resumed.active_menu.get_selected_item().description, "Hosts")
+
+    def test_unusable_sessions_start_fresh(self):
+        self.path.write_text("{not json")
+        app = make_app(self.path)
+        self.assertFalse(app.restore_session())
+        self.assertEqual(stack_names(app), ["main"])
+
+        self.path.write_text(json.dumps({"format": 1, "main": "OtherMenu"}))
+        self.assertFalse(make_app(self.path).restore_session())
+
+        # Menus that are no longer registered end the restored stack.
+        self.path.write_text(
+            json.dumps(
+                {
+                    "main": "MainMenu",
+                    "stack": [{"name": "main"}, {"name": "gone"}, {"name": "host"}],
+                }
+            )
+        )
+        app = make_app(self.path)
+        self.assertTrue(app.restore_session())
+        self.assertEqual(stack_names(app), ["main"])
+
+    @patch("typerdantic.app.PromptSession")
+    def test_prompt_values_become_the_next_defaults(self, MockPromptSession):
+        prompt_async = MockPromptSession.return_value.prompt_async = AsyncMock(
+            return_value="Ada"
+        )
+        app = make_app(self.path)
+        greet = app.active_menu.greet
+        asyncio.run(app.handle_selection(greet))
+        self.assertEqual(prompt_async.await_args.kwargs["default"], "world")
+        app.save_session()
+
+        resumed = make_app(self.path)
+        resumed.restore_session()
+        asyncio.run(resumed.handle_selection(greet))
+        self.assertEqual(prompt_async.await_args.kwargs["default"], "Ada")
+
+    def test_running_app_saves_periodically(self):
+        async def drive():
+            with create_pipe_input() as pipe_input:
+                with create_app_session(input=pipe_input, output=DummyOutput()):
+                    app = make_app(self.path, input=pipe_input, output=DummyOutput())
+                    app.session.save_interval = 0.05
+                    task = asyncio.ensure_future(app.run())
+                    await asyncio.sleep(0.1)
+                    pipe_input.send_text("\x1b[B\r")  # Down, Enter: open Hosts
+                    await asyncio.sleep(0.3)
+                    saved = json.loads(self.path.read_text())
+                    pipe_input.send_text("qq")
+                    await asyncio.wait_for(task, 5)
+                    return saved
+
+        saved = asyncio.run(drive())
+        self.assertEqual([level["name"] for level in saved["stack"]], ["main", "hosts"])
+        # On exit, the final state is saved.
+        final = json.loads(self.path.read_text())
+        self.assertEqual([level["name"] for level in final["stack"]], ["main"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,262 @@
+# file: tests/test_sql.py
+
+import asyncio
+import io
+import sqlite3
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import PropertyMock, patch
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.config_models import MenuConfig
+from typerdantic.loaders import create_menu_from_config
+from typerdantic.sql import SqlResultsMenu, close_pools, get_pool, run_query
+
+
+class TestSql(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.database = str(Path(self.tmp.name) / "inventory.db")
+        with sqlite3.connect(self.database) as connection:
+            connection.execute("CREATE TABLE hosts (name TEXT, role TEXT)")
+            connection.executemany(
+                "INSERT INTO hosts VALUES (?, ?)",
+                [(f"host-{i:03}", "db" if i % 2 else "web") for i in range(120)],
+            )
+
+    def tearDown(self):
+        close_pools()
+        self.tmp.cleanup()
+
+    def menu_class(self, query: str, **action):
+        config = MenuConfig(
+            items={
+                "find": {
+                    "description": "Find hosts",
+                    "action": {
+                        "type": "sql",
+                        "value": query,
+                        "database": self.database,
+                        **action,
+                    },
+                }
+            }
+        )
+        return create_menu_from_config("InventoryMenu", config)
+
+    def test_connections_are_reused(self):
+        async def query_twice():
+            pool = get_pool(self.database)
+            first = await run_query(self.database, "SELECT count(*) FROM hosts")
+            connection = first._connection
+            self.assertEqual(await first.fetch(10), [(120,)])
+            second = await run_query(self.database, "SELECT 1")
+            reused = second._connection is connection
+            second.close()
+            return pool, reused
+
+        pool, reused = asyncio.run(query_twice())
+        self.assertTrue(reused)
+        self.assertIs(get_pool(self.database), pool)
+        self.assertEqual(pool._idle.qsize(), 1)
+
+    def test_arguments_are_bound_as_parameters(self):
+        Menu = self.menu_class(
+            "SELECT name FROM hosts WHERE role = :role AND name < :below",
+            args={"role": "db"},
+        )
+        app = TyperdanticApp(main_menu=Menu)
+        item = app.active_menu.get_selected_item()
+        # Quotes in a value can't change the statement.
+        item.args["below"] = "host-006' OR '1'='1"
+        self.assertFalse(item.pause)
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            asyncio.run(app.handle_selection(item))
+        self.assertIn("name\nhost-001\nhost-003\nhost-005\n(3 rows)", output.getvalue())
+
+        output = io.StringIO()
+        item.args["below"] = "host-003"
+        with redirect_stdout(output):
+            asyncio.run(app.handle_selection(item))
+        self.assertIn("host-001\n(1 rows)", output.getvalue())
+
+    def test_results_are_paged_in_a_menu(self):
+        Menu = self.menu_class(
+            "SELECT name, role FROM hosts ORDER BY name", page_size=50
+        )
+
+        async def browse():
+            app = TyperdanticApp(main_menu=Menu)
+            with patch.object(
+                TyperdanticApp, "is_running", new_callable=PropertyMock
+            ) as is_running:
+                is_running.return_value = True
+                await app.handle_selection(app.active_menu.get_selected_item())
+            menu = app.active_menu
+            pages = [len(menu._menu_items)]
+            more = dict(menu._menu_items)["more"]
+            await app.handle_selection(more)
+            pages.append(len(menu._menu_items))
+            header = menu.get_display_fragments()[:2]
+            app.go_back()
+            return app, menu, pages, header
+
+        with redirect_stdout(io.StringIO()):
+            app, menu, pages, header = asyncio.run(browse())
+        self.assertIsInstance(menu, SqlResultsMenu)
+        # 50 rows, "more" and "back"; then 100 rows, "more" and "back".
+        self.assertEqual(pages, [52, 102])
+        self.assertEqual(header[0][1], "--- SELECT: 100+ rows ---\n")
+        self.assertEqual(header[1][1], "  name | role\n")
+        self.assertEqual(dict(menu._menu_items)["row_0"].description, "host-000 | web")
+        # Leaving the menu gave the connection back to the pool.
+        self.assertIsNot(app.active_menu, menu)
+        self.assertIsNone(menu._result._connection)
+        self.assertEqual(get_pool(self.database)._idle.qsize(), 1)
+
+    def test_errors_are_shown_in_the_results_menu(self):
+        config = MenuConfig(
+            items={
+                "typo": {
+                    "description": "Typo",
+                    "action": {
+                        "type": "sql",
+                        "value": "SELECT * FROM hots",
+                        "database": self.database,
+                    },
+                },
+                "no_database": {"description": "Nowhere", "action": "sql::SELECT 1"},
+            }
+        )
+        Menu = create_menu_from_config("InventoryMenu", config)
+
+        async def select_all():
+            app = TyperdanticApp(main_menu=Menu)
+            titles = []
+            with patch.object(
+                TyperdanticApp, "is_running", new_callable=PropertyMock
+            ) as is_running:
+                is_running.return_value = True
+                for _, item in list(app.active_menu._menu_items):
+                    # Both forms of the action skip the pause.
+                    self.assertFalse(item.pause)
+                    await app.handle_selection(item)
+                    titles.append(app.active_menu.get_display_fragments()[0][1])
+                    app.go_back()
+            return titles
+
+        with redirect_stdout(io.StringIO()):
+            titles = asyncio.run(select_all())
+        self.assertEqual(
+            titles,
+            [
+                "--- Error: Query failed: no such table: hots ---\n",
+                "--- Error: An 'sql' action needs a 'database'. ---\n",
+            ],
+        )
+        self.assertEqual(get_pool(self.database)._idle.qsize(), 1)
+
+    def test_watched_queries_print_their_rows(self):
+        Menu = self.menu_class(
+            "SELECT count(*) AS hosts FROM hosts",
+            page_size=1,
+            watch={"interval": 0.05},
+        )
+
+        async def watch():
+            app = TyperdanticApp(main_menu=Menu)
+            with patch.object(
+                TyperdanticApp, "is_running", new_callable=PropertyMock
+            ) as is_running:
+                is_running.return_value = True
+                await app.handle_selection(app.active_menu.get_selected_item())
+                await asyncio.sleep(0.3)
+                menu = app.active_menu
+                stack = list(app.nav_stack)
+                app.go_back()
+            return menu, stack
+
+        menu, stack = asyncio.run(watch())
+        # The runs are shown in the watch pane rather than in results menus.
+        self.assertEqual(len(stack), 2)
+        self.assertGreater(menu.watcher.runs, 2)
+        self.assertIn("hosts\n120\n(1 rows)", "\n".join(menu.watcher.output.lines))
+        self.assertEqual(get_pool(self.database)._idle.qsize(), 1)
+
+    def test_statements_without_rows_are_committed(self):
+        Menu = self.menu_class(
+            "UPDATE hosts SET role = :role WHERE name = :name",
+            args={"role": "cache", "name": "host-007"},
+        )
+        app = TyperdanticApp(main_menu=Menu)
+        output = io.StringIO()
+        with redirect_stdout(output):
+            asyncio.run(app.handle_selection(app.active_menu.get_selected_item()))
+        self.assertIn("1 rows changed", output.getvalue())
+        with sqlite3.connect(self.database) as connection:
+            role = connection.execute(
+                "SELECT role FROM hosts WHERE name = 'host-007'"
+            ).fetchone()
+        self.assertEqual(role, ("cache",))
+
+    def test_writes_returning_rows_are_committed(self):
+        Menu = self.menu_class(
+            "INSERT INTO hosts VALUES (:name, 'web') RETURNING rowid, name",
+            args={"name": "host-new"},
+            page_size=1,
+        )
+
+        async def browse():
+            app = TyperdanticApp(main_menu=Menu)
+            with patch.object(
+                TyperdanticApp, "is_running", new_callable=PropertyMock
+            ) as is_running:
+                is_running.return_value = True
+                await app.handle_selection(app.active_menu.get_selected_item())
+            menu = app.active_menu
+            # While the result is still open, other connections can write.
+            with sqlite3.connect(self.database, timeout=0) as other:
+                other.execute("UPDATE hosts SET role = 'db' WHERE name = 'host-000'")
+            app.go_back()
+            return menu
+
+        with redirect_stdout(io.StringIO()):
+            menu = asyncio.run(browse())
+        self.assertEqual(dict(menu._menu_items)["row_0"].description, "121 | host-new")
+        close_pools()
+        with sqlite3.connect(self.database) as connection:
+            count = connection.execute(
+                "SELECT count(*) FROM hosts WHERE name = 'host-new'"
+            ).fetchone()
+        self.assertEqual(count, (1,))
+
+    def test_failed_rollback_frees_the_slot(self):
+        class Broken:
+            def cursor(self):
+                raise RuntimeError("gone")
+
+            def rollback(self):
+                raise RuntimeError("still gone")
+
+            def close(self):
+                pass
+
+        pool = get_pool(self.database)
+        pool._connect = lambda database: Broken()
+        for _ in range(pool.max_size + 1):
+            with self.assertRaises(RuntimeError):
+                asyncio.run(run_query(self.database, "SELECT 1"))
+        self.assertEqual(pool._idle.qsize(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
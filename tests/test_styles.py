@@ -1,10 +1,12 @@
 # file: tests/test_styles.py
 
 from typerdantic.styles import load_style_from_file, DEFAULT_STYLE_DICT
+import os
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 # Add the src directory to the Python path
 project_root = Path(__file__).parent.parent
@@ -85,6 +87,113 @@ new_class = "italic"        # Add a new style class
             tmp_path.unlink()
 
 
+class TestThemeManager(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name: str, rules: str, mtime: int = 1_700_000_000) -> Path:
+        path = self.dir / name
+        path.write_text(f"[style]\n{rules}\n")
+        os.utime(path, ns=(mtime * 10**9, mtime * 10**9))
+        return path
+
+    def test_layers_merge_in_order_and_compile_once(self):
+        from typerdantic.styles import ThemeManager
+
+        site = self.write("site.toml", 'title = "bold"\nselected = "bg:#111111"')
+        dark = self.write("dark.toml", 'selected = "bg:#000000"\nmenu-item = "#aaaaaa"')
+        user = self.write("user.toml", 'menu-item = "#ffffff"')
+        theme = ThemeManager(site=site, user=user, themes={"dark": dark})
+        rules = dict(theme.style.style_rules)
+        self.assertEqual(rules["title"], "bold")
+        self.assertEqual(rules["selected"], "bg:#111111")
+        self.assertEqual(rules["menu-item"], "#ffffff")
+        self.assertEqual(rules["palette"], DEFAULT_STYLE_DICT["palette"])
+        plain = theme.style
+
+        theme.switch("dark")
+        rules = dict(theme.style.style_rules)
+        self.assertEqual(rules["selected"], "bg:#000000")
+        # The user layer still wins over the theme.
+        self.assertEqual(rules["menu-item"], "#ffffff")
+
+        # Unchanged files are neither parsed nor compiled again.
+        with patch("typerdantic.styles.tomllib.load") as load, patch(
+            "typerdantic.styles.Style.from_dict"
+        ) as from_dict:
+            self.assertIs(theme.switch(None), plain)
+            self.assertIs(ThemeManager(site=site, user=user).style, plain)
+            self.assertFalse(theme.reload())
+        load.assert_not_called()
+        from_dict.assert_not_called()
+
+        with self.assertRaises(KeyError):
+            theme.switch("missing")
+
+    def test_reload_picks_up_edited_files(self):
+        from typerdantic.styles import ThemeManager
+
+        user = self.write("user.toml", 'title = "italic"')
+        theme = ThemeManager(user=user)
+        self.write("user.toml", 'title = "underline"', mtime=1_700_000_100)
+        self.assertEqual(dict(theme.style.style_rules)["title"], "italic")
+        self.assertTrue(theme.reload())
+        self.assertEqual(dict(theme.style.style_rules)["title"], "underline")
+
+    def test_app_switches_theme_and_styles_item_classes(self):
+        from prompt_toolkit.output import DummyOutput
+        from pydantic import Field
+
+        from typerdantic.app import TyperdanticApp
+        from typerdantic.base import TyperdanticMenu
+        from typerdantic.models import MenuItem
+        from typerdantic.styles import ThemeManager
+
+        class OpsMenu(TyperdanticMenu):
+            """Ops"""
+
+            style_class = "ops"
+
+            status: MenuItem = Field(default=MenuItem(description="Status"))
+            wipe: MenuItem = Field(default=MenuItem(description="Wipe", style="danger"))
+
+        light = self.write("light.toml", 'danger = "#aa0000"')
+        dark = self.write("dark.toml", 'danger = "#ff5555"')
+        theme = ThemeManager(themes={"light": light, "dark": dark}, theme="light")
+        app = TyperdanticApp(main_menu=OpsMenu, style=theme, output=DummyOutput())
+        application = app.application
+
+        fragments = app.active_menu.get_display_fragments()
+        self.assertEqual(fragments[0][0], "class:title class:ops")
+        self.assertEqual(fragments[1][0], "class:ops class:selected")
+        self.assertEqual(fragments[2][0], "class:menu-item class:ops class:danger")
+
+        def danger_color():
+            attrs = application.style.get_attrs_for_style_str(fragments[2][0])
+            return attrs.color
+
+        self.assertEqual(danger_color(), "aa0000")
+        app.switch_theme("dark")
+        # The same Application now renders with the new theme.
+        self.assertEqual(danger_color(), "ff5555")
+
+    def test_configured_menus_carry_style_classes(self):
+        from typerdantic.config_models import MenuConfig
+        from typerdantic.loaders import create_menu_from_config
+
+        config = MenuConfig(
+            style="ops",
+            items={"wipe": {"description": "Wipe", "style": "danger"}},
+        )
+        Menu = create_menu_from_config("OpsMenu", config)
+        self.assertEqual(Menu.style_class, "ops")
+        self.assertEqual(Menu.model_fields["wipe"].default.style, "danger")
+
+
 if __name__ == "__main__":
     print("--- Testing Typerdantic Style System ---")
     unittest.main(verbosity=0)
@@ -0,0 +1,165 @@
+# file: tests/test_templates.py
+
+import asyncio
+import io
+import sys
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.base import format_menu_ref, parse_menu_ref
+from typerdantic.config_models import MenuConfig
+from typerdantic.loaders import create_menu_from_config
+from typerdantic.session import SessionStore
+
+
+def service_app() -> TyperdanticApp:
+    Main = create_menu_from_config(
+        "MainMenu",
+        MenuConfig(
+            items={
+                "prod_api": {
+                    "description": "API (prod)",
+                    "target_menu": "service_menu(env=prod, svc=api)",
+                },
+                "dev_web": {
+                    "description": "Web (dev)",
+                    "target_menu": "service_menu(env=dev, svc=web)",
+                },
+            }
+        ),
+    )
+    Service = create_menu_from_config(
+        "ServiceMenu",
+        MenuConfig(
+            doc="Service {svc} in {env}",
+            params=["env", "svc"],
+            items={
+                "restart": {
+                    "description": "Restart {svc}",
+                    "action": {
+                        "type": "command",
+                        "value": "printf '%s %s' {env} {unit}",
+                        "args": {"unit": "{svc}.service"},
+                    },
+                },
+                "logs": {
+                    "description": "Logs",
+                    "target_menu": "logs",
+                },
+                "back": {"description": "Back", "is_quit": True},
+            },
+        ),
+    )
+    Logs = create_menu_from_config(
+        "LogsMenu", MenuConfig(items={"tail": {"description": "Tail"}})
+    )
+    app = TyperdanticApp(main_menu=Main)
+    app.register_menu("service_menu", Service)
+    app.register_menu("logs", Logs)
+    return app
+
+
+class TestTemplates(unittest.TestCase):
+    def test_menu_references(self):
+        self.assertEqual(parse_menu_ref("settings"), ("settings", {}))
+        self.assertEqual(
+            parse_menu_ref(" service_menu( env=prod ,svc=api ) "),
+            ("service_menu", {"env": "prod", "svc": "api"}),
+        )
+        self.assertEqual(
+            format_menu_ref("service_menu", {"env": "prod", "svc": "api"}),
+            "service_menu(env=prod, svc=api)",
+        )
+        for bad in ("(env=prod)", "service_menu(prod)", "service_menu(=prod)"):
+            with self.assertRaises(ValueError):
+                parse_menu_ref(bad)
+
+    @patch("typerdantic.app.PromptSession")
+    def test_instances_share_the_template(self, MockPromptSession):
+        MockPromptSession.return_value.prompt_async = AsyncMock()
+        app = service_app()
+        Service = app.menu_registry["service_menu"]
+
+        app.navigate_to("service_menu(env=prod, svc=api)")
+        prod = app.active_menu
+        app.go_back()
+        app.navigate_to("service_menu(env=dev, svc=web)")
+        dev = app.active_menu
+
+        self.assertIs(type(prod), Service)
+        self.assertIs(type(dev), Service)
+        self.assertEqual(prod.params, {"env": "prod", "svc": "api"})
+        self.assertEqual(app.menu_name_of(dev), "service_menu(env=dev, svc=web)")
+        self.assertEqual(
+            prod.get_display_fragments()[0][1], "--- Service api in prod ---\n"
+        )
+        prod_restart = dict(prod._menu_items)["restart"]
+        dev_restart = dict(dev._menu_items)["restart"]
+        self.assertEqual(prod_restart.description, "Restart api")
+        self.assertEqual(dev_restart.description, "Restart web")
+        # The compiled action is the template's, bound only by its arguments.
+        self.assertIs(
+            prod_restart.action, Service.model_fields["restart"].default.action
+        )
+        self.assertIs(prod_restart.action, dev_restart.action)
+        self.assertEqual(
+            prod_restart.args, {"env": "prod", "svc": "api", "unit": "api.service"}
+        )
+
+        output = io.StringIO()
+        with redirect_stdout(output):
+            asyncio.run(app.handle_selection(dev_restart))
+        self.assertIn("Output:\ndev web.service", output.getvalue())
+
+        with self.assertRaises(ValueError):
+            app.build_menu("service_menu(env=prod)")
+        with self.assertRaises(ValueError):
+            app.build_menu("logs(env=prod)")
+        # Navigating to a reference that doesn't fit is ignored.
+        for ref in ("service_menu(env=prod)", "service_menu", "logs(env=prod)"):
+            self.assertFalse(app.has_menu(ref))
+            app.navigate_to(ref)
+            self.assertIs(app.active_menu, dev)
+
+    def test_sessions_skip_stale_template_references(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SessionStore(Path(tmp) / "session.json")
+            app = service_app()
+            app.navigate_to("service_menu(env=prod, svc=api)")
+            app.navigate_to("logs")
+            store.save(store.capture(app))
+
+            # The template has gained a parameter since the session was saved.
+            app = service_app()
+            app.menu_registry["service_menu"].template_params = ("env", "svc", "region")
+            self.assertTrue(store.restore(app, store.load()))
+            self.assertEqual(
+                [app.menu_name_of(menu) for menu in app.nav_stack], ["main"]
+            )
+
+    def test_paths_keep_template_parameters(self):
+        app = service_app()
+        self.assertEqual(
+            app.command_index.path_to("logs"),
+            ("main", "service_menu(env=prod, svc=api)", "logs"),
+        )
+        # A template's unbound items are not searchable.
+        self.assertEqual(
+            [entry.menu_name for entry in app.command_index.search("restart")], []
+        )
+
+        app.jump_to("logs", "tail")
+        names = [app.menu_name_of(menu) for menu in app.nav_stack]
+        self.assertEqual(names, ["main", "service_menu(env=prod, svc=api)", "logs"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,128 @@
+# file: tests/test_watch.py
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the src directory to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root / "src"))
+
+from typerdantic.app import TyperdanticApp
+from typerdantic.config_models import MenuConfig
+from typerdantic.loaders import create_menu_from_config
+from typerdantic.models import WatchSpec
+from typerdantic.watch import WatchMenu, WatchOutput, Watcher
+
+
+class TestWatch(unittest.TestCase):
+    def test_output_keeps_unchanged_lines(self):
+        output = WatchOutput(max_lines=4)
+        self.assertEqual(output.update("a\nb\nc\n"), {0, 1, 2})
+        first = output.lines[0]
+        self.assertEqual(output.update("a\nB\nc\nd\ne\n"), {0, 2, 3})
+        self.assertEqual(output.lines, ["B", "c", "d", "e"])
+        self.assertEqual(output.changed, {0, 2, 3})
+        self.assertNotIn(first, output.lines)
+        self.assertEqual(
+            output.fragments()[:2],
+            [("class:watch.changed", "B\n"), ("class:watch", "c\n")],
+        )
+
+    def test_slow_runs_are_not_overlapped(self):
+        active = []
+        peak = []
+
+        async def slow():
+            active.append(1)
+            peak.append(len(active))
+            await asyncio.sleep(0.25)
+            active.pop()
+            return 0, "done"
+
+        async def watch():
+            watcher = Watcher(slow, WatchSpec(interval=0.05))
+            watcher.start()
+            await asyncio.sleep(0.6)
+            watcher.stop()
+            return watcher
+
+        watcher = asyncio.run(watch())
+        self.assertEqual(max(peak), 1)
+        self.assertIn(watcher.runs, (2, 3))
+        self.assertGreater(watcher.skipped, 4)
+        self.assertEqual(watcher.output.lines, ["done"])
+
+    def test_file_changes_trigger_runs(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "queue.txt"
+            path.write_text("1")
+
+            async def read():
+                return None, path.read_text()
+
+            async def watch():
+                watcher = Watcher(
+                    read,
+                    WatchSpec(interval=None, paths=[str(path)]),
+                    poll_interval=0.02,
+                )
+                watcher.start()
+                await asyncio.sleep(0.1)
+                runs = watcher.runs
+                path.write_text("1\n2")
+                os.utime(path, ns=(10**18, 10**18))
+                await asyncio.sleep(0.1)
+                watcher.stop()
+                return runs, watcher
+
+            runs, watcher = asyncio.run(watch())
+        self.assertEqual(runs, 1)
+        self.assertEqual(watcher.runs, 2)
+        self.assertEqual(watcher.output.lines, ["1", "2"])
+        self.assertEqual(watcher.output.changed, {1})
+
+    def test_configured_command_watch_runs_in_a_menu(self):
+        config = MenuConfig(
+            items={
+                "queue": {
+                    "description": "Queue depth",
+                    "action": {
+                        "type": "command",
+                        "value": "printf '{queue}: 3\\n'",
+                        "args": {"queue": "jobs"},
+                        "watch": {"interval": 0.05},
+                    },
+                }
+            }
+        )
+        Menu = create_menu_from_config("OpsMenu", config)
+
+        async def run():
+            app = TyperdanticApp(main_menu=Menu)
+            item = app.active_menu.get_selected_item()
+            self.assertFalse(app.active_menu.is_markable(item))
+            await app.handle_selection(item)
+            menu = app.active_menu
+            await asyncio.sleep(0.2)
+            runs = menu.watcher.runs
+            app.go_back()
+            await asyncio.sleep(0.1)
+            return menu, runs
+
+        menu, runs = asyncio.run(run())
+        self.assertIsInstance(menu, WatchMenu)
+        self.assertGreaterEqual(runs, 2)
+        # Command output is shown as is, without the executor's decoration.
+        self.assertEqual(menu.watcher.output.lines, ["jobs: 3"])
+        self.assertIn("Queue depth | every 0.05s | run", menu.status())
+        # Leaving the menu stopped the watch.
+        self.assertEqual(menu.watcher.runs, runs)
+        self.assertFalse(menu.watcher.running)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)